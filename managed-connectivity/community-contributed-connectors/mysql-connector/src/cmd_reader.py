@@ -16,10 +16,13 @@ import argparse
 import sys
 from src.common.util import loadReferencedFile
 from src.common.argument_validator import validateArguments
+from src.common.argument_validator import addPipelineArguments
+from src.common.argument_validator import addJdbcArguments
+from src.common.argument_validator import validateJdbcArguments
 from src.common.argument_validator import true_or_false
 
-def read_args():
-    """Reads arguments from the command line."""
+def read_args(argv: list = None):
+    """Reads arguments from the command line, or from argv if given."""
     parser = argparse.ArgumentParser()
 
     # Project arguments for basic generation of metadata entries
@@ -57,9 +60,16 @@ def read_args():
     parser.add_argument("--min_expected_entries", type=int, required=False,default=-1,
                         help="Minimum number of entries expected in metadata file, if less entries then file gets deleted. Safety mechanism for when using Full Entry Sync metadata jobs")
     
-    parsed_args = parser.parse_known_args()[0]
+    # Common pipeline arguments shared by all connectors
+    addPipelineArguments(parser)
+
+    # Tuning of metadata reads through the JDBC driver
+    addJdbcArguments(parser)
+
+    parsed_args = parser.parse_known_args(argv)[0]
 
     # Apply common argument validation checks first
     parsed_args = validateArguments(parsed_args)
+    parsed_args = validateJdbcArguments(parsed_args)
 
     return vars(parsed_args)
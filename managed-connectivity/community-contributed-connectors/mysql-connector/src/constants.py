@@ -21,10 +21,25 @@ SOURCE_TYPE = "mysql"
 # Default JDBC jar file. Can override with --jar
 JDBC_JAR = "mysql-connector-j-9.2.0.jar"
 
+# Default Spark JDBC read options. Can override with --fetch_size, --query_timeout, --session_init_statement and --push_down_predicate
+JDBC_READ_OPTIONS = {
+    # The driver only honours a fetch size with server side cursors, otherwise it reads the whole result into memory
+    "fetchsize": "10000",
+    "useCursorFetch": "true",
+}
+
 # allow common bootstrap to load connector for specific datasource
 CONNECTOR_MODULE = "src.mysql_connector"
 CONNECTOR_CLASS = "MysqlConnector"
 
+# Connector using a native Python driver instead of Spark, selected with --engine python
+PYTHON_CONNECTOR_MODULE = "src.mysql_python_connector"
+PYTHON_CONNECTOR_CLASS = "MysqlPythonConnector"
+
+# SQLite stand-in for the dictionary views read by the connector, run with python -m src.common.stand_in
+STAND_IN_MODULE = "src.mysql_stand_in"
+STAND_IN_CLASS = "MysqlStandInConnector"
+
 # Value to test for if column is nullable. SQL Server specific. Matches _get_dataset  
 IS_NULLABLE_TRUE = "YES"
 
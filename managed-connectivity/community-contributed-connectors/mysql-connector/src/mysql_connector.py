@@ -14,14 +14,19 @@
 
 """Reads MySQL using PySpark."""
 from typing import Dict
-from pyspark.sql import SparkSession, DataFrame
+from pyspark.sql import DataFrame
 from src.common.ExternalSourceConnector import IExternalSourceConnector
+from src.common.query_ledger import LEDGER
 from src.constants import EntryType
 from src.common.connection_jar import getJarPath
+from src.common.spark_session import get_spark_session
 from src.common.util import fileExists
 from src.constants import JDBC_JAR
+from src.constants import JDBC_READ_OPTIONS
+from src.common.jdbc_options import get_read_options
+from src.mysql_queries import MysqlQueries
 
-class MysqlConnector(IExternalSourceConnector):
+class MysqlConnector(MysqlQueries, IExternalSourceConnector):
     """Reads data from MySQL and returns Spark Dataframes."""
 
     def __init__(self, config: Dict[str, str]):
@@ -32,10 +37,7 @@ class MysqlConnector(IExternalSourceConnector):
         # Check jdbc jar file exist. Throws exception if not found
         jarsExist = fileExists(jar_path)
 
-        self._spark = SparkSession.builder.appName("MySQLIngestor") \
-            .config("spark.jars", jar_path) \
-            .config("spark.log.level", "ERROR") \
-            .getOrCreate()
+        self._spark = get_spark_session("MySQLIngestor", jar_path, config)
 
         self._config = config
         self._url = f"jdbc:mysql://{config['host']}:{config['port']}/{config['database']}?zeroDateTimeBehavior=CONVERT_TO_NULL&allowPublicKeyRetrieval=true"
@@ -48,34 +50,32 @@ class MysqlConnector(IExternalSourceConnector):
             "ssl": config['use_ssl'],
             "sslmode": config['ssl_mode'],
             }
+        self._connectOptions.update(get_read_options(config, JDBC_READ_OPTIONS))
 
     def _execute(self, query: str) -> DataFrame:
-        """A generic method to execute any query."""
-        return self._spark.read.format("jdbc") \
+        """A generic method to execute any query. The result is read once and persisted, see QueryLedger.materialize"""
+        df = self._spark.read.format("jdbc") \
             .options(**self._connectOptions) \
             .option("query", query) \
             .load()
+        return LEDGER.materialize(query, df)
 
     def get_db_schemas(self) -> DataFrame:
-        query = f"SELECT SCHEMA_NAME FROM INFORMATION_SCHEMA.SCHEMATA where SCHEMA_NAME = '{self._config['database']}'"
-        return self._execute(query)
-
-    def _get_columns(self, schema_name: str, object_type: str) -> str:
-        """Gets a list of columns in tables or views in a batch."""
-        # Every line here is a column that belongs to the table or to the view.
-        # This SQL gets data from ALL the tables in a given schema.
-        return(f"select tab.table_name,col.column_name,col.data_type,col.is_nullable "
-                f"from information_schema.tables as tab "
-                f"inner join information_schema.columns as col "
-                f"on col.table_schema = tab.table_schema "
-                f"and col.table_name = tab.table_name "
-                f"where tab.table_type = '{object_type}' "
-                f"and tab.table_schema = '{self._config['database']}' "
-                f"order by tab.table_name,col.column_name") 
+        return self._execute(self._get_schemas_query())
 
     def get_dataset(self, schema_name: str, entry_type: EntryType):
         """Gets data for a table or a view."""
         # Dataset means that these entities can contain end user data.
-        short_type =  'BASE TABLE' if entry_type.name == 'TABLE' else 'VIEW' # table or view, or the title of enum value
-        query = self._get_columns(schema_name, short_type)
-        return self._execute(query)
+        return self._execute(self._get_dataset_query(schema_name, entry_type))
+
+    def get_schema_datasets(self, schema_name: str) -> DataFrame:
+        """Gets data for both tables and views in a schema with a single query."""
+        return self._execute(self._get_schema_dataset_query(schema_name))
+
+    def get_all_datasets(self) -> DataFrame:
+        """Gets data for all tables and views in the database with a single query."""
+        return self._execute(self._get_all_columns())
+
+    def get_schema_last_modified(self) -> DataFrame:
+        """Gets latest create/update time and number of tables and views in the database."""
+        return self._execute(self._get_schema_last_modified_query())
@@ -0,0 +1,42 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Reads MySQL using the PyMySQL driver, without Spark."""
+import ssl
+from typing import Dict
+import pymysql
+from src.common.dbapi_connector import DbApiConnector
+from src.mysql_queries import MysqlQueries
+
+def _ssl_context(ssl_mode: str) -> ssl.SSLContext:
+    """TLS context for the --ssl_mode. Server certificate is only verified for verify-ca and verify-full"""
+    context = ssl.create_default_context()
+    if ssl_mode != 'verify-full':
+        context.check_hostname = False
+    if ssl_mode not in ['verify-ca', 'verify-full']:
+        context.verify_mode = ssl.CERT_NONE
+    return context
+
+class MysqlPythonConnector(MysqlQueries, DbApiConnector):
+    """Reads data from MySQL and returns row iterators."""
+
+    def __init__(self, config: Dict[str, str]):
+        connection = pymysql.connect(
+            host=config['host'],
+            port=int(config['port']),
+            database=config['database'],
+            user=config['user'],
+            password=config['password'],
+            ssl=_ssl_context(config['ssl_mode']) if config['use_ssl'] else None)
+        super().__init__(config, connection)
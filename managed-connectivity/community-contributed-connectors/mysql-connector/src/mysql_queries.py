@@ -0,0 +1,102 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Metadata queries for MySQL, shared by the Spark and Python connectors."""
+from typing import Dict
+from src.constants import EntryType
+from src.common.entry_constants import COLUMN_SCHEMA_NAME
+from src.common.entry_constants import COLUMN_OBJECT_TYPE
+from src.common.entry_constants import COLUMN_LAST_MODIFIED
+from src.common.entry_constants import COLUMN_OBJECT_COUNT
+from src.common.name_filter import SqlDialect
+from src.common.name_filter import schema_predicate
+from src.common.name_filter import table_predicate
+
+# Name filters are matched with LIKE, or REGEXP for regular expressions. Backslashes escape in MySQL string literals
+NAME_DIALECT = SqlDialect(regex_match="{column} REGEXP {pattern}", backslash_escapes=True)
+
+class MysqlQueries:
+    """Builds the SQL used to read metadata from MySQL."""
+
+    _config: Dict[str, str]
+
+    def _get_schemas_query(self) -> str:
+        """Query for the database, which is the only schema extracted, unless excluded by --include_schemas or --exclude_schemas."""
+        return (f"SELECT SCHEMA_NAME FROM INFORMATION_SCHEMA.SCHEMATA where SCHEMA_NAME = '{self._config['database']}'"
+                f"{schema_predicate(self._config, 'SCHEMA_NAME', NAME_DIALECT)}")
+
+    def _get_columns(self, schema_name: str, object_type: str) -> str:
+        """Gets a list of columns in tables or views in a batch, filtered by --include_tables and --exclude_tables."""
+        # Every line here is a column that belongs to the table or to the view.
+        # This SQL gets data from ALL the tables in a given schema.
+        return(f"select tab.table_name,col.column_name,col.data_type,col.is_nullable "
+                f"from information_schema.tables as tab "
+                f"inner join information_schema.columns as col "
+                f"on col.table_schema = tab.table_schema "
+                f"and col.table_name = tab.table_name "
+                f"where tab.table_type = '{object_type}' "
+                f"and tab.table_schema = '{self._config['database']}'"
+                f"{table_predicate(self._config, 'tab.table_name', NAME_DIALECT)} "
+                f"order by tab.table_name,col.column_name") 
+
+    def _get_dataset_query(self, schema_name: str, entry_type: EntryType) -> str:
+        """Query for the columns of tables or views in a schema."""
+        short_type =  'BASE TABLE' if entry_type.name == 'TABLE' else 'VIEW' # table or view, or the title of enum value
+        return self._get_columns(schema_name, short_type)
+
+    def _get_schema_dataset_query(self, schema_name: str) -> str:
+        """Query for the columns of both tables and views in the database, with the object type of each."""
+        return(f"select case tab.table_type when 'BASE TABLE' then '{EntryType.TABLE.name}' "
+                f"else '{EntryType.VIEW.name}' end as {COLUMN_OBJECT_TYPE}, "
+                f"tab.table_name,col.column_name,col.data_type,col.is_nullable "
+                f"from information_schema.tables as tab "
+                f"inner join information_schema.columns as col "
+                f"on col.table_schema = tab.table_schema "
+                f"and col.table_name = tab.table_name "
+                f"where tab.table_type in ('BASE TABLE', 'VIEW') "
+                f"and tab.table_schema = '{self._config['database']}'"
+                f"{table_predicate(self._config, 'tab.table_name', NAME_DIALECT)} "
+                f"order by tab.table_name,col.column_name")
+
+    def _get_all_columns(self) -> str:
+        """Gets a list of columns in all tables and views of the database."""
+        return(f"select tab.table_schema as {COLUMN_SCHEMA_NAME}, "
+                f"case tab.table_type when 'BASE TABLE' then '{EntryType.TABLE.name}' "
+                f"else '{EntryType.VIEW.name}' end as {COLUMN_OBJECT_TYPE}, "
+                f"tab.table_name,col.column_name,col.data_type,col.is_nullable "
+                f"from information_schema.tables as tab "
+                f"inner join information_schema.columns as col "
+                f"on col.table_schema = tab.table_schema "
+                f"and col.table_name = tab.table_name "
+                f"where tab.table_type in ('BASE TABLE', 'VIEW') "
+                f"and tab.table_schema = '{self._config['database']}'"
+                f"{table_predicate(self._config, 'tab.table_name', NAME_DIALECT)} "
+                f"order by tab.table_name,col.column_name")
+
+    def _get_schema_last_modified_query(self) -> str:
+        """Query for a checksum of the column definitions and number of tables and views in the database."""
+        # MySQL has no DDL time: UPDATE_TIME changes with every write, CREATE_TIME is kept by in-place
+        # ALTER TABLE and views have neither. The checksum covers only what entries are built from
+        return (f"select tab.table_schema as {COLUMN_SCHEMA_NAME}, "
+                f"sum(crc32(concat_ws('|', tab.table_name, tab.table_type, col.column_name, "
+                f"col.data_type, col.is_nullable))) as {COLUMN_LAST_MODIFIED}, "
+                f"count(distinct tab.table_name) as {COLUMN_OBJECT_COUNT} "
+                f"from information_schema.tables as tab "
+                f"inner join information_schema.columns as col "
+                f"on col.table_schema = tab.table_schema "
+                f"and col.table_name = tab.table_name "
+                f"where tab.table_type in ('BASE TABLE', 'VIEW') "
+                f"and tab.table_schema = '{self._config['database']}'"
+                f"{table_predicate(self._config, 'tab.table_name', NAME_DIALECT)} "
+                f"group by tab.table_schema")
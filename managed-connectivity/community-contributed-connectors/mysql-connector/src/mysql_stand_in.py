@@ -0,0 +1,60 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""SQLite stand-in for the MySQL information_schema views read by mysql_queries.py."""
+import zlib
+from src.common.stand_in import StandInConnector
+from src.common.stand_in import regexp_like
+from src.mysql_queries import MysqlQueries
+
+def _concat_ws(separator, *values):
+    # As MySQL, null values are skipped
+    return separator.join(str(value) for value in values if value is not None)
+
+def _crc32(value):
+    return None if value is None else zlib.crc32(str(value).encode("utf-8"))
+
+class MysqlStandInConnector(MysqlQueries, StandInConnector):
+    """Runs the MySQL metadata queries against information_schema tables in SQLite.
+    Each schema of the catalog is a MySQL database, the first of which is named --database and extracted"""
+
+    ATTACHED_SCHEMAS = ["information_schema"]
+
+    DDL = [
+        "CREATE TABLE IF NOT EXISTS information_schema.schemata (schema_name TEXT)",
+        "CREATE TABLE IF NOT EXISTS information_schema.tables (table_schema TEXT, table_name TEXT, "
+        "table_type TEXT, create_time TEXT, update_time TEXT)",
+        "CREATE TABLE IF NOT EXISTS information_schema.columns (table_schema TEXT, table_name TEXT, "
+        "column_name TEXT, ordinal_position INTEGER, data_type TEXT, is_nullable TEXT)",
+        "CREATE INDEX IF NOT EXISTS information_schema.columns_table ON columns (table_schema, table_name)",
+    ]
+
+    POPULATE = [
+        "INSERT INTO information_schema.schemata SELECT CASE schema_id WHEN 1 THEN :database ELSE schema_name END "
+        "FROM catalog_schemas",
+        # Databases of the server itself, which are not extracted
+        "INSERT INTO information_schema.schemata VALUES ('mysql'), ('sys'), ('performance_schema'), "
+        "('information_schema')",
+        # Views have no create or update time
+        "INSERT INTO information_schema.tables SELECT CASE schema_id WHEN 1 THEN :database ELSE schema_name END, table_name, "
+        "CASE object_type WHEN 'TABLE' THEN 'BASE TABLE' ELSE 'VIEW' END, "
+        "CASE object_type WHEN 'TABLE' THEN :ddl_time END, NULL FROM catalog_objects",
+        "INSERT INTO information_schema.columns SELECT CASE o.schema_id WHEN 1 THEN :database ELSE o.schema_name END, "
+        "o.table_name, c.column_name, "
+        "c.ordinal_position, c.data_type, CASE c.nullable WHEN 1 THEN 'YES' ELSE 'NO' END "
+        "FROM catalog_columns c JOIN catalog_objects o ON o.object_id = c.object_id",
+    ]
+
+    # SQLite runs name REGEXP pattern as regexp(pattern, name)
+    FUNCTIONS = {"concat_ws": _concat_ws, "crc32": _crc32, "regexp": lambda pattern, value: regexp_like(value, pattern)}
@@ -21,10 +21,24 @@ SOURCE_TYPE = "oracle"
 # Default JDBC jar file. Can override with --jar
 JDBC_JAR = "ojdbc11.jar"
 
+# Default Spark JDBC read options. Can override with --fetch_size, --query_timeout, --session_init_statement and --push_down_predicate
+JDBC_READ_OPTIONS = {
+    # The thin driver fetches only 10 rows per round trip by default
+    "fetchsize": "10000",
+}
+
 # allow common bootstrap to load connector for specific datasource
 CONNECTOR_MODULE = "src.oracle_connector"
 CONNECTOR_CLASS = "OracleConnector"
 
+# Connector using a native Python driver instead of Spark, selected with --engine python
+PYTHON_CONNECTOR_MODULE = "src.oracle_python_connector"
+PYTHON_CONNECTOR_CLASS = "OraclePythonConnector"
+
+# SQLite stand-in for the dictionary views read by the connector, run with python -m src.common.stand_in
+STAND_IN_MODULE = "src.oracle_stand_in"
+STAND_IN_CLASS = "OracleStandInConnector"
+
 # Value to test for if column is nullable. SQL Server specific. Matches _get_dataset  
 IS_NULLABLE_TRUE = "Y"
 
@@ -14,16 +14,19 @@
 
 """Reads Oracle using PySpark."""
 from typing import Dict
-from pyspark.sql import SparkSession
 from pyspark.sql import DataFrame
 from src.common.ExternalSourceConnector import IExternalSourceConnector
+from src.common.query_ledger import LEDGER
 from src.constants import EntryType
 from src.common.connection_jar import getJarPath
+from src.common.spark_session import get_spark_session
 from src.common.util import fileExists
-from src.common.entry_builder import COLUMN_IS_NULLABLE
 from src.constants import JDBC_JAR
+from src.constants import JDBC_READ_OPTIONS
+from src.common.jdbc_options import get_read_options
+from src.oracle_queries import OracleQueries
 
-class OracleConnector(IExternalSourceConnector):
+class OracleConnector(OracleQueries, IExternalSourceConnector):
     """Reads data from Oracle and returns Spark Dataframes."""
 
     def __init__(self, config: Dict[str, str]):
@@ -33,10 +36,7 @@ class OracleConnector(IExternalSourceConnector):
         # Check jdbc jar file exist. Throws exception if not found
         jarsExist = fileExists(jar_path)
 
-        self._spark = SparkSession.builder.appName("OracleIngestor") \
-            .config("spark.jars", jar_path) \
-            .config("spark.log.level", "ERROR") \
-            .getOrCreate()
+        self._spark = get_spark_session("OracleIngestor", jar_path, config)
 
         self._config = config
         # Use correct JDBC connection string depending on Service vs SID
@@ -51,44 +51,32 @@ class OracleConnector(IExternalSourceConnector):
             "user": config['user'],
             "password": config['password']
             }
+        self._connectOptions.update(get_read_options(config, JDBC_READ_OPTIONS))
 
     def _execute(self, query: str) -> DataFrame:
-        """A generic method to execute any query."""
-        return self._spark.read.format("jdbc") \
+        """A generic method to execute any query. The result is read once and persisted, see QueryLedger.materialize"""
+        df = self._spark.read.format("jdbc") \
             .options(**self._connectOptions) \
             .option("query", query) \
             .load()
+        return LEDGER.materialize(query, df)
 
     def get_db_schemas(self) -> DataFrame:
         """Select db schemas to process. Exclude system schemas"""
-        query = """
-        SELECT username as SCHEMA_NAME 
-        FROM dba_users 
-        WHERE username not in 
-        ('SYS','SYSTEM','XS$NULL','XDB','PDBADMIN',
-        'OJVMSYS','LBACSYS','OUTLN',
-        'DBSNMP','APPQOSSYS','DBSFWUSER',
-        'GGSYS','ANONYMOUS','CTXSYS',
-        'DVSYS','DVF','AUDSYS','GSMADMIN_INTERNAL',
-        'OLAPSYS','MDSYS','WMSYS','GSMCATUSER',
-        'MDDATA','SYSBACKUP','REMOTE_SCHEDULER_AGENT',
-        'GSMUSER','SYSRAC','GSMROOTUSER','DIP','ORDPLUGINS','SYSKM','SI_INFORMTN_SCHEMA',
-        'DGPDB_INT','ORDDATA','ORACLE_OCM',
-        'SYS$UMF','SYSD','ORDSYS','SYSDG','PDADMIN')
-        """
-        return self._execute(query)
-
-    def _get_columns(self, schema_name: str, object_type: str) -> str:
-        return (f"SELECT col.TABLE_NAME, col.COLUMN_NAME, "
-                f"col.DATA_TYPE, col.NULLABLE as {COLUMN_IS_NULLABLE} "
-                f"FROM all_tab_columns col "
-                f"INNER JOIN DBA_OBJECTS tab "
-                f"ON tab.OBJECT_NAME = col.TABLE_NAME "
-                f"WHERE tab.OWNER = '{schema_name}' "
-                f"AND tab.OBJECT_TYPE = '{object_type}'")
+        return self._execute(self._get_schemas_query())
 
     def get_dataset(self, schema_name: str, entry_type: EntryType):
         """Gets data for a table or a view."""
-        short_type = entry_type.name  # table or view, or the title of enum value
-        query = self._get_columns(schema_name, short_type)
-        return self._execute(query)
+        return self._execute(self._get_dataset_query(schema_name, entry_type))
+
+    def get_schema_datasets(self, schema_name: str) -> DataFrame:
+        """Gets data for both tables and views in a schema with a single query."""
+        return self._execute(self._get_schema_dataset_query(schema_name))
+
+    def get_all_datasets(self) -> DataFrame:
+        """Gets data for all tables and views in the database with a single query."""
+        return self._execute(self._get_all_columns())
+
+    def get_schema_last_modified(self) -> DataFrame:
+        """Gets latest DDL time and number of tables and views in each schema."""
+        return self._execute(self._get_schema_last_modified_query())
@@ -0,0 +1,32 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Reads Oracle using the python-oracledb driver in thin mode, without Spark."""
+from typing import Dict
+import oracledb
+from src.common.dbapi_connector import DbApiConnector
+from src.oracle_queries import OracleQueries
+
+class OraclePythonConnector(OracleQueries, DbApiConnector):
+    """Reads data from Oracle and returns row iterators."""
+
+    def __init__(self, config: Dict[str, str]):
+        # Connect with Service or SID, as for the JDBC connection string
+        if config['sid']:
+            connection = oracledb.connect(user=config['user'], password=config['password'],
+                                          host=config['host'], port=config['port'], sid=config['sid'])
+        else:
+            connection = oracledb.connect(user=config['user'], password=config['password'],
+                                          host=config['host'], port=config['port'], service_name=config['service'])
+        super().__init__(config, connection)
@@ -0,0 +1,109 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Metadata queries for Oracle, shared by the Spark and Python connectors."""
+from typing import Dict
+from src.constants import EntryType
+from src.common.entry_constants import COLUMN_IS_NULLABLE
+from src.common.entry_constants import COLUMN_SCHEMA_NAME
+from src.common.entry_constants import COLUMN_OBJECT_TYPE
+from src.common.entry_constants import COLUMN_LAST_MODIFIED
+from src.common.entry_constants import COLUMN_OBJECT_COUNT
+from src.common.name_filter import SqlDialect
+from src.common.name_filter import schema_predicate
+from src.common.name_filter import table_predicate
+
+# Name filters are matched with LIKE, or REGEXP_LIKE for regular expressions
+NAME_DIALECT = SqlDialect(regex_match="REGEXP_LIKE({column}, {pattern})")
+
+class OracleQueries:
+    """Builds the SQL used to read metadata from Oracle."""
+
+    _config: Dict[str, str]
+
+    def _get_schemas_query(self) -> str:
+        """Query for the non-system schemas (users) in the database, filtered by --include_schemas and --exclude_schemas."""
+        return f"""
+        SELECT username as SCHEMA_NAME 
+        FROM dba_users 
+        WHERE username not in 
+        ('SYS','SYSTEM','XS$NULL','XDB','PDBADMIN',
+        'OJVMSYS','LBACSYS','OUTLN',
+        'DBSNMP','APPQOSSYS','DBSFWUSER',
+        'GGSYS','ANONYMOUS','CTXSYS',
+        'DVSYS','DVF','AUDSYS','GSMADMIN_INTERNAL',
+        'OLAPSYS','MDSYS','WMSYS','GSMCATUSER',
+        'MDDATA','SYSBACKUP','REMOTE_SCHEDULER_AGENT',
+        'GSMUSER','SYSRAC','GSMROOTUSER','DIP','ORDPLUGINS','SYSKM','SI_INFORMTN_SCHEMA',
+        'DGPDB_INT','ORDDATA','ORACLE_OCM',
+        'SYS$UMF','SYSD','ORDSYS','SYSDG','PDADMIN'){schema_predicate(self._config, "username", NAME_DIALECT)}
+        """
+
+    def _get_columns(self, schema_name: str, object_type: str) -> str:
+        return (f"SELECT col.TABLE_NAME, col.COLUMN_NAME, "
+                f"col.DATA_TYPE, col.NULLABLE as {COLUMN_IS_NULLABLE} "
+                f"FROM all_tab_columns col "
+                f"INNER JOIN DBA_OBJECTS tab "
+                f"ON tab.OBJECT_NAME = col.TABLE_NAME "
+                f"AND tab.OWNER = col.OWNER "
+                f"WHERE tab.OWNER = '{schema_name}' "
+                f"AND tab.OBJECT_TYPE = '{object_type}'"
+                f"{table_predicate(self._config, 'col.TABLE_NAME', NAME_DIALECT)}")
+
+    def _get_dataset_query(self, schema_name: str, entry_type: EntryType) -> str:
+        """Query for the columns of tables or views in a schema."""
+        short_type = entry_type.name  # table or view, or the title of enum value
+        return self._get_columns(schema_name, short_type)
+
+    def _get_dataset_order_by(self) -> str:
+        """Orders dataset rows by table, then column position. Used by the Python connector only"""
+        return "col.TABLE_NAME, col.COLUMN_ID"
+
+    def _get_schema_dataset_query(self, schema_name: str) -> str:
+        """Query for the columns of both tables and views in a schema, with the object type of each."""
+        return (f"SELECT tab.OBJECT_TYPE as {COLUMN_OBJECT_TYPE}, "
+                f"col.TABLE_NAME, col.COLUMN_NAME, "
+                f"col.DATA_TYPE, col.NULLABLE as {COLUMN_IS_NULLABLE} "
+                f"FROM all_tab_columns col "
+                f"INNER JOIN DBA_OBJECTS tab "
+                f"ON tab.OBJECT_NAME = col.TABLE_NAME "
+                f"AND tab.OWNER = col.OWNER "
+                f"WHERE tab.OWNER = '{schema_name}' "
+                f"AND tab.OBJECT_TYPE IN ('{EntryType.TABLE.name}', '{EntryType.VIEW.name}')"
+                f"{table_predicate(self._config, 'col.TABLE_NAME', NAME_DIALECT)}")
+
+    def _get_all_columns(self) -> str:
+        """Gets a list of columns in all tables and views of all schemas."""
+        return (f"SELECT tab.OWNER as {COLUMN_SCHEMA_NAME}, "
+                f"tab.OBJECT_TYPE as {COLUMN_OBJECT_TYPE}, "
+                f"col.TABLE_NAME, col.COLUMN_NAME, "
+                f"col.DATA_TYPE, col.NULLABLE as {COLUMN_IS_NULLABLE} "
+                f"FROM all_tab_columns col "
+                f"INNER JOIN DBA_OBJECTS tab "
+                f"ON tab.OBJECT_NAME = col.TABLE_NAME "
+                f"AND tab.OWNER = col.OWNER "
+                f"WHERE tab.OBJECT_TYPE IN ('{EntryType.TABLE.name}', '{EntryType.VIEW.name}') "
+                f"AND tab.OWNER IN ({self._get_schemas_query()})"
+                f"{table_predicate(self._config, 'col.TABLE_NAME', NAME_DIALECT)}")
+
+    def _get_schema_last_modified_query(self) -> str:
+        """Query for latest DDL time and number of tables and views in each schema."""
+        return (f"SELECT OWNER AS {COLUMN_SCHEMA_NAME}, "
+                f"MAX(LAST_DDL_TIME) AS {COLUMN_LAST_MODIFIED}, "
+                f"COUNT(*) AS {COLUMN_OBJECT_COUNT} "
+                f"FROM DBA_OBJECTS "
+                f"WHERE OBJECT_TYPE IN ('{EntryType.TABLE.name}', '{EntryType.VIEW.name}') "
+                f"AND OWNER IN ({self._get_schemas_query()})"
+                f"{table_predicate(self._config, 'OBJECT_NAME', NAME_DIALECT)} "
+                f"GROUP BY OWNER")
@@ -0,0 +1,43 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""SQLite stand-in for the Oracle dictionary views read by oracle_queries.py."""
+from src.common.stand_in import StandInConnector
+from src.common.stand_in import regexp_like
+from src.oracle_queries import OracleQueries
+
+class OracleStandInConnector(OracleQueries, StandInConnector):
+    """Runs the Oracle metadata queries against dba_users, dba_objects and all_tab_columns tables in SQLite.
+    Each schema of the catalog is a user owning its tables and views"""
+
+    FUNCTIONS = {"regexp_like": regexp_like}
+
+    DDL = [
+        "CREATE TABLE IF NOT EXISTS dba_users (username TEXT)",
+        "CREATE TABLE IF NOT EXISTS dba_objects (owner TEXT, object_name TEXT, object_type TEXT, last_ddl_time TEXT)",
+        "CREATE INDEX IF NOT EXISTS dba_objects_owner ON dba_objects (owner, object_type)",
+        "CREATE TABLE IF NOT EXISTS all_tab_columns (owner TEXT, table_name TEXT, column_name TEXT, "
+        "column_id INTEGER, data_type TEXT, nullable TEXT)",
+        "CREATE INDEX IF NOT EXISTS all_tab_columns_table ON all_tab_columns (table_name, owner)",
+    ]
+
+    POPULATE = [
+        "INSERT INTO dba_users SELECT schema_name FROM catalog_schemas",
+        # System users, which are not extracted
+        "INSERT INTO dba_users VALUES ('SYS'), ('SYSTEM'), ('XDB'), ('OUTLN')",
+        "INSERT INTO dba_objects SELECT schema_name, table_name, object_type, :ddl_time FROM catalog_objects",
+        "INSERT INTO all_tab_columns SELECT o.schema_name, o.table_name, c.column_name, c.ordinal_position, "
+        "c.data_type, CASE c.nullable WHEN 1 THEN 'Y' ELSE 'N' END "
+        "FROM catalog_columns c JOIN catalog_objects o ON o.object_id = c.object_id",
+    ]
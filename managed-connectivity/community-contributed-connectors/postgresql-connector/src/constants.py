@@ -19,10 +19,26 @@ SOURCE_TYPE = "postgresql"
 
 JDBC_JAR = "postgresql-42.7.5.jar"
 
+# Default Spark JDBC read options. Can override with --fetch_size, --query_timeout, --session_init_statement and --push_down_predicate
+JDBC_READ_OPTIONS = {
+    # Without a fetch size the driver reads the whole result into memory
+    "fetchsize": "10000",
+    # Bounds catalog queries on the server and gives their sorts and joins more memory
+    "sessionInitStatement": "SET statement_timeout = '1h'; SET work_mem = '64MB'",
+}
+
 # allow common bootstrap to load connector for specific datasource
 CONNECTOR_MODULE = "src.postgres_connector"
 CONNECTOR_CLASS = "PostgresConnector"
 
+# Connector using a native Python driver instead of Spark, selected with --engine python
+PYTHON_CONNECTOR_MODULE = "src.postgres_python_connector"
+PYTHON_CONNECTOR_CLASS = "PostgresPythonConnector"
+
+# SQLite stand-in for the dictionary views read by the connector, run with python -m src.common.stand_in
+STAND_IN_MODULE = "src.postgres_stand_in"
+STAND_IN_CLASS = "PostgresStandInConnector"
+
 # Value to test for if column is nullable. PostgreSQL specific. Matches _get_dataset in postgres_connector.py  
 IS_NULLABLE_TRUE = "YES"
 
@@ -14,18 +14,20 @@
 
 # Maps data types from PostgreSQL to Dataplex Catalog
 
-def get_catalog_metadata_type(data_type: str) -> str:
-    """Choose the metadata type based on Postgres native type."""
-    if data_type in ["numeric","integer","serial","double precision","decimal","smallint","smallserial","bigserial","bigint","real"]:
-        return "NUMBER"
-    if data_type.startswith("character") or data_type.startswith("bpchar") or data_type in ["text","varchar"]:
-        return "STRING"
-    if data_type.startswith("bytea"):
-        return "BYTES"
-    if data_type == "boolean":
-        return "BOOLEAN"
-    if data_type.startswith("timestamp"):
-        return "TIMESTAMP"
-    if data_type.startswith("date"):
-        return "DATETIME"
-    return "OTHER"
+# Data types matched exactly, by metadata type
+EXACT_RULES = {
+    "NUMBER": ["numeric", "integer", "serial", "double precision", "decimal", "smallint", "smallserial", "bigserial", "bigint", "real"],
+    "STRING": ["text", "varchar"],
+    "BOOLEAN": ["boolean"],
+}
+
+# Data type prefixes, by metadata type. The longest matching prefix is used if there is no exact match
+PREFIX_RULES = {
+    "STRING": ["character", "bpchar"],
+    "BYTES": ["bytea"],
+    "TIMESTAMP": ["timestamp"],
+    "DATETIME": ["date"],
+}
+
+# Metadata type of data types matching no rule
+DEFAULT_METADATA_TYPE = "OTHER"
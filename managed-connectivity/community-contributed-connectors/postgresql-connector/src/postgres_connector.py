@@ -14,14 +14,19 @@
 
 """Reads Postgres using PySpark."""
 from typing import Dict
-from pyspark.sql import SparkSession, DataFrame
+from pyspark.sql import DataFrame
 from src.constants import EntryType
 from src.common.ExternalSourceConnector import IExternalSourceConnector
+from src.common.query_ledger import LEDGER
 from src.common.connection_jar import getJarPath
+from src.common.spark_session import get_spark_session
 from src.common.util import fileExists
 from src.constants import JDBC_JAR
+from src.constants import JDBC_READ_OPTIONS
+from src.common.jdbc_options import get_read_options
+from src.postgres_queries import PostgresQueries
 
-class PostgresConnector(IExternalSourceConnector):
+class PostgresConnector(PostgresQueries, IExternalSourceConnector):
     """Reads data from Postgres and returns Spark Dataframes."""
 
     def __init__(self, config: Dict[str, str]):
@@ -32,10 +37,7 @@ class PostgresConnector(IExternalSourceConnector):
         # Check jdbc jar file exist. Throws exception if not found
         jarsExist = fileExists(jar_path)
 
-        self._spark = SparkSession.builder.appName("PostgresIngestor") \
-            .config("spark.jars", jar_path) \
-            .config("spark.log.level", "ERROR") \
-            .getOrCreate()
+        self._spark = get_spark_session("PostgresIngestor", jar_path, config)
 
         self._config = config
         self._url = f"jdbc:postgresql://{config['host']}:{config['port']}/{config['database']}"
@@ -48,42 +50,32 @@ class PostgresConnector(IExternalSourceConnector):
             "sslMode" : config['ssl_mode'],
             'ssl'     : config['use_ssl']
             } 
+        self._connectOptions.update(get_read_options(config, JDBC_READ_OPTIONS))
 
     def _execute(self, query: str) -> DataFrame:
-        """A generic method to execute any query."""
-        return self._spark.read.format("jdbc") \
+        """A generic method to execute any query. The result is read once and persisted, see QueryLedger.materialize"""
+        df = self._spark.read.format("jdbc") \
             .options(**self._connectOptions) \
             .option("query", query) \
             .load()
+        return LEDGER.materialize(query, df)
 
     def get_db_schemas(self) -> DataFrame:
-        query = """
-        SELECT DISTINCT schema_name 
-        FROM information_schema.schemata
-        WHERE schema_name NOT LIKE 'pg_%' 
-        AND schema_name <> 'information_schema'
-        """
-        return self._execute(query)
-
-    def _get_columns(self, schema_name: str, object_type: str) -> str:
-        """Gets a list of columns in tables or views in a batch."""
-        # Every line here is a column that belongs to the table or to the view.
-        # This SQL gets data from ALL the tables in a given schema.
-        return (f"SELECT c.table_name, c.column_name,  "
-                f"c.data_type, c.is_nullable "
-                f"FROM information_schema.columns c, "
-                f"information_schema.tables t "
-                f"WHERE c.table_schema = '{schema_name}' "
-                f"AND t.table_name = c.table_name AND t.table_schema = c.table_schema "
-                f"AND c.table_catalog = '{self._config['database']}' "
-                f"AND t.table_type = '{object_type}'")
+        return self._execute(self._get_schemas_query())
 
     def get_dataset(self, schema_name: str, entry_type: EntryType):
         """Gets data for a table or a view."""
         # Dataset means that these entities can contain end user data.
-        if entry_type == EntryType.TABLE:
-            object_type = 'BASE TABLE' 
-        if entry_type == EntryType.VIEW:
-            object_type = 'VIEW'
-        query = self._get_columns(schema_name, object_type)
-        return self._execute(query)
+        return self._execute(self._get_dataset_query(schema_name, entry_type))
+
+    def get_schema_datasets(self, schema_name: str) -> DataFrame:
+        """Gets data for both tables and views in a schema with a single query."""
+        return self._execute(self._get_schema_dataset_query(schema_name))
+
+    def get_all_datasets(self) -> DataFrame:
+        """Gets data for all tables and views in the database with a single query."""
+        return self._execute(self._get_all_columns())
+
+    def get_databases(self) -> DataFrame:
+        """Gets a list of user databases on the server."""
+        return self._execute(self._get_databases_query())
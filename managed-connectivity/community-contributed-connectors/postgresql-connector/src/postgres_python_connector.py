@@ -0,0 +1,33 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Reads Postgres using the psycopg driver, without Spark."""
+from typing import Dict
+import psycopg
+from src.common.dbapi_connector import DbApiConnector
+from src.postgres_queries import PostgresQueries
+
+class PostgresPythonConnector(PostgresQueries, DbApiConnector):
+    """Reads data from Postgres and returns row iterators."""
+
+    def __init__(self, config: Dict[str, str]):
+        connection = psycopg.connect(
+            host=config['host'],
+            port=config['port'],
+            dbname=config['database'],
+            user=config['user'],
+            password=config['password'],
+            sslmode=config['ssl_mode'] if config['use_ssl'] else 'disable',
+            autocommit=True)
+        super().__init__(config, connection)
@@ -0,0 +1,105 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Metadata queries for PostgreSQL, shared by the Spark and Python connectors."""
+from typing import Dict
+from src.constants import EntryType
+from src.common.entry_constants import COLUMN_SCHEMA_NAME
+from src.common.entry_constants import COLUMN_OBJECT_TYPE
+from src.common.entry_constants import COLUMN_DATABASE_NAME
+from src.common.name_filter import SqlDialect
+from src.common.name_filter import schema_predicate
+from src.common.name_filter import table_predicate
+
+# Name filters are matched with LIKE, or the ~ operator for regular expressions
+NAME_DIALECT = SqlDialect(regex_match="{column} ~ {pattern}")
+
+class PostgresQueries:
+    """Builds the SQL used to read metadata from PostgreSQL."""
+
+    _config: Dict[str, str]
+
+    def _get_schemas_query(self) -> str:
+        """Query for the non-system schemas in the database, filtered by --include_schemas and --exclude_schemas."""
+        return f"""
+        SELECT DISTINCT schema_name 
+        FROM information_schema.schemata
+        WHERE schema_name NOT LIKE 'pg_%' 
+        AND schema_name <> 'information_schema'{schema_predicate(self._config, "schema_name", NAME_DIALECT)}
+        """
+
+    def _get_databases_query(self) -> str:
+        """Query for the databases on the server which accept connections, excluding templates."""
+        return (f"SELECT datname AS {COLUMN_DATABASE_NAME} "
+                f"FROM pg_database "
+                f"WHERE NOT datistemplate AND datallowconn")
+
+    def _get_columns(self, schema_name: str, object_type: str) -> str:
+        """Gets a list of columns in tables or views in a batch, filtered by --include_tables and --exclude_tables."""
+        # Every line here is a column that belongs to the table or to the view.
+        # This SQL gets data from ALL the tables in a given schema.
+        return (f"SELECT c.table_name, c.column_name,  "
+                f"c.data_type, c.is_nullable "
+                f"FROM information_schema.columns c, "
+                f"information_schema.tables t "
+                f"WHERE c.table_schema = '{schema_name}' "
+                f"AND t.table_name = c.table_name AND t.table_schema = c.table_schema "
+                f"AND c.table_catalog = '{self._config['database']}' "
+                f"AND t.table_type = '{object_type}'"
+                f"{table_predicate(self._config, 'c.table_name', NAME_DIALECT)}")
+
+    def _get_dataset_query(self, schema_name: str, entry_type: EntryType) -> str:
+        """Query for the columns of tables or views in a schema."""
+        if entry_type == EntryType.TABLE:
+            object_type = 'BASE TABLE' 
+        if entry_type == EntryType.VIEW:
+            object_type = 'VIEW'
+        return self._get_columns(schema_name, object_type)
+
+    def _get_dataset_order_by(self) -> str:
+        """Orders dataset rows by table, then column position. Used by the Python connector only"""
+        return "c.table_name, c.ordinal_position"
+
+    def _get_schema_dataset_query(self, schema_name: str) -> str:
+        """Query for the columns of both tables and views in a schema, with the object type of each."""
+        return (f"SELECT CASE t.table_type WHEN 'BASE TABLE' THEN '{EntryType.TABLE.name}' "
+                f"ELSE '{EntryType.VIEW.name}' END AS {COLUMN_OBJECT_TYPE}, "
+                f"c.table_name, c.column_name, "
+                f"c.data_type, c.is_nullable "
+                f"FROM information_schema.columns c, "
+                f"information_schema.tables t "
+                f"WHERE c.table_schema = '{schema_name}' "
+                f"AND t.table_name = c.table_name AND t.table_schema = c.table_schema "
+                f"AND c.table_catalog = '{self._config['database']}' "
+                f"AND t.table_type IN ('BASE TABLE', 'VIEW')"
+                f"{table_predicate(self._config, 'c.table_name', NAME_DIALECT)}")
+
+    def _get_all_columns(self) -> str:
+        """Gets a list of columns in all tables and views of all schemas."""
+        return (f"SELECT c.table_schema AS {COLUMN_SCHEMA_NAME}, "
+                f"CASE t.table_type WHEN 'BASE TABLE' THEN '{EntryType.TABLE.name}' "
+                f"ELSE '{EntryType.VIEW.name}' END AS {COLUMN_OBJECT_TYPE}, "
+                f"c.table_name, c.column_name, "
+                f"c.data_type, c.is_nullable "
+                f"FROM information_schema.columns c, "
+                f"information_schema.tables t "
+                f"WHERE t.table_name = c.table_name AND t.table_schema = c.table_schema "
+                f"AND c.table_catalog = '{self._config['database']}' "
+                f"AND t.table_type IN ('BASE TABLE', 'VIEW') "
+                f"AND c.table_schema IN ({self._get_schemas_query()})"
+                f"{table_predicate(self._config, 'c.table_name', NAME_DIALECT)}")
+
+    def _get_schema_last_modified_query(self) -> str:
+        """PostgreSQL keeps no DDL timestamps in its catalog, so schema changes cannot be detected."""
+        return None
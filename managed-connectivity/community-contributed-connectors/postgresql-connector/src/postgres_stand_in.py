@@ -0,0 +1,55 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""SQLite stand-in for the PostgreSQL catalog views read by postgres_queries.py."""
+from typing import Iterator
+from typing import Tuple
+from src.common.stand_in import StandInConnector
+from src.common.stand_in import regexp_like
+from src.postgres_queries import PostgresQueries
+
+class PostgresStandInConnector(PostgresQueries, StandInConnector):
+    """Runs the PostgreSQL metadata queries against information_schema and pg_database tables in SQLite."""
+
+    ATTACHED_SCHEMAS = ["information_schema"]
+
+    # SQLite runs name REGEXP pattern as regexp(pattern, name)
+    FUNCTIONS = {"regexp": lambda pattern, value: regexp_like(value, pattern)}
+
+    DDL = [
+        "CREATE TABLE IF NOT EXISTS information_schema.schemata (catalog_name TEXT, schema_name TEXT)",
+        "CREATE TABLE IF NOT EXISTS information_schema.tables (table_catalog TEXT, table_schema TEXT, "
+        "table_name TEXT, table_type TEXT)",
+        "CREATE TABLE IF NOT EXISTS information_schema.columns (table_catalog TEXT, table_schema TEXT, "
+        "table_name TEXT, column_name TEXT, ordinal_position INTEGER, data_type TEXT, is_nullable TEXT)",
+        "CREATE INDEX IF NOT EXISTS information_schema.columns_table ON columns (table_schema, table_name)",
+        "CREATE TABLE IF NOT EXISTS pg_database (datname TEXT, datistemplate INTEGER, datallowconn INTEGER)",
+    ]
+
+    POPULATE = [
+        "INSERT INTO information_schema.schemata SELECT :database, schema_name FROM catalog_schemas",
+        # System schemas, which are not extracted
+        "INSERT INTO information_schema.schemata VALUES (:database, 'pg_catalog'), (:database, 'pg_toast'), "
+        "(:database, 'information_schema')",
+        "INSERT INTO information_schema.tables SELECT :database, schema_name, table_name, "
+        "CASE object_type WHEN 'TABLE' THEN 'BASE TABLE' ELSE 'VIEW' END FROM catalog_objects",
+        "INSERT INTO information_schema.columns SELECT :database, o.schema_name, o.table_name, c.column_name, "
+        "c.ordinal_position, c.data_type, CASE c.nullable WHEN 1 THEN 'YES' ELSE 'NO' END "
+        "FROM catalog_columns c JOIN catalog_objects o ON o.object_id = c.object_id",
+        "INSERT INTO pg_database VALUES (:database, 0, 1), ('postgres', 0, 1), ('template0', 1, 0), ('template1', 1, 1)",
+    ]
+
+    def _fetch(self, query: str) -> Iterator[Tuple]:
+        # The ~ operator of regular expression name filters is REGEXP in SQLite
+        return super()._fetch(query.replace(" ~ ", " REGEXP "))
@@ -16,8 +16,9 @@ import argparse
 import sys
 from src.common.util import loadReferencedFile
 from src.common.argument_validator import validateArguments
+from src.common.argument_validator import addPipelineArguments
 
-def read_args():
+def read_args(argv: list = None):
     parser = argparse.ArgumentParser()
 
     # Project arguments for basic generation of metadata entries
@@ -52,7 +53,10 @@ def read_args():
 
     parser.add_argument("--min_expected_entries", type=int, required=False,default=-1,help="Minimum number of entries expected in metadata file, if less entries then file gets deleted. Safety mechanism for when using Full Entry Sync metadata jobs")
     
-    parsed_args = parser.parse_known_args()[0]
+    # Common pipeline arguments shared by all connectors
+    addPipelineArguments(parser)
+
+    parsed_args = parser.parse_known_args(argv)[0]
 
     # Apply common argument validation checks first
     parsed_args = validateArguments(parsed_args)
@@ -28,9 +28,17 @@ SNOWFLAKE_SPARK_JAR = "spark-snowflake_2.12-3.1.1.jar"
 CONNECTOR_MODULE = "src.snowflake_connector"
 CONNECTOR_CLASS = "SnowflakeConnector"
 
+# Connector using a native Python driver instead of Spark, selected with --engine python
+PYTHON_CONNECTOR_MODULE = "src.snowflake_python_connector"
+PYTHON_CONNECTOR_CLASS = "SnowflakePythonConnector"
+
+# SQLite stand-in for the dictionary views read by the connector, run with python -m src.common.stand_in
+STAND_IN_MODULE = "src.snowflake_stand_in"
+STAND_IN_CLASS = "SnowflakeStandInConnector"
+
 # Value to test for if column is nullable. Snowflake specific. 
-# Matches value in is_nullable column from _get_columns
-IS_NULLABLE_TRUE = "Y"
+# Matches value in is_nullable column of INFORMATION_SCHEMA.COLUMNS
+IS_NULLABLE_TRUE = "YES"
 
 class EntryType(enum.Enum):
     """Hierarchy of Snowflake entries"""
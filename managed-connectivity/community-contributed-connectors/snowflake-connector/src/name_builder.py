@@ -13,77 +13,23 @@
 # limitations under the License.
 
 """Builds Dataplex hierarchy identifiers."""
-from typing import Dict
 from src.constants import EntryType
 from src.constants import SOURCE_TYPE
-from src.constants import DB_OBJECT_TYPES_TO_PROCESS
-
-# In that case in names it is changed to C!!, and escaped with backticks in FQNs
-FORBIDDEN_SYMBOL = "#"
-ALLOWED_SYMBOL = "!"
-
-def create_fqn(config: Dict[str, str], entry_type: EntryType,
-               schema_name: str = "", table_name: str = ""):
-    """Creates a fully qualified name or Dataplex v1 hierarchy name."""
-    if FORBIDDEN_SYMBOL in schema_name:
-        schema_name = f"`{schema_name}`"
-
-    if entry_type == EntryType.ACCOUNT:
-        # Requires backticks to escape column
-        return f"{SOURCE_TYPE}:`{config['account']}`"
-    if entry_type == EntryType.DATABASE:
-        instance = create_fqn(config, EntryType.ACCOUNT)
-        return f"{instance}.{config['database']}"
-    if entry_type == EntryType.DB_SCHEMA:
-        database = create_fqn(config, EntryType.DATABASE)
-        return f"{database}.{schema_name}"
-    if entry_type in [EntryType.TABLE, EntryType.VIEW]:
-        database = create_fqn(config, EntryType.DATABASE)
-        return f"{database}.{schema_name}.{table_name}"
-    return ""
-
-
-def create_name(config: Dict[str, str], entry_type: EntryType,
-                schema_name: str = "", table_name: str = ""):
-    """Creates a Dataplex v2 hierarchy name."""
-    if FORBIDDEN_SYMBOL in schema_name:
-        schema_name = schema_name.replace(FORBIDDEN_SYMBOL, ALLOWED_SYMBOL)
-    if entry_type == EntryType.ACCOUNT:
-        name_prefix = (
-            f"projects/{config['target_project_id']}/"
-            f"locations/{config['target_location_id']}/"
-            f"entryGroups/{config['target_entry_group_id']}/"
-            f"entries/"
-        )
-        return name_prefix + config["account"].replace(".", "@")
-    if entry_type == EntryType.DATABASE:
-        instance = create_name(config, EntryType.ACCOUNT)
-        return f"{instance}/databases/{config['database']}"
-    if entry_type == EntryType.DB_SCHEMA:
-        database = create_name(config, EntryType.DATABASE)
-        return f"{database}/database_schemas/{schema_name}"
-    if entry_type == EntryType.TABLE:
-        db_schema = create_name(config, EntryType.DB_SCHEMA, schema_name)
-        return f"{db_schema}/tables/{table_name}"
-    if entry_type == EntryType.VIEW:
-        db_schema = create_name(config, EntryType.DB_SCHEMA, schema_name)
-        return f"{db_schema}/views/{table_name}"
-    return ""
-
-
-def create_parent_name(config: Dict[str, str], entry_type: EntryType,
-                       parent_name: str = ""):
-    """Generates a Dataplex v2 name of the parent."""
-    if entry_type == EntryType.DATABASE:
-        return create_name(config, EntryType.ACCOUNT)
-    if entry_type == EntryType.DB_SCHEMA:
-        return create_name(config, EntryType.DATABASE)
-    if entry_type in DB_OBJECT_TYPES_TO_PROCESS:
-        return create_name(config, EntryType.DB_SCHEMA, parent_name)
-    return ""
-
-
-def create_entry_aspect_name(config: Dict[str, str], entry_type: EntryType):
-    """Generates an entry aspect name."""
-    last_segment = entry_type.value.split("/")[-1]
-    return f"{config['target_project_id']}.{config['target_location_id']}.{last_segment}"
+from src.common.hierarchy import Hierarchy
+from src.common.hierarchy import Level
+
+# Account, database, schema, table/view. Dots in the account identifier are not accepted in names
+HIERARCHY = Hierarchy([
+    # Requires backticks to escape column
+    Level(EntryType.ACCOUNT, "{account}", f"{SOURCE_TYPE}:`{{account}}`"),
+    Level(EntryType.DATABASE, "/databases/{database}", ".{database}", parent=EntryType.ACCOUNT),
+    Level(EntryType.DB_SCHEMA, "/database_schemas/{schema}", ".{schema}", parent=EntryType.DATABASE),
+    Level(EntryType.TABLE, "/tables/{table}", ".{table}", parent=EntryType.DB_SCHEMA),
+    Level(EntryType.VIEW, "/views/{table}", ".{table}", parent=EntryType.DB_SCHEMA),
+], name_escapes={"account": {".": "@"}})
+
+# Names are rendered from the hierarchy, compiled once for the arguments of a run
+create_name = HIERARCHY.create_name
+create_fqn = HIERARCHY.create_fqn
+create_parent_name = HIERARCHY.create_parent_name
+create_entry_aspect_name = HIERARCHY.create_entry_aspect_name
@@ -13,14 +13,18 @@
 # limitations under the License.
 
 from typing import Dict
-from pyspark.sql import SparkSession, DataFrame
+from pyspark.sql import DataFrame
 from src.constants import EntryType
+from src.common.ExternalSourceConnector import IExternalSourceConnector
+from src.common.query_ledger import LEDGER
 from src.common.connection_jar import getJarPath
+from src.common.spark_session import get_spark_session
 from src.common.util import fileExists
 from src.constants import JDBC_JAR
+from src.snowflake_queries import SnowflakeQueries
 from src.constants import SNOWFLAKE_SPARK_JAR
 
-class SnowflakeConnector:
+class SnowflakeConnector(SnowflakeQueries, IExternalSourceConnector):
     """Reads data from Snowflake and returns Spark Dataframes."""
 
     def __init__(self, config: Dict[str, str]):
@@ -31,10 +35,7 @@ class SnowflakeConnector:
         # Check jar files exist. Throws exception if not found
         jarsExist = fileExists(jar_path)
 
-        self._spark = SparkSession.builder.appName("SnowflakeIngestor") \
-            .config("spark.jars",jar_path) \
-            .config("spark.log.level", "ERROR") \
-            .getOrCreate()
+        self._spark = get_spark_session("SnowflakeIngestor", jar_path, config)
 
         self._url = f"{config['account']}.snowflakecomputing.com"
         
@@ -68,36 +69,27 @@ class SnowflakeConnector:
         sfOptions = self._sfOptions
         SNOWFLAKE_SOURCE_NAME = "net.snowflake.spark.snowflake"
 
-        return self._spark.read.format(SNOWFLAKE_SOURCE_NAME) \
+        df = self._spark.read.format(SNOWFLAKE_SOURCE_NAME) \
             .options(**self._sfOptions) \
             .option("query", query) \
             .load()
+        return LEDGER.materialize(query, df)
 
     def get_db_schemas(self) -> DataFrame:
-        query = f"""
-        SELECT schema_name FROM information_schema.schemata 
-        WHERE schema_name != 'INFORMATION_SCHEMA'
-        """
-        return self._execute(query)
-
-    def _get_columns(self, schema_name: str, object_type: str) -> str:
-        """Returns list of columns a tables or view"""
-        return (f"SELECT c.table_name, c.column_name,  "
-                f"c.data_type, c.is_nullable "
-                f"FROM information_schema.columns c "
-                f"JOIN information_schema.tables t ON  "
-                f"c.table_catalog = t.table_catalog "
-                f"AND c.table_schema = t.table_schema "
-                f"AND c.table_name = t.table_name "
-                f"WHERE c.table_schema = '{schema_name}' "
-                f"AND t.table_type = '{object_type}'")
+        return self._execute(self._get_schemas_query())
 
     def get_dataset(self, schema_name: str, entry_type: EntryType):
         """Gets data for a table or a view."""
-        short_type = entry_type.name  # table or view, or the title of enum value
-        if ( short_type == "TABLE" ):
-            object_type = "BASE TABLE"
-        else:
-            object_type = "VIEW"
-        query = self._get_columns(schema_name, object_type)
-        return self._execute(query)
\ No newline at end of file
+        return self._execute(self._get_dataset_query(schema_name, entry_type))
+
+    def get_schema_datasets(self, schema_name: str) -> DataFrame:
+        """Gets data for both tables and views in a schema with a single query."""
+        return self._execute(self._get_schema_dataset_query(schema_name))
+
+    def get_all_datasets(self) -> DataFrame:
+        """Gets data for all tables and views in the database with a single query."""
+        return self._execute(self._get_all_columns())
+
+    def get_schema_last_modified(self) -> DataFrame:
+        """Gets latest alteration time and number of tables and views in each schema."""
+        return self._execute(self._get_schema_last_modified_query())
@@ -0,0 +1,41 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Reads Snowflake using the Snowflake Connector for Python, without Spark."""
+from typing import Dict
+import snowflake.connector
+from src.common.dbapi_connector import DbApiConnector
+from src.snowflake_queries import SnowflakeQueries
+
+class SnowflakePythonConnector(SnowflakeQueries, DbApiConnector):
+    """Reads data from Snowflake and returns row iterators."""
+
+    def __init__(self, config: Dict[str, str]):
+        params = {
+            "account": config['account'],
+            "user": config['user'],
+            "database": config['database'],
+            }
+
+        if config.get('authentication') == 'oauth':
+            params['authenticator'] = 'oauth'
+            params['token'] = config['token']
+        else:
+            params['password'] = config['password']
+
+        for option in ['warehouse', 'schema', 'role']:
+            if config.get(option) is not None:
+                params[option] = config[option]
+
+        super().__init__(config, snowflake.connector.connect(**params))
@@ -0,0 +1,107 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Metadata queries for Snowflake, shared by the Spark and Python connectors."""
+from typing import Dict
+from src.constants import EntryType
+from src.common.entry_constants import COLUMN_SCHEMA_NAME
+from src.common.entry_constants import COLUMN_OBJECT_TYPE
+from src.common.entry_constants import COLUMN_LAST_MODIFIED
+from src.common.entry_constants import COLUMN_OBJECT_COUNT
+from src.common.name_filter import SqlDialect
+from src.common.name_filter import schema_predicate
+from src.common.name_filter import table_predicate
+
+# Name filters are matched with LIKE, or RLIKE for regular expressions. Backslashes escape in Snowflake string literals
+NAME_DIALECT = SqlDialect(regex_match="RLIKE({column}, {pattern})", backslash_escapes=True)
+
+class SnowflakeQueries:
+    """Builds the SQL used to read metadata from Snowflake."""
+
+    _config: Dict[str, str]
+
+    def _get_schemas_query(self) -> str:
+        """Query for the non-system schemas in the database, filtered by --include_schemas and --exclude_schemas."""
+        return f"""
+        SELECT schema_name FROM information_schema.schemata 
+        WHERE schema_name != 'INFORMATION_SCHEMA'{schema_predicate(self._config, "schema_name", NAME_DIALECT)}
+        """
+
+    def _get_columns(self, schema_name: str, object_type: str) -> str:
+        """Returns list of columns a tables or view"""
+        return (f"SELECT c.table_name, c.column_name,  "
+                f"c.data_type, c.is_nullable "
+                f"FROM information_schema.columns c "
+                f"JOIN information_schema.tables t ON  "
+                f"c.table_catalog = t.table_catalog "
+                f"AND c.table_schema = t.table_schema "
+                f"AND c.table_name = t.table_name "
+                f"WHERE c.table_schema = '{schema_name}' "
+                f"AND t.table_type = '{object_type}'"
+                f"{table_predicate(self._config, 'c.table_name', NAME_DIALECT)}")
+
+    def _get_dataset_query(self, schema_name: str, entry_type: EntryType) -> str:
+        """Query for the columns of tables or views in a schema."""
+        short_type = entry_type.name  # table or view, or the title of enum value
+        if ( short_type == "TABLE" ):
+            object_type = "BASE TABLE"
+        else:
+            object_type = "VIEW"
+        return self._get_columns(schema_name, object_type)
+
+    def _get_dataset_order_by(self) -> str:
+        """Orders dataset rows by table, then column position. Used by the Python connector only"""
+        return "c.table_name, c.ordinal_position"
+
+    def _get_schema_dataset_query(self, schema_name: str) -> str:
+        """Returns list of columns of both tables and views in a schema, with the object type of each"""
+        return (f"SELECT CASE t.table_type WHEN 'BASE TABLE' THEN '{EntryType.TABLE.name}' "
+                f"ELSE '{EntryType.VIEW.name}' END AS {COLUMN_OBJECT_TYPE}, "
+                f"c.table_name, c.column_name, "
+                f"c.data_type, c.is_nullable "
+                f"FROM information_schema.columns c "
+                f"JOIN information_schema.tables t ON  "
+                f"c.table_catalog = t.table_catalog "
+                f"AND c.table_schema = t.table_schema "
+                f"AND c.table_name = t.table_name "
+                f"WHERE c.table_schema = '{schema_name}' "
+                f"AND t.table_type IN ('BASE TABLE', 'VIEW')"
+                f"{table_predicate(self._config, 'c.table_name', NAME_DIALECT)}")
+
+    def _get_all_columns(self) -> str:
+        """Returns list of columns in all tables and views of all schemas"""
+        return (f"SELECT c.table_schema AS {COLUMN_SCHEMA_NAME}, "
+                f"CASE t.table_type WHEN 'BASE TABLE' THEN '{EntryType.TABLE.name}' "
+                f"ELSE '{EntryType.VIEW.name}' END AS {COLUMN_OBJECT_TYPE}, "
+                f"c.table_name, c.column_name, "
+                f"c.data_type, c.is_nullable "
+                f"FROM information_schema.columns c "
+                f"JOIN information_schema.tables t ON  "
+                f"c.table_catalog = t.table_catalog "
+                f"AND c.table_schema = t.table_schema "
+                f"AND c.table_name = t.table_name "
+                f"WHERE t.table_type IN ('BASE TABLE', 'VIEW') "
+                f"AND c.table_schema IN ({self._get_schemas_query()})"
+                f"{table_predicate(self._config, 'c.table_name', NAME_DIALECT)}")
+
+    def _get_schema_last_modified_query(self) -> str:
+        """Query for latest alteration time and number of tables and views in each schema."""
+        return (f"SELECT table_schema AS {COLUMN_SCHEMA_NAME}, "
+                f"MAX(last_altered) AS {COLUMN_LAST_MODIFIED}, "
+                f"COUNT(*) AS {COLUMN_OBJECT_COUNT} "
+                f"FROM information_schema.tables "
+                f"WHERE table_type IN ('BASE TABLE', 'VIEW') "
+                f"AND table_schema IN ({self._get_schemas_query()})"
+                f"{table_predicate(self._config, 'table_name', NAME_DIALECT)} "
+                f"GROUP BY table_schema")
@@ -0,0 +1,44 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""SQLite stand-in for the Snowflake information_schema views read by snowflake_queries.py."""
+from src.common.stand_in import StandInConnector
+from src.common.stand_in import regexp_like
+from src.snowflake_queries import SnowflakeQueries
+
+class SnowflakeStandInConnector(SnowflakeQueries, StandInConnector):
+    """Runs the Snowflake metadata queries against information_schema tables in SQLite."""
+
+    ATTACHED_SCHEMAS = ["information_schema"]
+
+    FUNCTIONS = {"rlike": regexp_like}
+
+    DDL = [
+        "CREATE TABLE IF NOT EXISTS information_schema.schemata (catalog_name TEXT, schema_name TEXT)",
+        "CREATE TABLE IF NOT EXISTS information_schema.tables (table_catalog TEXT, table_schema TEXT, "
+        "table_name TEXT, table_type TEXT, last_altered TEXT)",
+        "CREATE TABLE IF NOT EXISTS information_schema.columns (table_catalog TEXT, table_schema TEXT, "
+        "table_name TEXT, column_name TEXT, ordinal_position INTEGER, data_type TEXT, is_nullable TEXT)",
+        "CREATE INDEX IF NOT EXISTS information_schema.columns_table ON columns (table_catalog, table_schema, table_name)",
+    ]
+
+    POPULATE = [
+        "INSERT INTO information_schema.schemata SELECT :database, schema_name FROM catalog_schemas",
+        "INSERT INTO information_schema.schemata VALUES (:database, 'INFORMATION_SCHEMA')",
+        "INSERT INTO information_schema.tables SELECT :database, schema_name, table_name, "
+        "CASE object_type WHEN 'TABLE' THEN 'BASE TABLE' ELSE 'VIEW' END, :ddl_time FROM catalog_objects",
+        "INSERT INTO information_schema.columns SELECT :database, o.schema_name, o.table_name, c.column_name, "
+        "c.ordinal_position, c.data_type, CASE c.nullable WHEN 1 THEN 'YES' ELSE 'NO' END "
+        "FROM catalog_columns c JOIN catalog_objects o ON o.object_id = c.object_id",
+    ]
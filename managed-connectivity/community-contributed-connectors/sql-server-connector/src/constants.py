@@ -22,10 +22,26 @@ SOURCE_TYPE = "sqlserver"
 # Default JDBC jar file. Can override with --jar
 JDBC_JAR = "mssql-jdbc-12.10.0.jre11.jar"
 
+# Default Spark JDBC read options. Can override with --fetch_size, --query_timeout, --session_init_statement and --push_down_predicate
+JDBC_READ_OPTIONS = {
+    "fetchsize": "10000",
+}
+
 # Allow common bootstrap code to dynamically load connector for specific datasource
 CONNECTOR_MODULE = "src.sqlserver_connector"
 CONNECTOR_CLASS = "SQLServerConnector"
 
+# Connector using a native Python driver instead of Spark, selected with --engine python
+PYTHON_CONNECTOR_MODULE = "src.sqlserver_python_connector"
+PYTHON_CONNECTOR_CLASS = "SQLServerPythonConnector"
+
+# SQLite stand-in for the dictionary views read by the connector, run with python -m src.common.stand_in
+STAND_IN_MODULE = "src.sqlserver_stand_in"
+STAND_IN_CLASS = "SQLServerStandInConnector"
+
+# ODBC driver used by the Python connector
+ODBC_DRIVER = "ODBC Driver 18 for SQL Server"
+
 # Value to test for if column is nullable. SQL Server specific. Matches _get_dataset  
 IS_NULLABLE_TRUE = "Y"
 
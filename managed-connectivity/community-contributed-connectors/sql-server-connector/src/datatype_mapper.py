@@ -14,16 +14,17 @@
 
 # Maps data types from SQL Server to Dataplex Catalog
 
-def get_catalog_metadata_type(data_type: str) -> str:
-    """Choose the metadata type based on SQL Server native type."""
-    if data_type in ["bigint", "int", "smallint", "tinyint", "decimal", "numeric", "smallmoney", "money", "float", "real"]:
-        return "NUMBER"
-    if data_type in ["varchar", "nvarchar", "char", "nchar", "text", "ntext", "xml"]:
-        return "STRING"
-    if data_type in ["binary", "varbinary", "image", "geography", "geometry"]:
-        return "BYTES"
-    if data_type in ["date", "datetime", "datetime2", "smalldatetime", "datetimeoffset"]:
-        return "DATETIME"
-    if data_type in ["time"]:
-        return "TIME"
-    return "OTHER"
\ No newline at end of file
+# Data types matched exactly, by metadata type
+EXACT_RULES = {
+    "NUMBER": ["bigint", "int", "smallint", "tinyint", "decimal", "numeric", "smallmoney", "money", "float", "real"],
+    "STRING": ["varchar", "nvarchar", "char", "nchar", "text", "ntext", "xml"],
+    "BYTES": ["binary", "varbinary", "image", "geography", "geometry"],
+    "DATETIME": ["date", "datetime", "datetime2", "smalldatetime", "datetimeoffset"],
+    "TIME": ["time"],
+}
+
+# Data type prefixes, by metadata type. The longest matching prefix is used if there is no exact match
+PREFIX_RULES = {}
+
+# Metadata type of data types matching no rule
+DEFAULT_METADATA_TYPE = "OTHER"
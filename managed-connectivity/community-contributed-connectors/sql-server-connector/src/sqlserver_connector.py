@@ -14,14 +14,19 @@
 
 """Reads SQL Server using PySpark."""
 from typing import Dict
-from pyspark.sql import SparkSession, DataFrame
+from pyspark.sql import DataFrame
 from src.common.ExternalSourceConnector import IExternalSourceConnector
+from src.common.query_ledger import LEDGER
 from src.constants import EntryType
 from src.common.util import fileExists
 from src.common.connection_jar import getJarPath
+from src.common.spark_session import get_spark_session
 from src.constants import JDBC_JAR
+from src.constants import JDBC_READ_OPTIONS
+from src.common.jdbc_options import get_read_options
+from src.sqlserver_queries import SQLServerQueries
 
-class SQLServerConnector(IExternalSourceConnector):
+class SQLServerConnector(SQLServerQueries, IExternalSourceConnector):
     """Reads data from SQL Server and returns Spark Dataframes."""
 
     def __init__(self, config: Dict[str, str]):
@@ -31,10 +36,7 @@ class SQLServerConnector(IExternalSourceConnector):
         # Check jdbc jar file exist. Throws exception if not found
         jarsExist = fileExists(jar_path)
 
-        self._spark = SparkSession.builder.appName("SQLServerIngestor") \
-            .config("spark.jars", jar_path) \
-            .config("spark.log.level", "ERROR") \
-            .getOrCreate()
+        self._spark = get_spark_session("SQLServerIngestor", jar_path, config)
 
         self._config = config
 
@@ -54,43 +56,40 @@ class SQLServerConnector(IExternalSourceConnector):
             "authentication" : config['authentication'],
             "trustServerCertificate": config['trust_server_certificate']
             }
+        self._connectOptions.update(get_read_options(config, JDBC_READ_OPTIONS))
         
         if config.get('hostname_in_certificate') is not None:
             self._connectOptions.hostNameInCertificate = config['hostname_in_certificate']
 
     def _execute(self, query: str) -> DataFrame:
-        """A generic method to execute any query."""
+        """A generic method to execute any query. The result is read once and persisted, see QueryLedger.materialize"""
 
-        return self._spark.read.format("jdbc") \
+        df = self._spark.read.format("jdbc") \
                 .options(**self._connectOptions) \
                 .option("query", query) \
                 .load()
+        return LEDGER.materialize(query, df)
 
     def get_db_schemas(self) -> DataFrame:
         """Gets a list of schemas in the database"""
-        query = """
-        SELECT s.name AS SCHEMA_NAME
-        FROM sys.schemas s
-        WHERE s.name NOT in ('db_accessadmin','db_backupoperator','db_datareader','db_datawriter','db_ddladmin','db_denydatareader','db_denydatawriter','db_owner','db_securityadmin','guest','sys','INFORMATION_SCHEMA')
-        """
-        return self._execute(query)
-
-    def _get_columns(self, schema_name: str, object_type: str) -> str:
-        """Gets a list of columns in tables or views."""
-        return (f"SELECT t.name AS TABLE_NAME, "
-                f"c.name AS COLUMN_NAME, "
-                f"ty.name AS DATA_TYPE, "
-                f"c.is_nullable AS IS_NULLABLE "
-                f"FROM sys.columns c "
-                f"JOIN sys.tables t ON t.object_id = c.object_id "
-                f"JOIN sys.types ty ON ty.user_type_id = c.system_type_id "
-                f"JOIN sys.schemas s ON s.schema_id = t.schema_id "
-                f"WHERE s.name = '{schema_name}' "
-                f"AND t.type = '{object_type}'")
+        return self._execute(self._get_schemas_query())
 
     def get_dataset(self, schema_name: str, entry_type: EntryType):
         """Gets data for a table or view."""
-        # Dataset means that these entities can contain end user data.
-        short_type = {"TABLE":"U", "VIEW":"V"}
-        query = self._get_columns(schema_name, short_type[entry_type.name])
-        return self._execute(query)
+        return self._execute(self._get_dataset_query(schema_name, entry_type))
+
+    def get_schema_datasets(self, schema_name: str) -> DataFrame:
+        """Gets data for both tables and views in a schema with a single query."""
+        return self._execute(self._get_schema_dataset_query(schema_name))
+
+    def get_all_datasets(self) -> DataFrame:
+        """Gets data for all tables and views in the database with a single query."""
+        return self._execute(self._get_all_columns())
+
+    def get_databases(self) -> DataFrame:
+        """Gets a list of user databases on the server."""
+        return self._execute(self._get_databases_query())
+
+    def get_schema_last_modified(self) -> DataFrame:
+        """Gets latest modify date and number of tables and views in each schema."""
+        return self._execute(self._get_schema_last_modified_query())
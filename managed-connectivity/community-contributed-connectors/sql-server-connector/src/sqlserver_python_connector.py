@@ -0,0 +1,56 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Reads SQL Server using the pyodbc driver, without Spark."""
+from typing import Dict
+import pyodbc
+from src.common.dbapi_connector import DbApiConnector
+from src.sqlserver_queries import SQLServerQueries
+from src.constants import ODBC_DRIVER
+
+def _yes_no(value: bool) -> str:
+    return "yes" if value else "no"
+
+def _escape(value: str) -> str:
+    """Escapes a value for an ODBC connection string."""
+    return "{" + value.replace("}", "}}") + "}"
+
+class SQLServerPythonConnector(SQLServerQueries, DbApiConnector):
+    """Reads data from SQL Server and returns row iterators."""
+
+    def __init__(self, config: Dict[str, str]):
+        if config['instancename'] and len(config['instancename']) > 0:
+            server = f"{config['host']}\\{config['instancename']},{config['port']}"
+        else:
+            server = f"{config['host']},{config['port']}"
+
+        options = {
+            "DRIVER": f"{{{ODBC_DRIVER}}}",
+            "SERVER": server,
+            "DATABASE": _escape(config['database']),
+            "UID": _escape(config['user']),
+            "PWD": _escape(config['password']),
+            "Encrypt": _yes_no(config['encrypt']),
+            "TrustServerCertificate": _yes_no(config['trust_server_certificate']),
+            }
+
+        if config.get('hostname_in_certificate') is not None:
+            options["HostNameInCertificate"] = config['hostname_in_certificate']
+
+        if config['authentication'] != "NotSpecified":
+            options["Authentication"] = config['authentication']
+
+        connection_string = ";".join(f"{key}={value}" for key, value in options.items())
+        connection = pyodbc.connect(connection_string, timeout=config['login_timeout'])
+        super().__init__(config, connection)
@@ -0,0 +1,118 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Metadata queries for SQL Server, shared by the Spark and Python connectors."""
+from typing import Dict
+from src.constants import EntryType
+from src.common.entry_constants import COLUMN_SCHEMA_NAME
+from src.common.entry_constants import COLUMN_OBJECT_TYPE
+from src.common.entry_constants import COLUMN_LAST_MODIFIED
+from src.common.entry_constants import COLUMN_OBJECT_COUNT
+from src.common.entry_constants import COLUMN_DATABASE_NAME
+from src.common.name_filter import SqlDialect
+from src.common.name_filter import schema_predicate
+from src.common.name_filter import table_predicate
+
+# Name filters are matched with LIKE, where [ also starts a wildcard. SQL Server has no regular expressions
+NAME_DIALECT = SqlDialect(like_wildcards="%_[")
+
+class SQLServerQueries:
+    """Builds the SQL used to read metadata from SQL Server."""
+
+    _config: Dict[str, str]
+
+    def _get_schemas_query(self) -> str:
+        """Query for the non-system schemas in the database, filtered by --include_schemas and --exclude_schemas."""
+        return f"""
+        SELECT s.name AS SCHEMA_NAME
+        FROM sys.schemas s
+        WHERE s.name NOT in ('db_accessadmin','db_backupoperator','db_datareader','db_datawriter','db_ddladmin','db_denydatareader','db_denydatawriter','db_owner','db_securityadmin','guest','sys','INFORMATION_SCHEMA'){schema_predicate(self._config, "s.name", NAME_DIALECT)}
+        """
+
+    def _get_databases_query(self) -> str:
+        """Query for the online user databases on the instance. Ids 1 to 4 are the system databases"""
+        return (f"SELECT name AS {COLUMN_DATABASE_NAME} "
+                f"FROM sys.databases "
+                f"WHERE database_id > 4 AND state_desc = 'ONLINE'")
+
+    def _get_columns(self, schema_name: str, object_type: str) -> str:
+        """Gets a list of columns in tables or views, filtered by --include_tables and --exclude_tables."""
+        # sys.objects holds both user tables (U) and views (V), sys.tables only tables
+        return (f"SELECT o.name AS TABLE_NAME, "
+                f"c.name AS COLUMN_NAME, "
+                f"ty.name AS DATA_TYPE, "
+                f"c.is_nullable AS IS_NULLABLE "
+                f"FROM sys.columns c "
+                f"JOIN sys.objects o ON o.object_id = c.object_id "
+                f"JOIN sys.types ty ON ty.user_type_id = c.system_type_id "
+                f"JOIN sys.schemas s ON s.schema_id = o.schema_id "
+                f"WHERE s.name = '{schema_name}' "
+                f"AND o.type = '{object_type}'"
+                f"{table_predicate(self._config, 'o.name', NAME_DIALECT)}")
+
+    def _get_dataset_query(self, schema_name: str, entry_type: EntryType) -> str:
+        """Query for the columns of tables or views in a schema."""
+        short_type = {"TABLE":"U", "VIEW":"V"}
+        return self._get_columns(schema_name, short_type[entry_type.name])
+
+    def _get_dataset_order_by(self) -> str:
+        """Orders dataset rows by table, then column position. Used by the Python connector only"""
+        return "o.name, c.column_id"
+
+    def _get_schema_dataset_query(self, schema_name: str) -> str:
+        """Query for the columns of both tables and views in a schema, with the object type of each."""
+        # sys.objects holds both user tables (U) and views (V)
+        return (f"SELECT CASE o.type WHEN 'U' THEN '{EntryType.TABLE.name}' "
+                f"ELSE '{EntryType.VIEW.name}' END AS {COLUMN_OBJECT_TYPE}, "
+                f"o.name AS TABLE_NAME, "
+                f"c.name AS COLUMN_NAME, "
+                f"ty.name AS DATA_TYPE, "
+                f"c.is_nullable AS IS_NULLABLE "
+                f"FROM sys.columns c "
+                f"JOIN sys.objects o ON o.object_id = c.object_id "
+                f"JOIN sys.types ty ON ty.user_type_id = c.system_type_id "
+                f"JOIN sys.schemas s ON s.schema_id = o.schema_id "
+                f"WHERE s.name = '{schema_name}' "
+                f"AND o.type IN ('U', 'V')"
+                f"{table_predicate(self._config, 'o.name', NAME_DIALECT)}")
+
+    def _get_all_columns(self) -> str:
+        """Gets a list of columns in all tables and views of all schemas."""
+        # sys.objects holds both user tables (U) and views (V)
+        return (f"SELECT s.name AS {COLUMN_SCHEMA_NAME}, "
+                f"CASE o.type WHEN 'U' THEN '{EntryType.TABLE.name}' "
+                f"ELSE '{EntryType.VIEW.name}' END AS {COLUMN_OBJECT_TYPE}, "
+                f"o.name AS TABLE_NAME, "
+                f"c.name AS COLUMN_NAME, "
+                f"ty.name AS DATA_TYPE, "
+                f"c.is_nullable AS IS_NULLABLE "
+                f"FROM sys.columns c "
+                f"JOIN sys.objects o ON o.object_id = c.object_id "
+                f"JOIN sys.types ty ON ty.user_type_id = c.system_type_id "
+                f"JOIN sys.schemas s ON s.schema_id = o.schema_id "
+                f"WHERE o.type IN ('U', 'V') "
+                f"AND s.name IN ({self._get_schemas_query()})"
+                f"{table_predicate(self._config, 'o.name', NAME_DIALECT)}")
+
+    def _get_schema_last_modified_query(self) -> str:
+        """Query for latest modify date and number of tables and views in each schema."""
+        return (f"SELECT s.name AS {COLUMN_SCHEMA_NAME}, "
+                f"MAX(o.modify_date) AS {COLUMN_LAST_MODIFIED}, "
+                f"COUNT(*) AS {COLUMN_OBJECT_COUNT} "
+                f"FROM sys.objects o "
+                f"JOIN sys.schemas s ON s.schema_id = o.schema_id "
+                f"WHERE o.type IN ('U', 'V') "
+                f"AND s.name IN ({self._get_schemas_query()})"
+                f"{table_predicate(self._config, 'o.name', NAME_DIALECT)} "
+                f"GROUP BY s.name")
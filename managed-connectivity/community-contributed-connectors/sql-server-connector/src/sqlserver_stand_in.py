@@ -0,0 +1,46 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""SQLite stand-in for the SQL Server catalog views read by sqlserver_queries.py."""
+from src.common.stand_in import StandInConnector
+from src.sqlserver_queries import SQLServerQueries
+
+class SQLServerStandInConnector(SQLServerQueries, StandInConnector):
+    """Runs the SQL Server metadata queries against sys catalog view tables in SQLite."""
+
+    ATTACHED_SCHEMAS = ["sys"]
+
+    DDL = [
+        "CREATE TABLE IF NOT EXISTS sys.schemas (schema_id INTEGER PRIMARY KEY, name TEXT)",
+        "CREATE TABLE IF NOT EXISTS sys.objects (object_id INTEGER PRIMARY KEY, schema_id INTEGER, name TEXT, "
+        "type TEXT, modify_date TEXT)",
+        "CREATE TABLE IF NOT EXISTS sys.columns (object_id INTEGER, name TEXT, column_id INTEGER, "
+        "system_type_id INTEGER, is_nullable INTEGER)",
+        "CREATE INDEX IF NOT EXISTS sys.columns_object ON columns (object_id)",
+        "CREATE TABLE IF NOT EXISTS sys.types (system_type_id INTEGER, user_type_id INTEGER PRIMARY KEY, name TEXT)",
+        "CREATE TABLE IF NOT EXISTS sys.databases (database_id INTEGER, name TEXT, state_desc TEXT)",
+    ]
+
+    POPULATE = [
+        "INSERT INTO sys.schemas SELECT schema_id, schema_name FROM catalog_schemas",
+        # System schemas, which are not extracted
+        "INSERT INTO sys.schemas (name) VALUES ('sys'), ('guest'), ('INFORMATION_SCHEMA'), ('db_owner')",
+        "INSERT INTO sys.objects SELECT object_id, schema_id, table_name, "
+        "CASE object_type WHEN 'TABLE' THEN 'U' ELSE 'V' END, :ddl_time FROM catalog_objects",
+        "INSERT INTO sys.types SELECT type_id, type_id, data_type FROM catalog_types",
+        "INSERT INTO sys.columns SELECT object_id, column_name, ordinal_position, type_id, nullable FROM catalog_columns",
+        # Ids 1 to 4 are the system databases
+        "INSERT INTO sys.databases VALUES (1, 'master', 'ONLINE'), (2, 'tempdb', 'ONLINE'), (3, 'model', 'ONLINE'), "
+        "(4, 'msdb', 'ONLINE'), (5, :database, 'ONLINE'), (6, 'offline_database', 'OFFLINE')",
+    ]
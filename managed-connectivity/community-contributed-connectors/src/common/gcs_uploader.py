@@ -14,8 +14,11 @@
 
 """Sends files to Cloud Storage."""
 from typing import Dict
+from functools import lru_cache
+from urllib.parse import urlparse
 from google.cloud import storage
 import logging
+import os
 
 def upload(config: Dict[str, str], fileDirectory: str, filename: str, folder: str):
     """Uploads a file to a Cloud Storage bucket."""
@@ -25,8 +28,48 @@ def upload(config: Dict[str, str], fileDirectory: str, filename: str, folder: st
     blob = bucket.blob(f"{folder}/{filename}")
     blob.upload_from_filename(f"{fileDirectory}/{filename}")
 
+def upload_manifest(config: Dict[str, str], manifest: Dict, folder: str):
+    """Publishes the shard files listed in a manifest to a Cloud Storage folder.
+    Shards staged in Cloud Storage are copied server-side, local shards are uploaded"""
+    client = storage.Client()
+    bucket = client.get_bucket((config["output_bucket"]))
+
+    for shard in manifest["files"]:
+        blob = bucket.blob(f"{folder}/{shard['name']}")
+        uri = urlparse(shard["uri"])
+        if uri.scheme == "gs":
+            source_blob = client.bucket(uri.netloc).blob(uri.path.lstrip("/"))
+            # rewrite supports large objects and copies across buckets in multiple calls
+            token, _, _ = blob.rewrite(source_blob)
+            while token is not None:
+                token, _, _ = blob.rewrite(source_blob, token=token)
+        else:
+            blob.upload_from_filename(uri.path)
+
+def read_text(uri: str) -> str:
+    """Reads a text file from a local path or gs:// URI. Returns None if it does not exist"""
+    parsed_uri = urlparse(uri)
+    if parsed_uri.scheme == "gs":
+        blob = storage.Client().bucket(parsed_uri.netloc).blob(parsed_uri.path.lstrip("/"))
+        return blob.download_as_text() if blob.exists() else None
+    if not os.path.exists(uri):
+        return None
+    with open(uri, "r", encoding="utf-8") as file:
+        return file.read()
+
+def write_text(uri: str, text: str):
+    """Writes a text file to a local path or gs:// URI."""
+    parsed_uri = urlparse(uri)
+    if parsed_uri.scheme == "gs":
+        blob = storage.Client().bucket(parsed_uri.netloc).blob(parsed_uri.path.lstrip("/"))
+        blob.upload_from_string(text)
+    else:
+        with open(uri, "w", encoding="utf-8") as file:
+            file.write(text)
+
+@lru_cache(maxsize=None)
 def checkDestination(bucketpath: str):
-    """Check Cloud Storage output folder exists"""
+    """Check Cloud Storage output folder exists. Cached, as sources extracted together share a bucket"""
     client = storage.Client()
 
     if bucketpath.startswith("gs://"):
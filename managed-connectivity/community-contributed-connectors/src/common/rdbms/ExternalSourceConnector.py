@@ -13,10 +13,16 @@
 # limitations under the License.
 
 from src.constants import EntryType
-from pyspark.sql import DataFrame
+from typing import TYPE_CHECKING
 from abc import ABC, abstractmethod
 
+# Spark is only needed for type hints, so connectors using Python drivers run without it
+if TYPE_CHECKING:
+    from pyspark.sql import DataFrame
+
 # Interface defines methods for connector to pass metadata to common connector logic
+# Spark connectors return dataframes, connectors using Python drivers (--engine python) return row tuples.
+# Dataframes are read from the source once and persisted, and are unpersisted by the caller once used
 class IExternalSourceConnector(ABC):
 
     @abstractmethod
@@ -25,6 +31,30 @@ class IExternalSourceConnector(ABC):
         pass
 
     @abstractmethod
-    def get_db_schemas(self) -> DataFrame:
+    def get_db_schemas(self) -> "DataFrame":
         """Returns dataframe of schemas to extract objects from"""
-        pass
\ No newline at end of file
+        pass
+
+    def get_schema_datasets(self, schema_name: str) -> "DataFrame":
+        """Returns db object data of all object types in a schema in a single dataframe.
+        Columns are OBJECT_TYPE (EntryType name, eg. TABLE or VIEW) plus the columns returned by get_dataset.
+        Optional: returns None if the connector reads each object type with a separate query"""
+        return None
+
+    def get_all_datasets(self) -> "DataFrame":
+        """Returns db object data for all schemas in a single dataframe.
+        Columns are SCHEMA_NAME, OBJECT_TYPE (EntryType name, eg. TABLE or VIEW) plus
+        the columns returned by get_dataset.
+        Optional: returns None if the connector only supports extraction per schema"""
+        return None
+
+    def get_schema_last_modified(self) -> "DataFrame":
+        """Returns dataframe with SCHEMA_NAME, LAST_MODIFIED (latest DDL change of the
+        tables and views in the schema) and OBJECT_COUNT for each schema.
+        Optional: returns None if the source has no cheap way to detect schema changes"""
+        return None
+
+    def get_databases(self) -> "DataFrame":
+        """Returns dataframe with DATABASE_NAME of each user database on the instance, for --all_databases.
+        Optional: returns None if the connector cannot list the databases of the instance"""
+        return None
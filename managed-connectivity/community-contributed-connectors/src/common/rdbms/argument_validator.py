@@ -14,6 +14,15 @@
 
 from src.common.gcs_uploader import checkDestination
 from src.common.secret_manager import get_password
+from src.common.run_report import REPORT
+from src.common.run_report import PHASE_SECRET_FETCH
+from src.common.run_report import PHASE_BUCKET_CHECK
+from src.common.run_report import SINK_CLOUD_LOGGING
+from src.common.synthetic_catalog import parse_shape
+from src.common.synthetic_catalog import parse_type_mix
+from src.common.name_filter import FILTER_GLOB
+from src.common.name_filter import FILTER_REGEX
+from src.common.name_filter import parse_patterns
 import argparse
 import sys
 import re
@@ -22,27 +31,202 @@ import logging
 GCP_REGIONS = ['asia-east1', 'asia-east2', 'asia-northeast1', 'asia-northeast2', 'asia-northeast3', 'asia-south1', 'asia-south2', 'asia-southeast1', 'asia-southeast2', 'australia-southeast1', 'australia-southeast2', 'europe-central2', 'europe-north1', 'europe-southwest1', 'europe-west1', 'europe-west2', 'europe-west3',
                'europe-west4', 'europe-west6', 'europe-west8', 'europe-west9', 'europe-west12', 'me-central1', 'me-west1', 'northamerica-northeast1', 'northamerica-northeast2', 'southamerica-east1', 'southamerica-east2', 'us-central1', 'us-east1', 'us-east4', 'us-east5', 'us-south1', 'us-west1', 'us-west2', 'us-west3', 'us-west4']
 
+# Extraction engines. Spark reads through JDBC, python reads with the native Python driver of the source
+ENGINE_SPARK = "spark"
+ENGINE_PYTHON = "python"
+
 # Standard validation checks and value replacements. Additional checks can be applied in cmd_reader for specific data sources
 def validateArguments(parsed_args):
 
     if parsed_args.local_output_only == False and (parsed_args.output_bucket is None or parsed_args.output_folder is None):
         raise Exception("both --output_bucket and --output_folder must be supplied if not using --local_output_only")
 
-    if not parsed_args.local_output_only and not checkDestination(parsed_args.output_bucket):
-        raise Exception(f"--output_bucket {parsed_args.output_bucket} is not valid")
+    if not parsed_args.local_output_only:
+        with REPORT.phase(PHASE_BUCKET_CHECK):
+            destination_valid = checkDestination(parsed_args.output_bucket)
+        if not destination_valid:
+            raise Exception(f"--output_bucket {parsed_args.output_bucket} is not valid")
 
     if parsed_args.target_location_id not in (GCP_REGIONS + ['global']):
         raise Exception(f"--target_location_id must be valid google cloud region or 'global' : {parsed_args.target_location_id}")
 
-    if parsed_args.password_secret is not None:
+    # No password is needed when metadata is served from a fake catalog instead of the source
+    if parsed_args.password_secret is not None and parsed_args.fake_catalog is None:
 
         validateSecretID(parsed_args.password_secret)
 
-        parsed_args.password = get_password(parsed_args.password_secret)
+        with REPORT.phase(PHASE_SECRET_FETCH):
+            parsed_args.password = get_password(parsed_args.password_secret)
+
+    if parsed_args.parallelism < 1:
+        raise Exception(f"--parallelism must be 1 or greater : {parsed_args.parallelism}")
+
+    if parsed_args.max_queries_per_second is not None and parsed_args.max_queries_per_second <= 0:
+        raise Exception(f"--max_queries_per_second must be greater than 0 : {parsed_args.max_queries_per_second}")
+
+    if parsed_args.throttle_latency_factor is not None and parsed_args.throttle_latency_factor <= 1:
+        raise Exception(f"--throttle_latency_factor must be greater than 1 : {parsed_args.throttle_latency_factor}")
+
+    if parsed_args.max_buffer_mb < 1:
+        raise Exception(f"--max_buffer_mb must be 1 or greater : {parsed_args.max_buffer_mb}")
+
+    if parsed_args.shard_max_entries < 1:
+        raise Exception(f"--shard_max_entries must be 1 or greater : {parsed_args.shard_max_entries}")
+
+    if parsed_args.shard_max_mb is not None and parsed_args.shard_max_mb < 1:
+        raise Exception(f"--shard_max_mb must be 1 or greater : {parsed_args.shard_max_mb}")
+
+    if parsed_args.skip_unchanged_schemas and parsed_args.sharded_output:
+        raise Exception("--skip_unchanged_schemas cannot be used with --sharded_output")
+
+    if parsed_args.resume and parsed_args.sharded_output:
+        raise Exception("--resume cannot be used with --sharded_output")
+
+    if parsed_args.engine == ENGINE_PYTHON and parsed_args.sharded_output:
+        raise Exception("--sharded_output requires --engine spark")
+
+    if parsed_args.engine == ENGINE_PYTHON and parsed_args.parallelism > 1:
+        raise Exception("--parallelism requires --engine spark")
+
+    parsed_args.spark_conf = parseSparkConf(parsed_args.spark_conf)
+
+    parsed_args.synthetic_shape = parse_shape(parsed_args.synthetic_shape)
+    if parsed_args.synthetic_type_mix is not None:
+        parsed_args.synthetic_type_mix = parse_type_mix(parsed_args.synthetic_type_mix)
+
+    parsed_args = validateFilterArguments(parsed_args)
+
+    return parsed_args
+
+# Converts --spark_conf key=value settings overriding the Spark session profile to a dict
+def parseSparkConf(settings: list) -> dict:
+    spark_conf = {}
+    for setting in settings or []:
+        key, separator, value = setting.partition("=")
+        if not separator or len(key.strip()) == 0:
+            raise Exception(f"--spark_conf must be in the form key=value : {setting}")
+        spark_conf[key.strip()] = value.strip()
+    return spark_conf
+
+# Arguments controlling the extraction pipeline, common to all connectors
+def addPipelineArguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--engine", type=str, required=False, choices=[ENGINE_SPARK, ENGINE_PYTHON], default=ENGINE_SPARK,
+                        help="Read metadata with Spark through JDBC, or with the native Python driver without starting Spark")
+    parser.add_argument("--datatype_mapping_file", type=str, required=False,
+                        help="Local path or gs:// URI of a json file with data type mapping rules which override the rules of the connector")
+    parser.add_argument("--spark_conf", type=str, required=False, action="append",
+                        help="Spark setting as key=value, overriding the session profile of the connector. Can be repeated")
+    parser.add_argument("--parallelism", type=int, required=False, default=1,
+                        help="Number of schemas/object types to extract concurrently")
+    parser.add_argument("--max_queries_per_second", type=float, required=False,
+                        help="Maximum number of metadata queries started against the source each second")
+    parser.add_argument("--throttle_latency_factor", type=float, required=False,
+                        help="Cut concurrency, then pause between queries, while query latency is above this multiple of the latency of the first queries")
+    parser.add_argument("--streaming_output", action="store_true",
+                        help="Stream entries to the output file one Spark partition at a time instead of collecting each schema in driver memory")
+    parser.add_argument("--max_buffer_mb", type=int, required=False, default=16,
+                        help="Maximum size in MB of output buffered in memory before it is written to file")
+    parser.add_argument("--sharded_output", action="store_true",
+                        help="Write entries as sharded JSONL files directly from the Spark executors, listed in a manifest")
+    parser.add_argument("--shard_max_entries", type=int, required=False, default=100000,
+                        help="Maximum number of entries per shard file")
+    parser.add_argument("--shard_max_mb", type=int, required=False,
+                        help="Approximate maximum size in MB of each shard file")
+    parser.add_argument("--shard_compression", type=str, required=False, choices=['none','gzip'], default='none',
+                        help="Compression of shard files")
+    parser.add_argument("--shard_staging_uri", type=str, required=False,
+                        help="Local directory or gs:// path where executors write shard files. Each run writes to a new subdirectory. Defaults to a directory under 'output'. Use a gs:// path when running on a cluster")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Output only entries which are new or changed since the previous run, for use with INCREMENTAL entry sync")
+    parser.add_argument("--state_file", type=str, required=False,
+                        help="Local path or gs:// URI of the file holding entry content hashes between runs. Defaults to a file in 'output'")
+    parser.add_argument("--skip_unchanged_schemas", action="store_true",
+                        help="Skip extraction of schemas whose tables and views have not changed since the previous run, reusing their previous entries")
+    parser.add_argument("--schema_state_dir", type=str, required=False,
+                        help="Local directory holding the entries of each schema between runs. Defaults to a directory in 'output'")
+    parser.add_argument("--resume", action="store_true",
+                        help="Resume a failed run from its progress journal, extracting only the schemas which were not completed")
+    parser.add_argument("--fake_catalog", type=str, required=False,
+                        help="Read metadata from a CSV or Parquet catalog dump, or 'synthetic' to generate a catalog, instead of the source database. The password secret is not read")
+    parser.add_argument("--synthetic_shape", type=str, required=False, default="10x100x10x20",
+                        help="Shape of the --fake_catalog synthetic catalog as schemas x tables x views x columns per table")
+    parser.add_argument("--synthetic_type_mix", type=str, required=False,
+                        help="Data types of the --fake_catalog synthetic catalog as type=weight pairs, eg. integer=40,varchar=40,timestamp=20")
+    parser.add_argument("--report_sink", type=str, required=False,
+                        help=f"Where to send the run report in addition to the 'output' directory: '{SINK_CLOUD_LOGGING}', or a local file each report is appended to")
+    addFilterArguments(parser)
+
+# Arguments filtering the schemas and tables extracted, applied in the metadata queries
+def addFilterArguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--include_schemas", type=str, required=False, action="append",
+                        help="Extract only schemas matching these patterns. Can be repeated")
+    parser.add_argument("--exclude_schemas", type=str, required=False, action="append",
+                        help="Do not extract schemas matching these patterns. Can be repeated")
+    parser.add_argument("--include_tables", type=str, required=False, action="append",
+                        help="Extract only tables and views matching these patterns. Can be repeated")
+    parser.add_argument("--exclude_tables", type=str, required=False, action="append",
+                        help="Do not extract tables and views matching these patterns. Can be repeated")
+    parser.add_argument("--filter_syntax", type=str, required=False, choices=[FILTER_GLOB, FILTER_REGEX], default=FILTER_GLOB,
+                        help="Filter patterns are comma separated globs, where * matches any characters and ? one character, or a regular expression per argument")
+
+# Validation checks and value replacements for the arguments added by addFilterArguments
+def validateFilterArguments(parsed_args):
+
+    for argument in ['include_schemas', 'exclude_schemas', 'include_tables', 'exclude_tables']:
+        try:
+            setattr(parsed_args, argument, parse_patterns(getattr(parsed_args, argument), parsed_args.filter_syntax))
+        except Exception as ex:
+            raise Exception(f"--{argument}: {ex}")
 
     return parsed_args
 
 
+# JDBC read tuning arguments, for connectors reading through a JDBC driver. Unset arguments keep the defaults of the source
+def addJdbcArguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--fetch_size", type=int, required=False,
+                        help="Number of rows fetched from the database in each round trip. Also used with --engine python")
+    parser.add_argument("--query_timeout", type=int, required=False,
+                        help="Seconds a metadata query may run before it is cancelled. 0 for no limit")
+    parser.add_argument("--session_init_statement", type=str, required=False,
+                        help="SQL run on each new database session before metadata is read. An empty value removes the default statement of the source")
+    parser.add_argument("--push_down_predicate", type=true_or_false, required=False,
+                        help="Push filters down to the database [True/False]")
+
+# Validation checks for the arguments added by addJdbcArguments
+def validateJdbcArguments(parsed_args):
+
+    if parsed_args.fetch_size is not None and parsed_args.fetch_size < 1:
+        raise Exception(f"--fetch_size must be 1 or greater : {parsed_args.fetch_size}")
+
+    if parsed_args.query_timeout is not None and parsed_args.query_timeout < 0:
+        raise Exception(f"--query_timeout must be 0 or greater : {parsed_args.query_timeout}")
+
+    return parsed_args
+
+# Arguments to extract several databases of an instance in one run, for connectors of sources with a database level
+def addDatabaseArguments(parser: argparse.ArgumentParser):
+    database_option_group = parser.add_mutually_exclusive_group()
+    database_option_group.add_argument("--databases", type=str, required=False,
+                        help="Comma separated list of databases to extract into a single output, instead of only --database")
+    database_option_group.add_argument("--all_databases", action="store_true",
+                        help="Extract all user databases on the instance into a single output, listed through the --database connection")
+
+# Validation checks and value replacements for the arguments added by addDatabaseArguments
+def validateDatabaseArguments(parsed_args):
+
+    if parsed_args.databases is not None:
+        parsed_args.databases = [database.strip() for database in parsed_args.databases.split(",") if database.strip()]
+        if len(parsed_args.databases) == 0:
+            raise Exception("--databases must list at least one database")
+
+    if (parsed_args.databases or parsed_args.all_databases) and parsed_args.sharded_output:
+        raise Exception("--databases and --all_databases cannot be used with --sharded_output")
+
+    if (parsed_args.databases or parsed_args.all_databases) and parsed_args.skip_unchanged_schemas:
+        raise Exception("--databases and --all_databases cannot be used with --skip_unchanged_schemas")
+
+    return parsed_args
+
 def validateSecretID(secretpath: str) -> bool:
     pattern = r"^projects/[^/]+/secrets/[^/]+$"
 
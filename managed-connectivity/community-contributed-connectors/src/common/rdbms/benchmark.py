@@ -0,0 +1,271 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of the extraction pipeline on a synthetic catalog, run from a connector directory with
+python -m src.common.benchmark. No source database or Google Cloud access is needed"""
+import argparse
+import json
+import os
+import sys
+import time
+from typing import TYPE_CHECKING
+from typing import Dict
+from typing import Iterator
+from typing import Tuple
+from src.constants import SOURCE_TYPE
+from src.constants import DB_OBJECT_TYPES_TO_PROCESS
+from src.constants import TOP_ENTRY_HIERARCHY
+from src.common import bootstrap
+from src.common import entry_builder
+from src.common import python_entry_builder
+from src.common.argument_validator import ENGINE_SPARK
+from src.common.argument_validator import ENGINE_PYTHON
+from src.common.argument_validator import parseSparkConf
+from src.common.entry_constants import COLUMN_OBJECT_TYPE
+from src.common.entry_constants import COLUMN_ENTRY_JSON
+from src.common.entry_state import EntryState
+from src.common.progress_journal import ProgressJournal
+from src.common.synthetic_catalog import SyntheticCatalog
+from src.common.synthetic_catalog import parse_type_mix
+from src.common.fake_connector import FakeConnector
+from src.common.fake_connector import FAKE_CATALOG_SYNTHETIC
+
+# Spark is only imported by benchmarks of the Spark engine
+if TYPE_CHECKING:
+    from pyspark.sql import DataFrame
+
+# Connection details used to name the entries, in place of those of a real source
+BENCHMARK_IDENTITY = {
+    'target_project_id': "benchmark-project",
+    'target_location_id': "us-central1",
+    'target_entry_group_id': "benchmark",
+    'host': "benchmark-host",
+    'port': 0,
+    'instancename': None,
+    'sid': None,
+    'service': "benchmark",
+    'account': "benchmark",
+}
+
+# Pipeline options not varied by the benchmark
+BENCHMARK_PIPELINE = {
+    'incremental': False,
+    'jar': None,
+}
+
+# Benchmark report property names
+KEY_SOURCE_TYPE = 'sourceType'
+KEY_ENGINE = 'engine'
+KEY_SCHEMAS = 'schemas'
+KEY_TABLES_PER_SCHEMA = 'tablesPerSchema'
+KEY_VIEWS_PER_SCHEMA = 'viewsPerSchema'
+KEY_COLUMNS_PER_TABLE = 'columnsPerTable'
+KEY_COLUMN_ROWS = 'columnRows'
+KEY_STAGES = 'stages'
+KEY_SECONDS = 'seconds'
+KEY_ENTRIES = 'entries'
+KEY_BYTES = 'bytes'
+KEY_ENTRIES_PER_SECOND = 'entriesPerSecond'
+KEY_BYTES_PER_SECOND = 'bytesPerSecond'
+KEY_PYTHON_PEAK_RSS_MB = 'pythonPeakRssMb'
+KEY_JVM_PEAK_RSS_MB = 'jvmPeakRssMb'
+
+# Benchmark stages
+STAGE_GENERATE = "generate"
+STAGE_BUILD = "build"
+STAGE_WRITE = "write"
+
+def _peak_rss_mb(pid: int) -> float:
+    """Peak resident memory of a process in MB, from /proc. None where /proc is not available"""
+    try:
+        with open(f"/proc/{pid}/status", "r", encoding="utf-8") as file:
+            for line in file:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return None
+
+def _jvm_pid(spark) -> int:
+    try:
+        return spark._jvm.java.lang.ProcessHandle.current().pid()
+    except Exception:
+        return None
+
+def _stage(seconds: float, entries: int = None, bytes_written: int = None) -> Dict:
+    stage = {KEY_SECONDS: round(seconds, 3)}
+    if entries is not None:
+        stage[KEY_ENTRIES] = entries
+        stage[KEY_ENTRIES_PER_SECOND] = round(entries / seconds, 1) if seconds > 0 else 0
+    if bytes_written is not None:
+        stage[KEY_BYTES] = bytes_written
+        stage[KEY_BYTES_PER_SECOND] = round(bytes_written / seconds, 1) if seconds > 0 else 0
+    return stage
+
+def _json_totals(df: "DataFrame") -> Tuple[int, int]:
+    """Number and total size of the entries of a dataframe. Aggregating the json makes
+    Spark build every entry, where a count alone would skip building them"""
+    import pyspark.sql.functions as F
+    df = entry_builder.to_hashed_json(df)
+    row = df.agg(F.count(F.lit(1)), F.expr(f"sum(octet_length({COLUMN_ENTRY_JSON}))")).collect()[0]
+    return row[0], row[1] or 0
+
+def _python_entries(config: Dict[str, str], catalog: SyntheticCatalog) -> Iterator[Tuple[str, str, str]]:
+    yield from python_entry_builder.build_schemas(config, catalog.schema_names())
+    for schema_name in catalog.schema_names():
+        for entry_type in DB_OBJECT_TYPES_TO_PROCESS:
+            yield from python_entry_builder.build_dataset(config, catalog.dataset_rows(schema_name, entry_type),
+                                                          schema_name, entry_type)
+
+def build_entries(config: Dict[str, str], catalog: SyntheticCatalog, df_catalog: "DataFrame", spark) -> Tuple[int, int]:
+    """Builds the schema, table and view entries of the catalog without writing them.
+    Returns the number of entries and their total size in bytes"""
+    if config['engine'] == ENGINE_PYTHON:
+        entries, bytes_built = 0, 0
+        for _, _, json_string in _python_entries(config, catalog):
+            entries += 1
+            bytes_built += len(json_string.encode("utf-8"))
+        return entries, bytes_built
+
+    import pyspark.sql.functions as F
+    entries, bytes_built = _json_totals(entry_builder.build_schemas(config, catalog.schemas_df(spark)))
+    for entry_type in DB_OBJECT_TYPES_TO_PROCESS:
+        df_raw = df_catalog.filter(F.col(COLUMN_OBJECT_TYPE) == entry_type.name).drop(COLUMN_OBJECT_TYPE)
+        count, size = _json_totals(entry_builder.build_dataset(config, df_raw, None, entry_type))
+        entries += count
+        bytes_built += size
+    return entries, bytes_built
+
+def read_args() -> Dict:
+    """Reads benchmark arguments from the command line."""
+    parser = argparse.ArgumentParser(description=f"Benchmark of the {SOURCE_TYPE} connector pipeline on a synthetic catalog")
+
+    # Shape of the synthetic catalog
+    parser.add_argument("--schemas", type=int, required=False, default=10, help="Number of schemas")
+    parser.add_argument("--tables_per_schema", type=int, required=False, default=100, help="Number of tables in each schema")
+    parser.add_argument("--views_per_schema", type=int, required=False, default=10, help="Number of views in each schema")
+    parser.add_argument("--columns_per_table", type=int, required=False, default=20, help="Number of columns in each table and view")
+    parser.add_argument("--type_mix", type=str, required=False,
+                        help="Data types of the columns as type=weight pairs, eg. integer=40,varchar=40,timestamp=20. Defaults to one type of each mapping rule of the connector")
+    parser.add_argument("--database", type=str, required=False, default="benchmark", help="Database name of the entries")
+
+    # Pipeline options measured by the benchmark
+    parser.add_argument("--engine", type=str, required=False, choices=[ENGINE_SPARK, ENGINE_PYTHON], default=ENGINE_SPARK,
+                        help="Build entries with Spark, or in Python as with --engine python")
+    parser.add_argument("--datatype_mapping_file", type=str, required=False,
+                        help="Local path or gs:// URI of a json file with data type mapping rules which override the rules of the connector")
+    parser.add_argument("--spark_conf", type=str, required=False, action="append",
+                        help="Spark setting as key=value, overriding the session profile of the connector. Can be repeated")
+    parser.add_argument("--parallelism", type=int, required=False, default=1,
+                        help="Number of schemas/object types to process concurrently")
+    parser.add_argument("--streaming_output", action="store_true",
+                        help="Stream entries to the output file one Spark partition at a time")
+    parser.add_argument("--max_buffer_mb", type=int, required=False, default=16,
+                        help="Maximum size in MB of output buffered in memory before it is written to file")
+
+    parsed_args = parser.parse_args()
+
+    for argument in ['schemas', 'tables_per_schema', 'columns_per_table', 'parallelism', 'max_buffer_mb']:
+        if getattr(parsed_args, argument) < 1:
+            raise Exception(f"--{argument} must be 1 or greater : {getattr(parsed_args, argument)}")
+
+    if parsed_args.views_per_schema < 0:
+        raise Exception(f"--views_per_schema must be 0 or greater : {parsed_args.views_per_schema}")
+
+    if parsed_args.engine == ENGINE_PYTHON and parsed_args.parallelism > 1:
+        raise Exception("--parallelism requires --engine spark")
+
+    if parsed_args.type_mix is not None:
+        parsed_args.type_mix = parse_type_mix(parsed_args.type_mix)
+
+    parsed_args.spark_conf = parseSparkConf(parsed_args.spark_conf)
+
+    config = {**BENCHMARK_IDENTITY, **BENCHMARK_PIPELINE, **vars(parsed_args)}
+    # The pipeline reads the catalog through the fake connector
+    config['fake_catalog'] = FAKE_CATALOG_SYNTHETIC
+    config['synthetic_shape'] = (parsed_args.schemas, parsed_args.tables_per_schema, parsed_args.views_per_schema,
+                                 parsed_args.columns_per_table)
+    config['synthetic_type_mix'] = parsed_args.type_mix
+    return config
+
+def run():
+    """Runs the benchmark: builds the entries of a synthetic catalog, then writes them through
+    the pipeline write path, and reports the throughput of each stage and peak memory use."""
+    try:
+        config = read_args()
+    except Exception as ex:
+        print(f"Error in arguments: {ex}")
+        sys.exit(1)
+
+    catalog = SyntheticCatalog.from_config(config)
+    print(f"Benchmarking {SOURCE_TYPE} with engine {config['engine']} on {catalog.schemas} schemas of "
+          f"{catalog.objects_per_schema} tables and views, {catalog.column_rows} columns")
+
+    output_path = './output'
+    if not os.path.exists(output_path):
+        os.mkdir(output_path)
+    file_prefix = f"benchmark-{SOURCE_TYPE}-{catalog.schemas}x{catalog.objects_per_schema}x{config['columns_per_table']}"
+    output_file = f"{output_path}/{file_prefix}.jsonl"
+
+    spark = None
+    df_catalog = None
+    stages = {}
+    started = time.time()
+    if config['engine'] != ENGINE_PYTHON:
+        from src.common.spark_session import get_spark_session
+        spark = get_spark_session("Benchmark", "", config)
+        df_catalog = catalog.catalog_df(spark).persist()
+        df_catalog.count()
+    stages[STAGE_GENERATE] = _stage(time.time() - started)
+
+    # Entry building alone, as run on the executors
+    started = time.time()
+    entries, bytes_built = build_entries(config, catalog, df_catalog, spark)
+    stages[STAGE_BUILD] = _stage(time.time() - started, entries, bytes_built)
+    if df_catalog is not None:
+        df_catalog.unpersist()
+
+    # The write path of a pipeline run, including collecting entries to the driver
+    connector = FakeConnector(config)
+    journal = ProgressJournal(f"{output_file}.progress", file_prefix)
+    started = time.time()
+    objects_count = bootstrap.write_entries_file(((config, connector),), config, output_file, EntryState(), journal)
+    entries = len(TOP_ENTRY_HIERARCHY) + catalog.schemas + objects_count
+    stages[STAGE_WRITE] = _stage(time.time() - started, entries, os.path.getsize(output_file))
+
+    report = {
+        KEY_SOURCE_TYPE: SOURCE_TYPE,
+        KEY_ENGINE: config['engine'],
+        KEY_SCHEMAS: catalog.schemas,
+        KEY_TABLES_PER_SCHEMA: config['tables_per_schema'],
+        KEY_VIEWS_PER_SCHEMA: config['views_per_schema'],
+        KEY_COLUMNS_PER_TABLE: config['columns_per_table'],
+        KEY_COLUMN_ROWS: catalog.column_rows,
+        KEY_STAGES: stages,
+        KEY_PYTHON_PEAK_RSS_MB: _peak_rss_mb(os.getpid()),
+        KEY_JVM_PEAK_RSS_MB: _peak_rss_mb(_jvm_pid(spark)) if spark is not None else None,
+    }
+
+    for stage, result in stages.items():
+        print(f"{stage}: " + ", ".join(f"{key} {value}" for key, value in result.items()))
+    print(f"Peak driver RSS: python {report[KEY_PYTHON_PEAK_RSS_MB]} MB"
+          + (f", JVM {report[KEY_JVM_PEAK_RSS_MB]} MB" if spark is not None else ""))
+
+    report_file = f"{output_path}/{file_prefix}.benchmark.json"
+    with open(report_file, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    print(f"Benchmark report written to {report_file}")
+
+if __name__ == '__main__':
+    run()
@@ -13,41 +13,661 @@
 # limitations under the License.
 
 """The entrypoint of a pipeline."""
+from typing import TYPE_CHECKING
 from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Set
+from typing import Iterable
+from typing import Iterator
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future
+from functools import reduce
+from operator import itemgetter
+import itertools
+import hashlib
+import json
 import os
+import threading
 import importlib
 import sys
-import google.cloud.logging as gcp_logging
+import time
 import logging
 from src import cmd_reader
 from src.constants import EntryType
 from src.constants import SOURCE_TYPE
 from src.constants import DB_OBJECT_TYPES_TO_PROCESS
 from src.constants import TOP_ENTRY_HIERARCHY
+from src.constants import COLLECTION_ENTRY
 from src.constants import generateFileName
 from src.constants import CONNECTOR_MODULE
 from src.constants import CONNECTOR_CLASS
+from src.constants import PYTHON_CONNECTOR_MODULE
+from src.constants import PYTHON_CONNECTOR_CLASS
 from src.common import entry_builder
+from src.common import python_entry_builder
+from src.common.argument_validator import ENGINE_PYTHON
+from src.common.entry_constants import COLUMN_SCHEMA_NAME
+from src.common.entry_constants import COLUMN_OBJECT_TYPE
 from src.common import gcs_uploader
+from src.common import sharded_writer
+from src.common.entry_constants import COLUMN_ENTRY_NAME
+from src.common.entry_constants import COLUMN_CONTENT_HASH
+from src.common.entry_constants import COLUMN_ENTRY_JSON
+from src.common.entry_constants import HASHED_ENTRY_SCHEMA
+from src.common.entry_state import EntryState
+from src.common.entry_state import hash_json
+from src.common.entry_state import deleted_entries_uri
+from src.common.schema_state import SchemaState
+from src.common.progress_journal import ProgressJournal
+from src.common.progress_journal import HEADER_TASK
+from src.common.query_ledger import LEDGER
+from src.common.query_throttle import THROTTLE
+from src.common import run_report
+from src.common.run_report import REPORT
+from src.common.entry_constants import COLUMN_LAST_MODIFIED
+from src.common.entry_constants import COLUMN_OBJECT_COUNT
+from src.common.entry_constants import COLUMN_DATABASE_NAME
+from src.common.datatype_rules import get_rules
+from src import name_builder as nb
 from src.common import top_entry_builder
 from src.common.util import isRunningInContainer
 from src.common.ExternalSourceConnector import IExternalSourceConnector
+from src.common.fake_connector import FakeConnector
 
-def write_jsonl(output_file, json_strings):
-    """Writes a list of string to the file in JSONL format."""
-    for string in json_strings:
-        output_file.write(string + "\n")
+# Spark is imported by the functions of the Spark engine, so runs with --engine python do not need it
+if TYPE_CHECKING:
+    from pyspark.sql import DataFrame
+
+# Stands in for the database in the output file name when several databases are extracted
+MULTI_DATABASE_NAME = "databases"
+
+# Marks table and view entries among the sharded entries, which are counted for min_expected_entries
+COLUMN_IS_DB_OBJECT = "IS_DB_OBJECT"
+
+# Options which shape the content of the output file. A run is only resumed with the same options
+OUTPUT_OPTIONS = ['target_project_id', 'target_location_id', 'target_entry_group_id', 'engine', 'incremental',
+                  'include_schemas', 'exclude_schemas', 'include_tables', 'exclude_tables', 'filter_syntax',
+                  'fake_catalog', 'synthetic_shape', 'synthetic_type_mix']
+
+class JsonlWriter:
+    """Buffered JSONL writer to a binary file. Buffered lines are flushed to file once they reach max_buffer_bytes"""
+
+    def __init__(self, output_file, max_buffer_bytes: int, offset: int = 0):
+        self._output_file = output_file
+        self._max_buffer_bytes = max_buffer_bytes
+        self._buffer = []
+        self._buffer_bytes = 0
+        self._offset = offset
+
+    def write(self, json_strings: Iterable[str]) -> int:
+        """Writes strings as JSONL lines. Returns the number of lines written."""
+        count = 0
+        for string in json_strings:
+            self._buffer.append(string)
+            self._buffer_bytes += len(string) + 1
+            count += 1
+            if self._buffer_bytes >= self._max_buffer_bytes:
+                self.flush()
+        return count
+
+    def flush(self):
+        if self._buffer:
+            data = ("\n".join(self._buffer) + "\n").encode("utf-8")
+            self._output_file.write(data)
+            self._offset += len(data)
+            self._buffer = []
+            self._buffer_bytes = 0
+
+    @property
+    def offset(self) -> int:
+        """Size of the file in bytes once the buffered lines are flushed."""
+        self.flush()
+        return self._offset
+
+    def sync(self):
+        """Flushes all written lines to disk."""
+        self.flush()
+        self._output_file.flush()
+        os.fsync(self._output_file.fileno())
+
+def commit_task(journal: ProgressJournal, writer: JsonlWriter, task: Tuple[str, str, str], entries_count: int):
+    """Records task as completed. The output file and the journal are synced together once the journal is due"""
+    journal.commit(task, writer.offset, entries_count)
+    if journal.sync_due():
+        writer.sync()
+        journal.sync()
+
+def journal_context(config: Dict[str, str], file_name: str, databases: List[str]) -> str:
+    """Context of the journal of a run: the output file name, the options shaping its content and the datatype rules."""
+    options = {option: config.get(option) for option in OUTPUT_OPTIONS}
+    options['databases'] = databases
+    rules = get_rules(config)
+    options['datatypeRules'] = hashlib.sha256(json.dumps([sorted(rules.exact.items()), sorted(rules.prefixes.items()),
+                                                          rules.default]).encode("utf-8")).hexdigest()
+    return f"{file_name}|{json.dumps(options, sort_keys=True, default=str)}"
+
+# Most partitions of the entries of a schema are empty shuffle partitions, and toLocalIterator
+# runs a Spark job for each partition, so streamed entries are coalesced to at most this many
+MAX_STREAM_PARTITIONS = 8
+
+class StreamedRows:
+    """Rows of a dataframe, fetched one partition at a time as they are iterated.
+    A persisted dataframe is unpersisted once iterated, or when closed without being iterated"""
+
+    def __init__(self, df: "DataFrame", persisted: bool):
+        self._df = df
+        self._persisted = persisted
+
+    def __iter__(self) -> Iterator:
+        try:
+            yield from self._df.toLocalIterator(prefetchPartitions=False)
+        finally:
+            self.close()
+
+    def close(self):
+        if self._persisted:
+            self._df.unpersist()
+            self._persisted = False
+
+def to_json(df: "DataFrame", config: Dict[str, str]):
+    """Converts import items to (entry name, content hash, json) rows.
+    Collects all rows to the driver, or with --streaming_output returns an iterable
+    which holds at most one partition in driver memory"""
+    df = entry_builder.to_hashed_json(df)
+    if not config['streaming_output']:
+        return df.collect()
+    df = df.coalesce(MAX_STREAM_PARTITIONS)
+    if config['parallelism'] > 1:
+        # Build the entries on executors in the worker thread, so only streaming to the driver is sequential
+        df = df.persist()
+        try:
+            df.count()
+        except Exception:
+            df.unpersist()
+            raise
+        return StreamedRows(df, True)
+    return StreamedRows(df, False)
+
+def top_entries(config: Dict[str, str]) -> List[Tuple[str, str, str]]:
+    """Builds the top level entries as (entry name, content hash, json)."""
+    entries = []
+    for entry_type in TOP_ENTRY_HIERARCHY:
+        json_string = top_entry_builder.create(config, entry_type)
+        entries.append((nb.create_name(config, entry_type), hash_json(json_string), json_string))
+    return entries
+
+class SchemaDatasets:
+    """Db object data of each schema, read with a single query for all object types where the connector
+    supports get_schema_datasets, otherwise with a query per object type. Each result is kept persisted until
+    the schema is released, so every object type is filtered from it without querying the source again,
+    and entries streamed from it are written first"""
+
+    def __init__(self, connector: IExternalSourceConnector):
+        self._connector = connector
+        self._datasets = {}
+        self._type_datasets = {}
+        self._schema_locks = {}
+        self._lock = threading.Lock()
+
+    def get(self, schema_name: str, entry_type: EntryType) -> "DataFrame":
+        """Returns db object data of entry_type in a schema."""
+        # Schemas are read concurrently, but each only once
+        with self._lock:
+            schema_lock = self._schema_locks.setdefault(schema_name, threading.Lock())
+        with schema_lock:
+            if schema_name not in self._datasets:
+                self._datasets[schema_name] = self._connector.get_schema_datasets(schema_name)
+            df = self._datasets[schema_name]
+        if df is None:
+            df = self._connector.get_dataset(schema_name, entry_type)
+            with self._lock:
+                self._type_datasets.setdefault(schema_name, []).append(df)
+            return df
+        import pyspark.sql.functions as F
+        return df.filter(F.col(COLUMN_OBJECT_TYPE) == entry_type.name).drop(COLUMN_OBJECT_TYPE)
+
+    def release(self, schema_name: str):
+        """Unpersists the data of a schema once all its object types are processed."""
+        with self._lock:
+            dfs = [self._datasets.pop(schema_name, None), *self._type_datasets.pop(schema_name, [])]
+            self._schema_locks.pop(schema_name, None)
+        for df in dfs:
+            if df is not None:
+                df.unpersist()
+
+    def release_all(self):
+        """Unpersists the data of all schemas still held."""
+        for schema_name in list(self._datasets):
+            self.release(schema_name)
+
+def _timed(items: Iterable, on_done) -> Iterator:
+    """Passes through items, calling on_done with the seconds spent fetching them once all are read."""
+    items = iter(items)
+    seconds = 0.0
+    try:
+        while True:
+            started = time.time()
+            try:
+                item = next(items)
+            except StopIteration:
+                return
+            finally:
+                seconds += time.time() - started
+            yield item
+    finally:
+        on_done(seconds)
+
+def python_dataset_entries(
+    connector: IExternalSourceConnector,
+    config: Dict[str, str],
+    schema_name: str,
+    entry_type: EntryType,
+) -> Iterator[Tuple[str, str, str]]:
+    """Builds entries with the python engine as they are written. Rows are fetched while entries are built,
+    so the time spent on each is added up and recorded as the extract and build phases"""
+    labels = {'schema': schema_name, 'objectType': entry_type.name}
+    extract_seconds = 0.0
+
+    def extracted(seconds: float):
+        nonlocal extract_seconds
+        extract_seconds = seconds
+        REPORT.record_seconds(run_report.PHASE_EXTRACT, seconds, **labels)
+
+    def built(seconds: float):
+        REPORT.record_seconds(run_report.PHASE_BUILD, seconds - extract_seconds, **labels)
+
+    rows = _timed(connector.get_dataset(schema_name, entry_type), extracted)
+    return _timed(python_entry_builder.build_dataset(config, rows, schema_name, entry_type), built)
 
 def process_dataset(
     connector: IExternalSourceConnector,
     config: Dict[str, str],
     schema_name: str,
     entry_type: EntryType,
+    schema_datasets: SchemaDatasets = None,
+):
+    """Builds dataset and converts it to jsonl. With Spark, data is read through schema_datasets"""
+    if config['engine'] == ENGINE_PYTHON:
+        return python_dataset_entries(connector, config, schema_name, entry_type)
+    with REPORT.phase(run_report.PHASE_EXTRACT, schema=schema_name, objectType=entry_type.name):
+        df_raw = schema_datasets.get(schema_name, entry_type)
+    # Includes collecting the entries to the driver, unless they are streamed while written
+    with REPORT.phase(run_report.PHASE_BUILD, schema=schema_name, objectType=entry_type.name):
+        df = entry_builder.build_dataset(config, df_raw, schema_name, entry_type)
+        return to_json(df, config)
+
+def _use_worker_pool(workers: Iterator[int]):
+    """Initializes a worker thread, giving its Spark jobs a FAIR scheduler pool of their own."""
+    from src.common.spark_session import set_scheduler_pool
+    set_scheduler_pool(next(workers))
+
+def process_datasets_in_order(
+    connector: IExternalSourceConnector,
+    config: Dict[str, str],
+    tasks: List[Tuple[str, EntryType]],
+    schema_state: SchemaState = None,
+    unchanged_schemas: Set[str] = frozenset(),
+    schema_datasets: SchemaDatasets = None,
 ):
-    """Builds dataset and converts it to jsonl."""
-    df_raw = connector.get_dataset(schema_name, entry_type)
-    df = entry_builder.build_dataset(config, df_raw, schema_name, entry_type)
-    return df.toJSON().collect()
+    """Processes (schema, entry type) tasks on a bounded worker pool.
+    Entries of unchanged schemas are read from the schema state instead of the source.
+    Yields (schema, entry type, entry rows) in task order so output is deterministic"""
+    parallelism = config['parallelism']
+    # Spark jobs of each worker thread go to a FAIR scheduler pool of their own
+    pool_args = {} if config['engine'] == ENGINE_PYTHON else {'initializer': _use_worker_pool, 'initargs': (itertools.count(),)}
+    with ThreadPoolExecutor(max_workers=parallelism, **pool_args) as executor:
+        pending = deque()
+        try:
+            for schema_name, entry_type in tasks:
+                if schema_name in unchanged_schemas:
+                    future = Future()
+                    future.set_result(schema_state.previous_entries(schema_name, entry_type.name))
+                else:
+                    future = executor.submit(process_dataset, connector, config, schema_name, entry_type, schema_datasets)
+                pending.append((schema_name, entry_type, future))
+                # Limit results held in memory while waiting on earlier tasks
+                if len(pending) >= parallelism:
+                    schema_name, entry_type, future = pending.popleft()
+                    yield schema_name, entry_type, future.result()
+            while pending:
+                schema_name, entry_type, future = pending.popleft()
+                yield schema_name, entry_type, future.result()
+        finally:
+            # After a failed task, release the entries other workers persisted for tasks which are not written
+            for _, _, future in pending:
+                if future.cancel() or future.exception() is not None:
+                    continue
+                if isinstance(future.result(), StreamedRows):
+                    future.result().close()
+
+def process_catalog(config: Dict[str, str], df_catalog: "DataFrame", tasks: List[Tuple[str, EntryType]]):
+    """Processes (schema, entry type) tasks from the bulk catalog dataframe with one Spark job per object type,
+    rather than one per schema and object type. Entries are sorted by schema on the executors and split by schema
+    on the driver. Yields (schema, entry type, entry rows) for every task, with schemas of each object type in name order"""
+    import pyspark.sql.functions as F
+    for entry_type in DB_OBJECT_TYPES_TO_PROCESS:
+        schemas = [schema_name for schema_name, task_type in tasks if task_type == entry_type]
+        if not schemas:
+            continue
+        with REPORT.phase(run_report.PHASE_BUILD, objectType=entry_type.name):
+            df_raw = df_catalog.filter(F.col(COLUMN_OBJECT_TYPE) == entry_type.name).drop(COLUMN_OBJECT_TYPE)
+            df = entry_builder.to_hashed_json(entry_builder.build_dataset(config, df_raw, None, entry_type),
+                                              COLUMN_SCHEMA_NAME).orderBy(COLUMN_SCHEMA_NAME)
+            rows = df.toLocalIterator(prefetchPartitions=False) if config['streaming_output'] else df.collect()
+        remaining = set(schemas)
+        for schema_name, schema_rows in itertools.groupby(rows, key=itemgetter(0)):
+            # Objects of schemas which are not extracted, eg. listed by the catalog query but not the schema query
+            if schema_name not in remaining:
+                continue
+            remaining.discard(schema_name)
+            # Streamed rows of a schema are written before the next schema is read
+            entries = (tuple(row[1:]) for row in schema_rows)
+            yield schema_name, entry_type, entries if config['streaming_output'] else list(entries)
+        for schema_name in schemas:
+            if schema_name in remaining:
+                yield schema_name, entry_type, []
+
+def read_schemas(connector: IExternalSourceConnector) -> "DataFrame":
+    """Returns the dataframe of schemas to extract, exiting on error."""
+    try:
+        return connector.get_db_schemas()
+    except Exception as ex:
+        print(f"Error during metadata extraction from db: {ex}")
+        sys.exit(1)
+
+def read_schema_names(config: Dict[str, str], raw_schemas) -> List[str]:
+    """Returns names of the schemas to extract from the result of get_db_schemas."""
+    if config['engine'] == ENGINE_PYTHON:
+        return [row[0] for row in raw_schemas]
+    return [schema.SCHEMA_NAME for schema in raw_schemas.select("SCHEMA_NAME").collect()]
+
+def read_schema_signatures(connector: IExternalSourceConnector, config: Dict[str, str]) -> Dict[str, str]:
+    """Returns a change signature for each schema from the latest DDL time, or a checksum of
+    the column definitions where the source has none, and object count.
+    Returns None if the connector cannot detect schema changes"""
+    modified = connector.get_schema_last_modified()
+    if modified is None:
+        return None
+    if config['engine'] != ENGINE_PYTHON:
+        df_modified = modified
+        modified = df_modified.select(COLUMN_SCHEMA_NAME, COLUMN_LAST_MODIFIED, COLUMN_OBJECT_COUNT).collect()
+        df_modified.unpersist()
+    return {row[0]: f"{row[1]}|{row[2]}" for row in modified}
+
+def read_catalog(connector: IExternalSourceConnector) -> "DataFrame":
+    """Reads db object data for all schemas with a single query where the connector supports it.
+    Returns None if the connector only supports extraction per schema"""
+    df_catalog = None
+    try:
+        df_catalog = connector.get_all_datasets()
+    except Exception as ex:
+        print(f"Error during metadata extraction from db: {ex}")
+        sys.exit(1)
+
+    if df_catalog is not None:
+        print("Reading metadata for all schemas in a single query")
+    return df_catalog
+
+def write_database_entries(
+    connector: IExternalSourceConnector,
+    config: Dict[str, str],
+    writer: JsonlWriter,
+    state: EntryState,
+    journal: ProgressJournal,
+    entries_count: int,
+    written_top_entries: Set[str],
+    resuming: bool,
+    schema_state: SchemaState = None,
+    signatures: Dict[str, str] = None,
+) -> int:
+    """Writes the entries of the database in config: top level entries not already written by an
+    earlier database, its schemas and their db objects. Returns the number of db object entries extracted so far,
+    including unchanged entries left out of incremental output."""
+    # Sources without a database argument, eg. Oracle with service or sid, have a single database
+    database = config.get('database', "")
+    incremental = config['incremental']
+
+    if database:
+        print(f"Processing database {database}..")
+
+    # Collect list of schemas for extract
+    with REPORT.phase(run_report.PHASE_SCHEMA_LISTING, database=database):
+        raw_schemas = read_schemas(connector)
+
+        schemas = read_schema_names(config, raw_schemas)
+
+    # Top level entries shared by all databases, eg. the instance, are written only once
+    database_top_entries = [entry for entry in top_entries(config) if entry[0] not in written_top_entries]
+    written_top_entries.update(entry[0] for entry in database_top_entries)
+
+    header_task = (database, "", HEADER_TASK)
+    if not journal.is_completed(header_task):
+        # First write the top level entry types to file which can be generated without processing the schemas
+        writer.write(state.filter_changed(journal.track(database_top_entries), incremental))
+
+        if config['engine'] == ENGINE_PYTHON:
+            schemas_json = python_entry_builder.build_schemas(config, schemas)
+        else:
+            schemas_json = to_json(entry_builder.build_schemas(config, raw_schemas), config)
+        writer.write(state.filter_changed(journal.track(schemas_json), incremental))
+        commit_task(journal, writer, header_task, entries_count)
+
+    if config['engine'] != ENGINE_PYTHON:
+        raw_schemas.unpersist()
+
+    unchanged_schemas = set()
+    if schema_state is not None:
+        unchanged_schemas = {schema for schema in schemas if schema_state.is_unchanged(schema, signatures.get(schema))}
+        print(f"{len(unchanged_schemas)} of {len(schemas)} schemas unchanged since the previous run")
+
+    # A single catalog query is only worthwhile when every schema is extracted
+    df_catalog = read_catalog(connector) if schemas and not unchanged_schemas and not resuming else None
+
+    # Otherwise tables and views of a schema are read together where the connector supports it
+    schema_datasets = None
+    if df_catalog is None and config['engine'] != ENGINE_PYTHON:
+        schema_datasets = SchemaDatasets(connector)
+
+    print("Processing schemas..")
+
+    if config['parallelism'] > 1:
+        print(f"Processing up to {config['parallelism']} schemas/object types concurrently")
+
+    # Collect metadata for target db objects in each schema
+    tasks = [(schema, object_type) for schema in schemas for object_type in DB_OBJECT_TYPES_TO_PROCESS
+             if not journal.is_completed((database, schema, object_type.name))]
+    last_tasks = {schema: object_type for schema, object_type in tasks}
+    if df_catalog is not None:
+        processed = process_catalog(config, df_catalog, tasks)
+    else:
+        processed = process_datasets_in_order(connector, config, tasks, schema_state, unchanged_schemas, schema_datasets)
+    try:
+        for schema, object_type, objects_json in processed:
+            if schema_state is not None and schema not in unchanged_schemas:
+                objects_json = schema_state.record(schema, object_type.name, objects_json)
+            started = time.time()
+            unchanged_count = state.unchanged_count
+            objects_count = writer.write(state.filter_changed(journal.track(objects_json), incremental))
+            REPORT.record(run_report.PHASE_WRITE, started, schema=schema, objectType=object_type.name, entries=objects_count)
+            if schema in unchanged_schemas:
+                print(f"Carried forward {objects_count} unchanged {object_type.name}S in {schema}")
+            else:
+                print(f"Processed {objects_count} {object_type.name}S in {schema}")
+            # Unchanged entries still count towards the size of the catalog
+            entries_count += objects_count + state.unchanged_count - unchanged_count
+            commit_task(journal, writer, (database, schema, object_type.name), entries_count)
+            if schema_datasets is not None and last_tasks[schema] == object_type:
+                schema_datasets.release(schema)
+    finally:
+        # Also when a task failed, so data persisted by other tasks is not left on the executors
+        processed.close()
+        if schema_datasets is not None:
+            schema_datasets.release_all()
+        if df_catalog is not None:
+            df_catalog.unpersist()
+
+    return entries_count
+
+def write_entries_file(
+    databases: Iterable[Tuple[Dict[str, str], IExternalSourceConnector]],
+    config: Dict[str, str],
+    output_file: str,
+    state: EntryState,
+    journal: ProgressJournal,
+    schema_state: SchemaState = None,
+    signatures: Dict[str, str] = None,
+) -> int:
+    """Extracts metadata of (config, connector) databases through the driver into a single JSONL file.
+    Returns number of db object entries extracted.
+    Output is written to a partial file which is renamed to output_file once complete. Each completed
+    task is recorded in the journal, and tasks already completed in the journal are skipped.
+    If schema_state is given, schemas with unchanged signatures are carried forward from the previous run"""
+    partial_file = f"{output_file}.partial"
+    resuming = journal.has_progress()
+
+    if resuming:
+        # Discard output of the task which was in progress when the previous run stopped
+        with open(partial_file, "r+b") as file:
+            file.truncate(journal.offset)
+        state.record(journal.completed_hashes())
+        print(f"Resuming from {journal.completed_count} completed tasks")
+    entries_count = journal.entries_count
+
+    journal.open()
+    with open(partial_file, "ab" if resuming else "wb") as file:
+        writer = JsonlWriter(file, config['max_buffer_mb'] * 1024 * 1024, journal.offset)
+
+        written_top_entries = set()
+        try:
+            for database_config, connector in databases:
+                entries_count = write_database_entries(connector, database_config, writer, state, journal, entries_count,
+                                                       written_top_entries, resuming, schema_state, signatures)
+        finally:
+            # Also when a task failed, so a resumed run skips the tasks completed since the last sync
+            writer.sync()
+            journal.sync()
+
+    # Publish the output file only once it is complete
+    os.replace(partial_file, output_file)
+    journal.remove()
+
+    return entries_count
+
+def read_database_names(connector: IExternalSourceConnector, config: Dict[str, str]) -> List[str]:
+    """Returns names of the databases to extract, from --databases or listed by the connector with --all_databases.
+    Returns None when only the database given by --database is extracted"""
+    if config.get('databases'):
+        return config['databases']
+    if not config.get('all_databases'):
+        return None
+    try:
+        raw_databases = connector.get_databases()
+    except Exception as ex:
+        print(f"Error listing databases: {ex}")
+        sys.exit(1)
+    if raw_databases is None:
+        print(f"Listing databases is not supported for {SOURCE_TYPE}")
+        sys.exit(1)
+    if config['engine'] != ENGINE_PYTHON:
+        df_databases = raw_databases
+        raw_databases = df_databases.select(COLUMN_DATABASE_NAME).collect()
+        df_databases.unpersist()
+    return sorted(row[0] for row in raw_databases)
+
+def database_connectors(
+    ConnectorClass,
+    connector: IExternalSourceConnector,
+    config: Dict[str, str],
+    databases: List[str],
+) -> Iterator[Tuple[Dict[str, str], IExternalSourceConnector]]:
+    """Yields (config, connector) for each database to extract, creating connectors as they are needed.
+    Connectors of other databases get a copy of config with the database replaced, so they share the
+    credentials already read, and the Spark session through getOrCreate"""
+    if databases is None:
+        yield config, connector
+        return
+    for database in databases:
+        if database == config['database']:
+            yield config, connector
+            continue
+        database_config = {**config, 'database': database}
+        try:
+            with REPORT.phase(run_report.PHASE_CONNECTOR_STARTUP, database=database):
+                database_connector = ConnectorClass(database_config)
+            yield database_config, database_connector
+        except Exception as ex:
+            print(f"Error setting up connector for database {database}: {ex}")
+            raise Exception(ex)
+
+def write_entries_sharded(connector: IExternalSourceConnector, config: Dict[str, str], staging_uri: str, file_prefix: str,
+                          state: EntryState) -> Tuple[Dict, int]:
+    """Extracts metadata as sharded JSONL files written by the Spark executors.
+    Returns the shard manifest and the number of db object entries, as counted in file output"""
+    import pyspark.sql.functions as F
+    from pyspark.sql import DataFrame
+    df_raw_schemas = read_schemas(connector)
+    spark = df_raw_schemas.sparkSession
+
+    def db_object_entries(df: DataFrame, is_db_object: bool) -> DataFrame:
+        return df.withColumn(COLUMN_IS_DB_OBJECT, F.lit(is_db_object))
+
+    # Top level entries are built on the driver, everything else stays on the executors
+    entry_dfs = [db_object_entries(spark.createDataFrame(top_entries(config), HASHED_ENTRY_SCHEMA), False),
+                 db_object_entries(entry_builder.to_hashed_json(entry_builder.build_schemas(config, df_raw_schemas)), False)]
+
+    df_catalog = read_catalog(connector)
+
+    print("Processing schemas..")
+
+    if df_catalog is not None:
+        for object_type in DB_OBJECT_TYPES_TO_PROCESS:
+            df_raw = df_catalog.filter(F.col(COLUMN_OBJECT_TYPE) == object_type.name).drop(COLUMN_OBJECT_TYPE)
+            entry_dfs.append(db_object_entries(
+                entry_builder.to_hashed_json(entry_builder.build_dataset(config, df_raw, None, object_type)), True))
+    else:
+        schema_datasets = SchemaDatasets(connector)
+        schemas = [schema.SCHEMA_NAME for schema in df_raw_schemas.select("SCHEMA_NAME").collect()]
+        for schema in schemas:
+            for object_type in DB_OBJECT_TYPES_TO_PROCESS:
+                df_raw = schema_datasets.get(schema, object_type)
+                entry_dfs.append(db_object_entries(
+                    entry_builder.to_hashed_json(entry_builder.build_dataset(config, df_raw, schema, object_type)), True))
+
+    df_entries = reduce(DataFrame.union, entry_dfs).persist()
+
+    # Only entry names and hashes are returned to the driver to record the state of this run
+    db_objects_count = 0
+    def entry_hashes():
+        nonlocal db_objects_count
+        for name, content_hash, is_db_object in df_entries.select(COLUMN_ENTRY_NAME, COLUMN_CONTENT_HASH,
+                                                                  COLUMN_IS_DB_OBJECT).toLocalIterator():
+            db_objects_count += is_db_object
+            yield name, content_hash
+    state.record(entry_hashes())
+
+    if config['incremental'] and state.has_previous():
+        df_previous = spark.createDataFrame(list(state.previous_hashes.items()),
+                                            f"{COLUMN_ENTRY_NAME} string, {COLUMN_CONTENT_HASH} string")
+        df_output = df_entries.join(F.broadcast(df_previous), [COLUMN_ENTRY_NAME, COLUMN_CONTENT_HASH], "left_anti")
+    else:
+        df_output = df_entries
+
+    print(f"Writing sharded output to {staging_uri}")
+    manifest = sharded_writer.write_shards(df_output.select(F.col(COLUMN_ENTRY_JSON).alias(sharded_writer.COLUMN_VALUE)),
+                                           staging_uri, file_prefix, config)
+    if config['incremental']:
+        state.unchanged_count = state.current_count - manifest[sharded_writer.KEY_ENTRIES]
+
+    df_entries.unpersist()
+    df_raw_schemas.unpersist()
+    if df_catalog is not None:
+        df_catalog.unpersist()
+    else:
+        schema_datasets.release_all()
+
+    return manifest, db_objects_count
 
 def run():
     """Runs a pipeline."""
@@ -60,70 +680,145 @@ def run():
         print(f"Error in arguments: {ex}")
         sys.exit(1)
 
+    extract(config)
+
+def extract(config: Dict[str, str]):
+    """Extracts metadata of the source given by validated arguments config to its output files,
+    and uploads them unless only local output is requested."""
+
     if config['local_output_only']:
         print("File will be generated in local 'output' directory only")
 
+    # Limits of the queries run against the source, for this source only when sources are extracted together
+    THROTTLE.configure(config['parallelism'], config['max_queries_per_second'], config['throttle_latency_factor'])
+    if THROTTLE.enabled:
+        print("Throttling metadata queries" +
+              (f" to {config['max_queries_per_second']} per second" if config['max_queries_per_second'] else "") +
+              (f", cutting concurrency above {config['throttle_latency_factor']}x baseline latency" if config['throttle_latency_factor'] else ""))
+
     # Build output file name from connection details
     FILENAME = generateFileName(config)
     
     if not config['local_output_only']:
         FOLDERNAME = config['output_folder']
 
-    # Instantiate connector class 
-    ConnectorClass = getattr(importlib.import_module(CONNECTOR_MODULE), CONNECTOR_CLASS)
-    connector = None
-    
-    try:
-        connector = ConnectorClass(config)
-    except Exception as ex:
-            print(f"Error setting up connector for {SOURCE_TYPE}: {ex}")
-            raise Exception(ex)
-
-    entries_count = 0
-
-    # Build the output file name from connection details
-    FILENAME = generateFileName(config) 
-
     output_path = './output'
     if not os.path.exists(output_path):
         os.mkdir(output_path)
 
-    with open(f"{output_path}/{FILENAME}", "w", encoding="utf-8") as file:
-        # First write the top level entry types to file which can be generated without processing the schemas
-        for entry in TOP_ENTRY_HIERARCHY:
-            file.writelines(top_entry_builder.create(config, entry))
-            file.writelines("\n")
-
-        # Collect list of schemas for extract
-        df_raw_schemas = None
+    # The statements run and the run report are written also when the run fails
+    completed = False
+    try:
+        # Instantiate connector class 
+        if config['fake_catalog'] is not None:
+            print(f"Reading metadata from fake catalog {config['fake_catalog']} instead of {SOURCE_TYPE}")
+            ConnectorClass = FakeConnector
+        elif config['engine'] == ENGINE_PYTHON:
+            print("Reading metadata with the native Python driver")
+            ConnectorClass = getattr(importlib.import_module(PYTHON_CONNECTOR_MODULE), PYTHON_CONNECTOR_CLASS)
+        else:
+            ConnectorClass = getattr(importlib.import_module(CONNECTOR_MODULE), CONNECTOR_CLASS)
+        connector = None
+    
         try:
-            df_raw_schemas = connector.get_db_schemas()
+            with REPORT.phase(run_report.PHASE_CONNECTOR_STARTUP):
+                connector = ConnectorClass(config)
         except Exception as ex:
-            print(f"Error during metadata extraction from db: {ex}")
-            sys.exit(1)
+                print(f"Error setting up connector for {SOURCE_TYPE}: {ex}")
+                raise Exception(ex)
 
-        schemas = [schema.SCHEMA_NAME for schema in df_raw_schemas.select("SCHEMA_NAME").collect()]
-        schemas_json = entry_builder.build_schemas(config, df_raw_schemas).toJSON().collect()
+        # Build the output file name from connection details
+        FILENAME = generateFileName(config) 
 
-        write_jsonl(file, schemas_json)
+        # Several databases are written to one output, named for the instance rather than a single database
+        databases = read_database_names(connector, config)
+        if databases is not None:
+            print(f"Extracting {len(databases)} databases: {', '.join(databases)}")
+            FILENAME = generateFileName({**config, 'database': MULTI_DATABASE_NAME})
 
-        print("Processing schemas..")
+        # Content hashes of the entries from the previous run
+        file_prefix = os.path.splitext(FILENAME)[0]
+        state_uri = config['state_file'] or f"{output_path}/{file_prefix}.state.json"
+        state = EntryState.load(state_uri)
+        if config['incremental']:
+            if state.has_previous():
+                print("Incremental extraction: only new or changed entries since the previous run will be output")
+            else:
+                print(f"No previous state found at {state_uri}. All entries will be output")
 
-        # Collect metadata for target db objects in each schema
-        for schema in schemas:
-            for object_type in DB_OBJECT_TYPES_TO_PROCESS:
-                objects_json = process_dataset(connector, config, schema, object_type)
-                print(f"Processed {len(objects_json)} {object_type.name}S in {schema}")
-                entries_count += len(objects_json)
-                write_jsonl(file, objects_json)
-
-    print(f"{entries_count} rows written to file {FILENAME}") 
-
-    # If 'min_expected_entries set, file must meet minimum number of expected entries
-    if entries_count < config['min_expected_entries']:
-        print(f"Row count is less then min_expected_entries value of {config['min_expected_entries']}. Will not upload to Cloud Storage bucket.")
-    elif not config['local_output_only']:
-        print(f"Uploading to Cloud Storage bucket: {config['output_bucket']}/{FOLDERNAME}")
-        gcs_uploader.upload(config,output_path,FILENAME,FOLDERNAME)
+        # Per-schema change detection to skip extraction of unchanged schemas
+        schema_state = None
+        signatures = None
+        if config['skip_unchanged_schemas']:
+            signatures = read_schema_signatures(connector, config)
+            if signatures is None:
+                print(f"Schema change detection is not supported for {SOURCE_TYPE}. All schemas will be extracted")
+            else:
+                schema_state_dir = config['schema_state_dir'] or f"{output_path}/{file_prefix}.schemas"
+                schema_state = SchemaState.load(schema_state_dir, nb.create_parent_name(config, COLLECTION_ENTRY))
+
+        # Journal of completed tasks, next to the output file
+        journal_path = f"{output_path}/{FILENAME}.progress"
+        context = journal_context(config, FILENAME, databases)
+        journal = ProgressJournal(journal_path, context)
+        if config['resume']:
+            journal = ProgressJournal.load(journal_path, context)
+            if journal.has_progress() and not os.path.exists(f"{output_path}/{FILENAME}.partial"):
+                journal = ProgressJournal(journal_path, context)
+            if not journal.has_progress():
+                print(f"No progress to resume found at {journal_path}. Starting a new extraction")
+
+        if config['sharded_output']:
+            staging_uri = config['shard_staging_uri'] or os.path.abspath(f"{output_path}/{file_prefix}")
+            with REPORT.phase(run_report.PHASE_OUTPUT):
+                manifest, entries_count = write_entries_sharded(connector, config, staging_uri, file_prefix, state)
+            MANIFEST_FILENAME = f"{file_prefix}.manifest.json"
+            sharded_writer.write_manifest(manifest, f"{output_path}/{MANIFEST_FILENAME}")
+            REPORT.set_output(entries_count, manifest[sharded_writer.KEY_BYTES])
+            print(f"{manifest[sharded_writer.KEY_ENTRIES]} entries, of which {entries_count} tables and views, written to "
+                  f"{len(manifest[sharded_writer.KEY_FILES])} files under {manifest[sharded_writer.KEY_STAGING_URI]}, listed in {MANIFEST_FILENAME}")
+        else:
+            with REPORT.phase(run_report.PHASE_OUTPUT):
+                entries_count = write_entries_file(database_connectors(ConnectorClass, connector, config, databases), config,
+                                                   f"{output_path}/{FILENAME}", state, journal, schema_state, signatures)
+            REPORT.set_output(entries_count, os.path.getsize(f"{output_path}/{FILENAME}"))
+            print(f"{entries_count} tables and views extracted to file {FILENAME}")
+
+        if config['incremental']:
+            print(f"{state.unchanged_count} unchanged entries skipped, {len(state.deleted_entries())} entries deleted since the previous run")
+
+        # If 'min_expected_entries set, file must meet minimum number of expected entries
+        if entries_count < config['min_expected_entries']:
+            print(f"Row count is less then min_expected_entries value of {config['min_expected_entries']}. Will not upload to Cloud Storage bucket.")
+        elif not config['local_output_only']:
+            print(f"Uploading to Cloud Storage bucket: {config['output_bucket']}/{FOLDERNAME}")
+            with REPORT.phase(run_report.PHASE_UPLOAD):
+                if config['sharded_output']:
+                    gcs_uploader.upload_manifest(config,manifest,FOLDERNAME)
+                else:
+                    gcs_uploader.upload(config,output_path,FILENAME,FOLDERNAME)
+
+        # Only record state of a run which produced complete output
+        if entries_count >= config['min_expected_entries']:
+            state.save(state_uri)
+            print(f"Entry state saved to {state_uri}. Deleted entries listed in {deleted_entries_uri(state_uri)}")
+            if schema_state is not None:
+                schema_state.save(signatures)
+        completed = True
+    finally:
+        # Statements run against the source, for review by database administrators
+        file_prefix = os.path.splitext(FILENAME)[0]
+        QUERIES_FILENAME = f"{file_prefix}.queries.json"
+        LEDGER.write(f"{output_path}/{QUERIES_FILENAME}")
+        print(f"{LEDGER.statement_count} statements run against {SOURCE_TYPE}, listed in {QUERIES_FILENAME}")
+
+        # Timing of each phase, to tell whether time went on the source database, Spark or Cloud Storage
+        REPORT_FILENAME = f"{file_prefix}.report.json"
+        REPORT.set(sourceType=SOURCE_TYPE, engine=config['engine'], outputFile=FILENAME, statements=LEDGER.statement_count,
+                   completed=completed)
+        if THROTTLE.enabled:
+            REPORT.set(throttle=THROTTLE.to_dict())
+        REPORT.write(f"{output_path}/{REPORT_FILENAME}", config['report_sink'])
+        print(f"Run report written to {REPORT_FILENAME}")
 
     print("Finished")
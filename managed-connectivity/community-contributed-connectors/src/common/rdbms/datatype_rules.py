@@ -0,0 +1,114 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Declarative mapping of native data types to Dataplex metadata types."""
+import json
+from typing import Dict
+from typing import List
+from src.common.gcs_uploader import read_text
+from src.datatype_mapper import EXACT_RULES
+from src.datatype_mapper import PREFIX_RULES
+from src.datatype_mapper import DEFAULT_METADATA_TYPE
+
+# Override file property names
+KEY_EXACT = 'exact'
+KEY_PREFIX = 'prefix'
+KEY_DEFAULT = 'default'
+
+# Trie key holding the metadata type of a prefix ending at that node
+_TERMINAL = None
+
+def _invert(rules: Dict[str, List[str]]) -> Dict[str, str]:
+    """Converts lists of data types by metadata type to metadata type by data type.
+    If a data type is listed more than once, the first metadata type is used"""
+    mapping = {}
+    for metadata_type, data_types in rules.items():
+        for data_type in data_types:
+            mapping.setdefault(data_type, metadata_type)
+    return mapping
+
+class DatatypeRules:
+    """Maps data types by exact match, then by the longest matching prefix, then to a default.
+    Exact matches are a dict lookup and prefixes are matched with a trie, so the cost of a
+    lookup does not depend on the number of rules. Results are cached by data type"""
+
+    def __init__(self, exact: Dict[str, str], prefixes: Dict[str, str], default: str):
+        self.exact = exact
+        self.prefixes = prefixes
+        self.default = default
+        self._trie = {}
+        for prefix, metadata_type in prefixes.items():
+            node = self._trie
+            for char in prefix:
+                node = node.setdefault(char, {})
+            node[_TERMINAL] = metadata_type
+        self._cache = {}
+
+    @classmethod
+    def from_tables(cls, exact_rules: Dict[str, List[str]], prefix_rules: Dict[str, List[str]], default: str):
+        """Builds rules from lists of data types and prefixes by metadata type."""
+        return cls(_invert(exact_rules), _invert(prefix_rules), default)
+
+    def with_overrides(self, overrides: Dict):
+        """Returns rules with the exact, prefix and default rules of an override file taking precedence."""
+        return DatatypeRules({**self.exact, **_invert(overrides.get(KEY_EXACT, {}))},
+                             {**self.prefixes, **_invert(overrides.get(KEY_PREFIX, {}))},
+                             overrides.get(KEY_DEFAULT, self.default))
+
+    def _longest_prefix(self, data_type: str) -> str:
+        node = self._trie
+        match = node.get(_TERMINAL)
+        for char in data_type:
+            node = node.get(char)
+            if node is None:
+                break
+            match = node.get(_TERMINAL, match)
+        return match
+
+    def lookup(self, data_type: str) -> str:
+        """Returns the metadata type of a native data type."""
+        if data_type is None:
+            return self.default
+        metadata_type = self._cache.get(data_type)
+        if metadata_type is None:
+            metadata_type = self.exact.get(data_type) or self._longest_prefix(data_type) or self.default
+            self._cache[data_type] = metadata_type
+        return metadata_type
+
+def load_overrides(uri: str) -> Dict:
+    """Reads a json override file from a local path or gs:// URI, eg.
+    {"exact": {"STRING": ["citext"]}, "prefix": {"NUMBER": ["uint"]}, "default": "OTHER"}"""
+    content = read_text(uri)
+    if content is None:
+        raise Exception(f"Datatype mapping file {uri} not found")
+    overrides = json.loads(content)
+    unknown_keys = set(overrides) - {KEY_EXACT, KEY_PREFIX, KEY_DEFAULT}
+    if unknown_keys:
+        raise Exception(f"Unknown keys in datatype mapping file {uri}: {sorted(unknown_keys)}")
+    return overrides
+
+# Rules of the source from its datatype_mapper
+SOURCE_RULES = DatatypeRules.from_tables(EXACT_RULES, PREFIX_RULES, DEFAULT_METADATA_TYPE)
+
+# Rules with overrides, by override file
+_rules_by_file = {}
+
+def get_rules(config: Dict[str, str]) -> DatatypeRules:
+    """Returns the datatype rules of the source with overrides from --datatype_mapping_file applied."""
+    uri = config.get('datatype_mapping_file')
+    if uri is None:
+        return SOURCE_RULES
+    if uri not in _rules_by_file:
+        _rules_by_file[uri] = SOURCE_RULES.with_overrides(load_overrides(uri))
+    return _rules_by_file[uri]
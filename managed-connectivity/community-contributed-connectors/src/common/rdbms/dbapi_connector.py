@@ -0,0 +1,89 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Base for connectors reading through a Python DB-API driver, without Spark."""
+from typing import Dict
+from typing import Iterator
+from typing import Tuple
+from src.constants import EntryType
+from src.common.ExternalSourceConnector import IExternalSourceConnector
+from src.common.query_ledger import LEDGER
+
+# Number of rows fetched from the database in each round trip, unless set with --fetch_size
+FETCH_SIZE = 1000
+
+class DbApiConnector(IExternalSourceConnector):
+    """Reads data with a DB-API 2.0 connection and returns iterators of row tuples.
+    Subclasses provide the connection, and the SQL through the same query methods
+    used by the Spark connector of the source"""
+
+    def __init__(self, config: Dict[str, str], connection):
+        self._config = config
+        self._connection = connection
+
+    def _execute(self, query: str) -> Iterator[Tuple]:
+        """Executes a query, yielding rows as they are fetched. The query is recorded in the ledger once all rows are read,
+        and with throttling all rows are fetched before the first is yielded, see QueryLedger.track"""
+        return LEDGER.track(query, self._fetch(query))
+
+    def _fetch(self, query: str) -> Iterator[Tuple]:
+        fetch_size = self._config.get('fetch_size') or FETCH_SIZE
+        cursor = self._connection.cursor()
+        try:
+            cursor.arraysize = fetch_size
+            cursor.execute(query)
+            while True:
+                rows = cursor.fetchmany(fetch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
+
+    def get_db_schemas(self) -> Iterator[Tuple]:
+        """Returns rows with the name of each schema to extract."""
+        return self._execute(self._get_schemas_query())
+
+    def get_dataset(self, schema_name: str, entry_type: EntryType) -> Iterator[Tuple]:
+        """Returns (table name, column name, data type, is nullable) rows of tables or views in a schema.
+        Rows are ordered by table, as required by python_entry_builder.build_dataset"""
+        query = self._get_dataset_query(schema_name, entry_type)
+        order_by = self._get_dataset_order_by()
+        if order_by is not None:
+            query = f"{query} ORDER BY {order_by}"
+        return self._execute(query)
+
+    def get_schema_last_modified(self) -> Iterator[Tuple]:
+        """Returns (schema name, last modified, object count) rows, or None if not supported by the source."""
+        query = self._get_schema_last_modified_query()
+        if query is None:
+            return None
+        return self._execute(query)
+
+    def get_databases(self) -> Iterator[Tuple]:
+        """Returns rows with the name of each user database, or None if not supported by the source."""
+        query = self._get_databases_query()
+        if query is None:
+            return None
+        return self._execute(query)
+
+    def _get_dataset_order_by(self) -> str:
+        """ORDER BY clause of the dataset query, or None if the query is already ordered by table."""
+        return None
+
+    def _get_schema_last_modified_query(self) -> str:
+        return None
+
+    def _get_databases_query(self) -> str:
+        return None
@@ -12,10 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""Creates entries with PySpark."""
-import pyspark.sql.functions as F
-from pyspark.sql.types import StringType
-from src.datatype_mapper import get_catalog_metadata_type
+"""Creates entries with PySpark.
+Spark is imported by each function, so runs with --engine python can import the module without it."""
+from src.common.datatype_rules import get_rules
 from src.constants import SOURCE_TYPE
 from src.constants import COLLECTION_ENTRY
 from src import name_builder as nb
@@ -23,52 +22,54 @@ from src import name_builder as nb
 # DB-specific value which indicates true
 from src.constants import IS_NULLABLE_TRUE
 
-# Property names from Dataplex_v1.Entry object in Camel Case
-KEY_NAME = 'name'
-KEY_MODE = 'mode'
-KEY_ENTRY = 'entry'
-KEY_ENTRY_TYPE = 'entryType'
-KEY_ENTRY_SOURCE = 'entrySource'
-KEY_ASPECT_KEYS = 'aspectKeys'
-KEY_ASPECT_TYPE = 'aspectType'
-KEY_DISPLAY_NAME = 'displayName'
-KEY_UPDATE_MASK = 'updateMask'
-KEY_FQN = 'fullyQualifiedName'
-KEY_PARENT_ENTRY = 'parentEntry'
-KEY_ASPECTS = 'aspects'
-KEY_DATA = 'data'
-KEY_DATA_TYPE = 'dataType'
-KEY_METADATA_TYPE = 'metadataType'
-
-KEY_ENTRY_ASPECT = 'entry_aspect'
-
-KEY_FIELDS = 'fields'
-KEY_SYSTEM = 'system'
-KEY_SCHEMA = 'schema'
-
-KEY_COLUMNS = 'columns'
-
-COLUMN_TABLE_NAME = 'TABLE_NAME'
-COLUMN_DATA_TYPE = 'DATA_TYPE'
-COLUMN_COLUMN_NAME = 'COLUMN_NAME'
-COLUMN_IS_NULLABLE = 'IS_NULLABLE'
-COLUMN_SCHEMA_NAME = 'SCHEMA_NAME'
-
-# Dataplex constants
-VALUE_NULLABLE = 'NULLABLE'
-VALUE_REQUIRED = 'REQUIRED'
-
-# universal catalog system AspectType for database tables and schemas
-SCHEMA_KEY = "dataplex-types.global.schema"
-
-@F.udf(returnType=StringType())
-def choose_metadata_type_udf(data_type: str):
-    """Choose the dataplex metadata type based on native source type."""
-    return get_catalog_metadata_type(data_type)
+# Entry property names and source column names, shared with the Python entry builder
+from src.common.entry_constants import KEY_NAME
+from src.common.entry_constants import KEY_MODE
+from src.common.entry_constants import KEY_ENTRY
+from src.common.entry_constants import KEY_ENTRY_TYPE
+from src.common.entry_constants import KEY_ENTRY_SOURCE
+from src.common.entry_constants import KEY_ASPECT_KEYS
+from src.common.entry_constants import KEY_ASPECT_TYPE
+from src.common.entry_constants import KEY_DISPLAY_NAME
+from src.common.entry_constants import KEY_UPDATE_MASK
+from src.common.entry_constants import KEY_FQN
+from src.common.entry_constants import KEY_PARENT_ENTRY
+from src.common.entry_constants import KEY_ASPECTS
+from src.common.entry_constants import KEY_DATA
+from src.common.entry_constants import KEY_DATA_TYPE
+from src.common.entry_constants import KEY_METADATA_TYPE
+from src.common.entry_constants import KEY_FIELDS
+from src.common.entry_constants import KEY_SYSTEM
+from src.common.entry_constants import KEY_COLUMNS
+from src.common.entry_constants import COLUMN_TABLE_NAME
+from src.common.entry_constants import COLUMN_DATA_TYPE
+from src.common.entry_constants import COLUMN_COLUMN_NAME
+from src.common.entry_constants import COLUMN_IS_NULLABLE
+from src.common.entry_constants import COLUMN_SCHEMA_NAME
+from src.common.entry_constants import COLUMN_ENTRY_NAME
+from src.common.entry_constants import COLUMN_CONTENT_HASH
+from src.common.entry_constants import COLUMN_ENTRY_JSON
+from src.common.entry_constants import VALUE_NULLABLE
+from src.common.entry_constants import VALUE_REQUIRED
+from src.common.entry_constants import SCHEMA_KEY
+
+def metadata_type_expr(column, rules):
+    """Expression applying datatype rules to a data type column: a map lookup
+    for exact matches, then CASE WHEN over prefixes from the longest."""
+    import pyspark.sql.functions as F
+    prefix_expr = F.lit(rules.default)
+    for prefix, metadata_type in sorted(rules.prefixes.items(), key=lambda item: len(item[0])):
+        prefix_expr = F.when(column.startswith(prefix), metadata_type).otherwise(prefix_expr)
+    # An empty map has a null key type, which cannot be looked up by a string column
+    if not rules.exact:
+        return prefix_expr
+    exact = F.create_map(*[F.lit(value) for item in rules.exact.items() for value in item])
+    return F.coalesce(exact[column], prefix_expr)
 
 
 def create_entry_source(column):
     """Create Entry Source segment."""
+    import pyspark.sql.functions as F
     return F.named_struct(F.lit(KEY_DISPLAY_NAME),
                           column,
                           F.lit(KEY_SYSTEM),
@@ -77,6 +78,7 @@ def create_entry_source(column):
 
 def create_entry_aspect(entry_aspect_name):
     """Create aspect with general information (usually it is empty)."""
+    import pyspark.sql.functions as F
     return F.create_map(
         F.lit(entry_aspect_name),
         F.named_struct(
@@ -88,17 +90,23 @@ def create_entry_aspect(entry_aspect_name):
         )
 
 
-def convert_to_import_items(df, aspect_keys):
-    """Convert entries to import items."""
-    entry_columns = [KEY_NAME, KEY_FQN, KEY_PARENT_ENTRY,
-                     KEY_ENTRY_SOURCE, KEY_ASPECTS, KEY_ENTRY_TYPE]
+# Columns of import items, in the order written to json
+IMPORT_ITEM_COLUMNS = [KEY_ENTRY, KEY_ASPECT_KEYS, KEY_UPDATE_MASK]
 
-    # Puts entry to "entry" key, a list of keys from aspects in "aspects_keys"
-    # and "aspects" string in "update_mask"
-    return df.withColumn(KEY_ENTRY, F.struct(entry_columns)) \
-      .withColumn(KEY_ASPECT_KEYS, F.array([F.lit(key) for key in aspect_keys])) \
-      .withColumn(KEY_UPDATE_MASK, F.array(F.lit(KEY_ASPECTS))) \
-      .drop(*entry_columns)
+
+def import_item_columns(name, fqn, parent, entry_source, aspects, entry_type, aspect_keys):
+    """Columns of import items: the entry, a list of keys from aspects in "aspectKeys"
+    and "aspects" in "updateMask"."""
+    import pyspark.sql.functions as F
+    entry = F.struct(name.alias(KEY_NAME),
+                     fqn.alias(KEY_FQN),
+                     parent.alias(KEY_PARENT_ENTRY),
+                     entry_source.alias(KEY_ENTRY_SOURCE),
+                     aspects.alias(KEY_ASPECTS),
+                     entry_type.alias(KEY_ENTRY_TYPE))
+    return [entry.alias(KEY_ENTRY),
+            F.array([F.lit(key) for key in aspect_keys]).alias(KEY_ASPECT_KEYS),
+            F.array(F.lit(KEY_ASPECTS)).alias(KEY_UPDATE_MASK)]
 
 
 def build_schemas(config, df_raw_schemas):
@@ -108,17 +116,13 @@ def build_schemas(config, df_raw_schemas):
     Returns:
         A dataframe with Dataplex-readable schemas.
     """
+    import pyspark.sql.functions as F
     entry_type = COLLECTION_ENTRY
-    entry_aspect_name = nb.create_entry_aspect_name(config, entry_type)
+    hierarchy = nb.HIERARCHY.compile(config)
+    entry_aspect_name = hierarchy.aspect_name(entry_type)
 
     # For schema, parent name is the name of the database
-    parent_name =  nb.create_parent_name(config, entry_type)
-
-    # Create user-defined function.
-    create_name_udf = F.udf(lambda x: nb.create_name(config, entry_type, x),
-                            StringType())
-    create_fqn_udf = F.udf(lambda x: nb.create_fqn(config, entry_type, x),
-                           StringType())
+    parent_name = hierarchy.parent_name(entry_type)
 
     # Fills the project and location into the entry type string
     full_entry_type = entry_type.value.format(
@@ -127,16 +131,16 @@ def build_schemas(config, df_raw_schemas):
 
     # Converts a list of schema names to the Dataplex-compatible form
     column = F.col(COLUMN_SCHEMA_NAME)
-    df = df_raw_schemas.withColumn(KEY_NAME, create_name_udf(column)) \
-      .withColumn(KEY_FQN, create_fqn_udf(column)) \
-      .withColumn(KEY_PARENT_ENTRY, F.lit(parent_name)) \
-      .withColumn(KEY_ENTRY_TYPE, F.lit(full_entry_type)) \
-      .withColumn(KEY_ENTRY_SOURCE, create_entry_source(column)) \
-      .withColumn(KEY_ASPECTS, create_entry_aspect(entry_aspect_name)) \
-    .drop(column)
+    name = hierarchy.name_expr(entry_type, column)
+    fqn = hierarchy.fqn_expr(entry_type, column)
 
-    df = convert_to_import_items(df, [entry_aspect_name])
-    return df
+    return df_raw_schemas.select(*import_item_columns(name,
+                                                      fqn,
+                                                      F.lit(parent_name),
+                                                      create_entry_source(column),
+                                                      create_entry_aspect(entry_aspect_name),
+                                                      F.lit(full_entry_type),
+                                                      [entry_aspect_name]))
 
 
 def build_dataset(config, df_raw, db_schema, entry_type):
@@ -144,62 +148,46 @@ def build_dataset(config, df_raw, db_schema, entry_type):
     Args:
         df_raw - a plain dataframe with TABLE_NAME, COLUMN_NAME, DATA_TYPE,
                  and NULLABLE columns
-        db_schema - parent database schema
+        db_schema - parent database schema, or None if df_raw holds objects of
+                    several schemas in a SCHEMA_NAME column
         entry_type - entry type: table or view
     Returns:
-        A dataframe with Dataplex-readable data of tables of views.
+        A dataframe with Dataplex-readable data of tables of views, led by the
+        SCHEMA_NAME column when db_schema is None.
     """
-
-    # The transformation below does the following
-    # 1. Alters IS_NULLABLE content from 1/0 to NULLABLE/REQUIRED
-    # 2. Renames IS_NULLABLE to mode
-    # 3. Creates metadataType column based on dataType column
-    # 4. Renames COLUMN_NAME to name
-    df = df_raw \
-      .withColumn(KEY_MODE, F.when(F.col(COLUMN_IS_NULLABLE) == IS_NULLABLE_TRUE, VALUE_NULLABLE).otherwise(VALUE_REQUIRED)) \
-        .drop(COLUMN_IS_NULLABLE) \
-        .withColumnRenamed(COLUMN_DATA_TYPE, KEY_DATA_TYPE) \
-        .withColumn(KEY_METADATA_TYPE, choose_metadata_type_udf(KEY_DATA_TYPE)) \
-        .withColumnRenamed(COLUMN_COLUMN_NAME, KEY_NAME)
+    import pyspark.sql.functions as F
+    # Each column becomes a field struct with
+    # 1. name from COLUMN_NAME
+    # 2. mode NULLABLE/REQUIRED from IS_NULLABLE
+    # 3. dataType from DATA_TYPE
+    # 4. metadataType mapped from DATA_TYPE
+    data_type = F.col(COLUMN_DATA_TYPE)
+    field = F.struct(F.col(COLUMN_COLUMN_NAME).alias(KEY_NAME),
+                     F.when(F.col(COLUMN_IS_NULLABLE) == IS_NULLABLE_TRUE, VALUE_NULLABLE)
+                      .otherwise(VALUE_REQUIRED).alias(KEY_MODE),
+                     data_type.alias(KEY_DATA_TYPE),
+                     metadata_type_expr(data_type, get_rules(config)).alias(KEY_METADATA_TYPE))
 
     # transformation below aggregates fields, denormalizing the table
     # TABLE_NAME becomes top-level field, rest put into array type "fields"
-    aspect_columns = [KEY_NAME, KEY_MODE, KEY_DATA_TYPE, KEY_METADATA_TYPE]
-    df = df.withColumn(KEY_COLUMNS, F.struct(aspect_columns)) \
-      .groupby(COLUMN_TABLE_NAME) \
+    group_columns = [COLUMN_TABLE_NAME] if db_schema is not None else [COLUMN_SCHEMA_NAME, COLUMN_TABLE_NAME]
+    df = df_raw.select(*group_columns, field.alias(KEY_COLUMNS)) \
+      .groupby(*group_columns) \
       .agg(F.collect_list(KEY_COLUMNS).alias(KEY_FIELDS))
 
     # Create nested structured called aspects.
     # Fields are becoming a part of a `schema` struct
     # There is also an entry_aspect that is repeats entry_type as aspect_type
-    entry_aspect_name = nb.create_entry_aspect_name(config, entry_type)
-    df = df.withColumn(KEY_SCHEMA,
-                       F.create_map(F.lit(SCHEMA_KEY),
-                                    F.named_struct(
-                                        F.lit(KEY_ASPECT_TYPE),
-                                        F.lit(SCHEMA_KEY),
-                                        F.lit(KEY_DATA),
-                                        F.create_map(F.lit(KEY_FIELDS),
-                                                     F.col(KEY_FIELDS)))\
-                                    )\
-                       )\
-      .withColumn(KEY_ENTRY_ASPECT, create_entry_aspect(entry_aspect_name)) \
-    .drop(KEY_FIELDS)
-
-    # Merge separate aspect columns into the one map called 'aspects'
-    df = df.select(F.col(COLUMN_TABLE_NAME),
-                   F.map_concat(KEY_SCHEMA, KEY_ENTRY_ASPECT).alias(KEY_ASPECTS))
-
-    # Define user-defined functions to fill the general information
-    # and hierarchy names
-    create_name_udf = F.udf(lambda x: nb.create_name(config, entry_type,
-                                                     db_schema, x),
-                            StringType())
-
-    create_fqn_udf = F.udf(lambda x: nb.create_fqn(config, entry_type,
-                                                   db_schema, x), StringType())
-
-    parent_name = nb.create_parent_name(config,entry_type, db_schema)
+    hierarchy = nb.HIERARCHY.compile(config)
+    entry_aspect_name = hierarchy.aspect_name(entry_type)
+    schema_aspect = F.create_map(F.lit(SCHEMA_KEY),
+                                 F.named_struct(
+                                     F.lit(KEY_ASPECT_TYPE),
+                                     F.lit(SCHEMA_KEY),
+                                     F.lit(KEY_DATA),
+                                     F.create_map(F.lit(KEY_FIELDS),
+                                                  F.col(KEY_FIELDS))))
+    aspects = F.map_concat(schema_aspect, create_entry_aspect(entry_aspect_name))
 
     full_entry_type = entry_type.value.format(
         project=config["target_project_id"],
@@ -208,12 +196,51 @@ def build_dataset(config, df_raw, db_schema, entry_type):
     # Fill the top-level fields
     column = F.col(COLUMN_TABLE_NAME)
 
-    df = df.withColumn(KEY_NAME, create_name_udf(column)) \
-      .withColumn(KEY_FQN, create_fqn_udf(column)) \
-      .withColumn(KEY_ENTRY_TYPE, F.lit(full_entry_type)) \
-      .withColumn(KEY_PARENT_ENTRY, F.lit(parent_name)) \
-      .withColumn(KEY_ENTRY_SOURCE, create_entry_source(column)) \
-    .drop(column)
-
-    df = convert_to_import_items(df, [SCHEMA_KEY, entry_aspect_name])
-    return df
+    # Constant parts of the hierarchy names are rendered once, and names filled in from the columns of each row
+    if db_schema is not None:
+        name = hierarchy.name_expr(entry_type, db_schema, column)
+        fqn = hierarchy.fqn_expr(entry_type, db_schema, column)
+        parent = F.lit(hierarchy.parent_name(entry_type, db_schema))
+    else:
+        # Schema name comes from the SCHEMA_NAME column of each row
+        schema_column = F.col(COLUMN_SCHEMA_NAME)
+        name = hierarchy.name_expr(entry_type, schema_column, column)
+        fqn = hierarchy.fqn_expr(entry_type, schema_column, column)
+        parent = hierarchy.parent_expr(entry_type, schema_column)
+
+    key_columns = [] if db_schema is not None else [COLUMN_SCHEMA_NAME]
+    return df.select(*key_columns,
+                     *import_item_columns(name,
+                                          fqn,
+                                          parent,
+                                          create_entry_source(column),
+                                          aspects,
+                                          F.lit(full_entry_type),
+                                          [SCHEMA_KEY, entry_aspect_name]))
+
+
+def content_hash(df):
+    """Stable hash of the content of import items.
+    Fields are sorted so the hash does not depend on the order columns are returned by the source.
+    Entries without fields, eg. schemas, are hashed by entry type and parent only."""
+    import pyspark.sql.functions as F
+    from pyspark.sql.types import NullType
+    entry = df[KEY_ENTRY]
+    parts = [entry.getField(KEY_ENTRY_TYPE), entry.getField(KEY_PARENT_ENTRY)]
+    # Aspect data of entries without fields is an empty map, whose null key type cannot be looked up
+    aspect_data = df.schema[KEY_ENTRY].dataType[KEY_ASPECTS].dataType.valueType[KEY_DATA].dataType
+    if not isinstance(aspect_data.keyType, NullType):
+        fields = entry.getField(KEY_ASPECTS).getItem(SCHEMA_KEY) \
+          .getField(KEY_DATA).getItem(KEY_FIELDS)
+        parts.append(F.to_json(F.array_sort(fields)))
+    return F.sha2(F.concat_ws("|", *parts), 256)
+
+
+def to_hashed_json(df, *key_columns):
+    """Converts import items to entry name, content hash and json columns,
+    preceded by key_columns, eg. SCHEMA_NAME, which are left out of the json."""
+    import pyspark.sql.functions as F
+    return df.select(*key_columns,
+                     df[KEY_ENTRY].getField(KEY_NAME).alias(COLUMN_ENTRY_NAME),
+                     content_hash(df).alias(COLUMN_CONTENT_HASH),
+                     F.to_json(F.struct(*IMPORT_ITEM_COLUMNS)).alias(COLUMN_ENTRY_JSON))
@@ -0,0 +1,67 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Entry property names and source column names used to build entries.
+Kept free of Spark imports so they can be used without a JVM."""
+
+# Property names from Dataplex_v1.Entry object in Camel Case
+KEY_NAME = 'name'
+KEY_MODE = 'mode'
+KEY_ENTRY = 'entry'
+KEY_ENTRY_TYPE = 'entryType'
+KEY_ENTRY_SOURCE = 'entrySource'
+KEY_ASPECT_KEYS = 'aspectKeys'
+KEY_ASPECT_TYPE = 'aspectType'
+KEY_DISPLAY_NAME = 'displayName'
+KEY_UPDATE_MASK = 'updateMask'
+KEY_FQN = 'fullyQualifiedName'
+KEY_PARENT_ENTRY = 'parentEntry'
+KEY_ASPECTS = 'aspects'
+KEY_DATA = 'data'
+KEY_DATA_TYPE = 'dataType'
+KEY_METADATA_TYPE = 'metadataType'
+
+KEY_ENTRY_ASPECT = 'entry_aspect'
+
+KEY_FIELDS = 'fields'
+KEY_SYSTEM = 'system'
+KEY_SCHEMA = 'schema'
+
+KEY_COLUMNS = 'columns'
+
+COLUMN_TABLE_NAME = 'TABLE_NAME'
+COLUMN_DATA_TYPE = 'DATA_TYPE'
+COLUMN_COLUMN_NAME = 'COLUMN_NAME'
+COLUMN_IS_NULLABLE = 'IS_NULLABLE'
+COLUMN_SCHEMA_NAME = 'SCHEMA_NAME'
+# EntryType name (TABLE, VIEW) of the db object, returned by get_all_datasets
+COLUMN_OBJECT_TYPE = 'OBJECT_TYPE'
+# Change detection columns returned by get_schema_last_modified
+COLUMN_LAST_MODIFIED = 'LAST_MODIFIED'
+COLUMN_OBJECT_COUNT = 'OBJECT_COUNT'
+# Database name column returned by get_databases
+COLUMN_DATABASE_NAME = 'DATABASE_NAME'
+
+# Columns of entries converted to json with a content hash
+COLUMN_ENTRY_NAME = 'ENTRY_NAME'
+COLUMN_CONTENT_HASH = 'CONTENT_HASH'
+COLUMN_ENTRY_JSON = 'value'
+HASHED_ENTRY_SCHEMA = f"{COLUMN_ENTRY_NAME} string, {COLUMN_CONTENT_HASH} string, {COLUMN_ENTRY_JSON} string"
+
+# Dataplex constants
+VALUE_NULLABLE = 'NULLABLE'
+VALUE_REQUIRED = 'REQUIRED'
+
+# universal catalog system AspectType for database tables and schemas
+SCHEMA_KEY = "dataplex-types.global.schema"
@@ -0,0 +1,89 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tracks content hashes of entries between runs for incremental extraction."""
+import hashlib
+import json
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Tuple
+from src.common.gcs_uploader import read_text
+from src.common.gcs_uploader import write_text
+
+# State file property names
+KEY_ENTRIES = 'entries'
+KEY_DELETED_ENTRIES = 'deletedEntries'
+
+def hash_json(json_string: str) -> str:
+    """Content hash of an entry built on the driver."""
+    return hashlib.sha256(json_string.encode("utf-8")).hexdigest()
+
+def deleted_entries_uri(state_uri: str) -> str:
+    """Location of the list of deleted entries, next to the state file"""
+    base = state_uri[:-len(".json")] if state_uri.endswith(".json") else state_uri
+    return f"{base}.deleted.json"
+
+class EntryState:
+    """Content hashes of entries keyed by entry name, for the previous and the current run."""
+
+    def __init__(self, previous_hashes: Dict[str, str] = None):
+        self._previous = previous_hashes or {}
+        self._current = {}
+        self.unchanged_count = 0
+
+    @classmethod
+    def load(cls, uri: str):
+        """Loads state of the previous run from a local path or gs:// URI. Empty if there is none"""
+        content = read_text(uri)
+        if content is None:
+            return cls()
+        return cls(json.loads(content)[KEY_ENTRIES])
+
+    @property
+    def previous_hashes(self) -> Dict[str, str]:
+        return self._previous
+
+    def has_previous(self) -> bool:
+        return len(self._previous) > 0
+
+    @property
+    def current_count(self) -> int:
+        """Number of entries recorded in the current run."""
+        return len(self._current)
+
+    def record(self, entries: Iterable[Tuple[str, str]]):
+        """Records (name, content hash) of entries in the current run."""
+        for name, content_hash in entries:
+            self._current[name] = content_hash
+
+    def filter_changed(self, entries: Iterable[Tuple[str, str, str]], incremental: bool) -> Iterator[str]:
+        """Records (name, content hash, json) entries and yields the json of those to output.
+        If incremental, only new or changed entries are yielded"""
+        for name, content_hash, json_string in entries:
+            self._current[name] = content_hash
+            if incremental and self._previous.get(name) == content_hash:
+                self.unchanged_count += 1
+                continue
+            yield json_string
+
+    def deleted_entries(self) -> List[str]:
+        """Names of entries in the previous run which no longer exist."""
+        return sorted(name for name in self._previous if name not in self._current)
+
+    def save(self, uri: str):
+        """Saves current state and the list of deleted entries to a local path or gs:// URI."""
+        write_text(uri, json.dumps({KEY_ENTRIES: self._current}))
+        write_text(deleted_entries_uri(uri), json.dumps({KEY_DELETED_ENTRIES: self.deleted_entries()}, indent=2))
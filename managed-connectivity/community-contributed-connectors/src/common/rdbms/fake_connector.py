@@ -0,0 +1,129 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Serves metadata from a catalog dump or a synthetic catalog in place of the source database."""
+import csv
+import itertools
+import os
+from operator import itemgetter
+from typing import TYPE_CHECKING
+from typing import Dict
+from typing import List
+from typing import Tuple
+from src.constants import EntryType
+from src.common.ExternalSourceConnector import IExternalSourceConnector
+from src.common.argument_validator import ENGINE_PYTHON
+from src.common.synthetic_catalog import SyntheticCatalog
+from src.common.entry_constants import COLUMN_SCHEMA_NAME
+from src.common.entry_constants import COLUMN_OBJECT_TYPE
+from src.common.entry_constants import COLUMN_TABLE_NAME
+from src.common.entry_constants import COLUMN_COLUMN_NAME
+from src.common.entry_constants import COLUMN_DATA_TYPE
+from src.common.entry_constants import COLUMN_IS_NULLABLE
+
+# Spark is only imported by runs with --engine spark
+if TYPE_CHECKING:
+    from pyspark.sql import DataFrame
+
+# --fake_catalog value which generates a catalog of --synthetic_shape. Any other value is the path of a catalog dump
+FAKE_CATALOG_SYNTHETIC = "synthetic"
+
+# Columns of a catalog dump, as returned by get_all_datasets
+DUMP_COLUMNS = [COLUMN_SCHEMA_NAME, COLUMN_OBJECT_TYPE, COLUMN_TABLE_NAME, COLUMN_COLUMN_NAME, COLUMN_DATA_TYPE,
+                COLUMN_IS_NULLABLE]
+
+def _is_parquet(path: str) -> bool:
+    # Spark writes Parquet as a directory of part files
+    return path.endswith(".parquet") or os.path.isdir(path)
+
+def _read_csv_rows(path: str) -> List[Tuple]:
+    """Reads a CSV catalog dump with a header row as tuples of DUMP_COLUMNS."""
+    with open(path, "r", encoding="utf-8", newline="") as file:
+        reader = csv.DictReader(file)
+        missing = [column for column in DUMP_COLUMNS if column not in (reader.fieldnames or [])]
+        if missing:
+            raise Exception(f"Catalog dump {path} is missing columns: {', '.join(missing)}")
+        return [tuple(row[column] for column in DUMP_COLUMNS) for row in reader]
+
+class FakeConnector(IExternalSourceConnector):
+    """Reads metadata from a CSV or Parquet catalog dump, or generates a synthetic catalog, so the
+    pipeline runs without a source database. Returns Spark dataframes, or rows with --engine python.
+    A dump has the columns returned by get_all_datasets, as written by eg.
+    connector.get_all_datasets().write.parquet(path)"""
+
+    def __init__(self, config: Dict[str, str]):
+        self._config = config
+        self._source = config.get('fake_catalog') or FAKE_CATALOG_SYNTHETIC
+        self._synthetic = None
+        self._rows = None
+        self._spark = None
+        self._df_catalog = None
+
+        if self._source == FAKE_CATALOG_SYNTHETIC:
+            self._synthetic = SyntheticCatalog.from_config(config)
+        elif not os.path.exists(self._source):
+            raise Exception(f"Catalog dump {self._source} not found")
+
+        if config['engine'] == ENGINE_PYTHON:
+            if self._synthetic is None:
+                if _is_parquet(self._source):
+                    raise Exception("Parquet catalog dumps require --engine spark")
+                # Rows of each schema and object type, ordered by table keeping the column order of each table
+                rows = sorted(_read_csv_rows(self._source), key=itemgetter(0, 1, 2))
+                self._rows = {key: [row[2:] for row in group] for key, group in itertools.groupby(rows, key=itemgetter(0, 1))}
+        else:
+            from src.common.spark_session import get_spark_session
+            self._spark = get_spark_session("FakeIngestor", "", config)
+
+    def _all_datasets(self) -> "DataFrame":
+        # Read or generated once, so every schema is filtered from the same persisted catalog
+        if self._df_catalog is None:
+            if self._synthetic is not None:
+                df = self._synthetic.catalog_df(self._spark)
+            elif _is_parquet(self._source):
+                df = self._spark.read.parquet(self._source)
+            else:
+                df = self._spark.read.option("header", "true").csv(self._source)
+            self._df_catalog = df.select(*DUMP_COLUMNS).persist()
+            self._df_catalog.count()
+        return self._df_catalog
+
+    def _schema_names(self) -> List[str]:
+        if self._synthetic is not None:
+            return self._synthetic.schema_names()
+        return sorted({schema_name for schema_name, _ in self._rows})
+
+    def get_db_schemas(self):
+        if self._spark is None:
+            return [(name,) for name in self._schema_names()]
+        if self._synthetic is not None:
+            return self._synthetic.schemas_df(self._spark).persist()
+        return self._all_datasets().select(COLUMN_SCHEMA_NAME).distinct().orderBy(COLUMN_SCHEMA_NAME).persist()
+
+    def get_dataset(self, schema_name: str, entry_type: EntryType):
+        """Gets data for the tables or views of a schema."""
+        if self._spark is None:
+            if self._synthetic is not None:
+                return self._synthetic.dataset_rows(schema_name, entry_type)
+            return self._rows.get((schema_name, entry_type.name), [])
+        import pyspark.sql.functions as F
+        return self._all_datasets() \
+            .filter((F.col(COLUMN_SCHEMA_NAME) == schema_name) & (F.col(COLUMN_OBJECT_TYPE) == entry_type.name)) \
+            .drop(COLUMN_SCHEMA_NAME, COLUMN_OBJECT_TYPE)
+
+    def get_all_datasets(self) -> "DataFrame":
+        """Gets data for all tables and views of the catalog."""
+        if self._spark is None:
+            return None
+        return self._all_datasets()
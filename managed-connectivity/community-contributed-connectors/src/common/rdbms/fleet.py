@@ -0,0 +1,164 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Extracts metadata from a fleet of sources listed in an inventory file, several at a time.
+Run from a connector directory with python -m src.common.fleet --inventory sources.json"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict
+from typing import List
+from src import cmd_reader
+from src.constants import SOURCE_TYPE
+from src.common import bootstrap
+from src.common.query_ledger import LEDGER
+from src.common.run_report import REPORT
+
+# Inventory property names
+KEY_DEFAULTS = 'defaults'
+KEY_SOURCES = 'sources'
+KEY_SOURCE_TYPE = 'sourceType'
+
+# Fleet report property names
+KEY_SOURCE = 'source'
+KEY_STATUS = 'status'
+KEY_SECONDS = 'seconds'
+KEY_ERROR = 'error'
+KEY_RESULTS = 'results'
+
+# Result of each source
+STATUS_OK = "ok"
+STATUS_FAILED = "failed"
+STATUS_SKIPPED = "skipped"
+
+def source_argv(source: Dict) -> List[str]:
+    """Command line arguments of a source in the inventory. true is given as a flag, eg. local_output_only,
+    lists as a repeated argument, eg. spark_conf, and other values as on the command line"""
+    argv = []
+    for name, value in source.items():
+        if value is None or value is False:
+            continue
+        if value is True:
+            argv.append(f"--{name}")
+        elif isinstance(value, list):
+            for item in value:
+                argv += [f"--{name}", str(item)]
+        else:
+            argv += [f"--{name}", str(value)]
+    return argv
+
+def read_inventory(path: str) -> List[Dict]:
+    """Reads the sources of an inventory file, each with the defaults of the inventory applied."""
+    with open(path, "r", encoding="utf-8") as file:
+        inventory = json.load(file)
+    if not isinstance(inventory.get(KEY_SOURCES), list) or len(inventory[KEY_SOURCES]) == 0:
+        raise Exception(f"Inventory {path} must list at least one source in '{KEY_SOURCES}'")
+    defaults = inventory.get(KEY_DEFAULTS, {})
+    return [{**defaults, **source} for source in inventory[KEY_SOURCES]]
+
+def _source_label(source: Dict) -> str:
+    return "/".join(str(source[key]) for key in ['host', 'account', 'instancename', 'database', 'service', 'sid']
+                    if source.get(key))
+
+def _extract_in_worker(config: Dict):
+    """Extracts a source in a worker process, with a ledger and run report of that source only.
+    Workers are reused for later sources, keeping their imports and, with --engine spark, their Spark session"""
+    LEDGER.reset()
+    REPORT.reset()
+    bootstrap.extract(config)
+
+async def extract_fleet(sources: List[Dict], max_concurrency: int, max_per_host: int) -> List[Dict]:
+    """Extracts each source in a pool of max_concurrency worker processes, with at most
+    max_per_host sources of the same host at a time. Returns the result of each source"""
+    loop = asyncio.get_running_loop()
+    fleet_slots = asyncio.Semaphore(max_concurrency)
+    host_slots = defaultdict(lambda: asyncio.Semaphore(max_per_host))
+
+    # Spawned workers do not inherit the locks of threads reading arguments in this process
+    with ProcessPoolExecutor(max_workers=max_concurrency, mp_context=multiprocessing.get_context("spawn")) as workers:
+
+        async def extract_source(source: Dict) -> Dict:
+            source = dict(source)
+            source_type = source.pop(KEY_SOURCE_TYPE, SOURCE_TYPE)
+            result = {KEY_SOURCE: _source_label(source)}
+            if source_type != SOURCE_TYPE:
+                return {**result, KEY_STATUS: STATUS_SKIPPED, KEY_ERROR: f"{source_type} source, run from the {source_type} connector"}
+            async with fleet_slots, host_slots[source.get('host') or source.get('account')]:
+                started = time.time()
+                try:
+                    # Reads secrets here, so sources sharing a secret read it once
+                    config = await asyncio.to_thread(cmd_reader.read_args, source_argv(source))
+                    await loop.run_in_executor(workers, _extract_in_worker, config)
+                    status, error = STATUS_OK, None
+                except (Exception, SystemExit) as ex:
+                    status, error = STATUS_FAILED, str(ex) or type(ex).__name__
+                print(f"{result[KEY_SOURCE]}: {status} in {time.time() - started:.1f}s" + (f" - {error}" if error else ""))
+                return {**result, KEY_STATUS: status, KEY_SECONDS: round(time.time() - started, 3), KEY_ERROR: error}
+
+        return await asyncio.gather(*(extract_source(source) for source in sources))
+
+def read_args() -> Dict:
+    """Reads fleet arguments from the command line."""
+    parser = argparse.ArgumentParser(description=f"Extracts metadata from the {SOURCE_TYPE} sources of an inventory file")
+    parser.add_argument("--inventory", type=str, required=True,
+                        help=f"Json file listing the sources to extract in '{KEY_SOURCES}', each with the arguments of the connector, and arguments shared by all sources in '{KEY_DEFAULTS}'")
+    parser.add_argument("--max_concurrency", type=int, required=False, default=8,
+                        help="Maximum number of sources extracted at a time, each in its own worker process")
+    parser.add_argument("--max_per_host", type=int, required=False, default=1,
+                        help="Maximum number of sources of the same host extracted at a time, eg. databases of a server")
+    parsed_args = parser.parse_args()
+
+    if parsed_args.max_concurrency < 1:
+        raise Exception(f"--max_concurrency must be 1 or greater : {parsed_args.max_concurrency}")
+
+    if parsed_args.max_per_host < 1:
+        raise Exception(f"--max_per_host must be 1 or greater : {parsed_args.max_per_host}")
+
+    return vars(parsed_args)
+
+def run():
+    """Extracts every source of the inventory, then writes the result of each. Exits with an error if any failed"""
+    try:
+        config = read_args()
+        sources = read_inventory(config['inventory'])
+    except Exception as ex:
+        print(f"Error in arguments: {ex}")
+        sys.exit(1)
+
+    print(f"Extracting metadata from {len(sources)} {SOURCE_TYPE} sources, {config['max_concurrency']} at a time")
+    started = time.time()
+    results = asyncio.run(extract_fleet(sources, config['max_concurrency'], config['max_per_host']))
+    completed = [result for result in results if result[KEY_STATUS] == STATUS_OK]
+    failed = [result for result in results if result[KEY_STATUS] == STATUS_FAILED]
+    print(f"{len(completed)} of {len(results)} sources completed, {len(failed)} failed in {time.time() - started:.1f}s")
+
+    output_path = './output'
+    if not os.path.exists(output_path):
+        os.mkdir(output_path)
+    fleet_file = f"{output_path}/fleet-{SOURCE_TYPE}.json"
+    with open(fleet_file, "w", encoding="utf-8") as file:
+        json.dump({KEY_SECONDS: round(time.time() - started, 3), KEY_RESULTS: results}, file, indent=2)
+    print(f"Result of each source written to {fleet_file}")
+
+    if failed:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,254 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Entry hierarchy of a source, rendering entry names and fully qualified names from templates compiled once per run."""
+import functools
+import re
+from string import Formatter
+from typing import TYPE_CHECKING
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+from src.constants import EntryType
+
+# Spark is only needed for column expressions, so names can also be rendered without it
+if TYPE_CHECKING:
+    from pyspark.sql import Column
+
+# Placeholders of the schema and table name of each entry. Other placeholders are argument values, eg. {host}
+SCHEMA = "schema"
+TABLE = "table"
+
+# Start of the name of every entry, followed by the name of the top level entry
+ENTRIES_PREFIX = ("projects/{target_project_id}/locations/{target_location_id}/"
+                  "entryGroups/{target_entry_group_id}/entries/")
+
+# Schema names can hold # (eg. Oracle common users, C##NAME), which Dataplex does not accept in names.
+# It is changed to ! in names, and such schemas are escaped with backticks in fully qualified names
+FORBIDDEN_SYMBOL = "#"
+ALLOWED_SYMBOL = "!"
+
+# Compiled hierarchies kept for the most recent argument values, eg. of the databases of a run or the sources
+# extracted by a fleet worker
+COMPILED_CACHE_SIZE = 64
+
+class Level:
+    """A level of the hierarchy of a source, with templates of its name and fully qualified name which
+    are appended to those of its parent level. The name of the top level follows ENTRIES_PREFIX.
+    fqn_parent is the level the fully qualified name is appended to, if not the parent"""
+
+    def __init__(self, entry_type: EntryType, name: str, fqn: str, parent: EntryType = None,
+                 fqn_parent: EntryType = None):
+        self.entry_type = entry_type
+        self.name = name
+        self.fqn = fqn
+        self.parent = parent
+        self.fqn_parent = fqn_parent or parent
+
+def _parse(template: str) -> List[Tuple[str, str]]:
+    """Splits a template into (literal text, placeholder or None) parts."""
+    return [(text, field) for text, field, _, _ in Formatter().parse(template)]
+
+def _escape_braces(value: str) -> str:
+    return value.replace("{", "{{").replace("}", "}}")
+
+def _name_schema(schema_name: str) -> str:
+    """Schema name as used in entry names."""
+    if FORBIDDEN_SYMBOL in schema_name:
+        return schema_name.replace(FORBIDDEN_SYMBOL, ALLOWED_SYMBOL)
+    return schema_name
+
+def _fqn_schema(schema_name: str) -> str:
+    """Schema name as used in fully qualified names."""
+    if FORBIDDEN_SYMBOL in schema_name:
+        return f"`{schema_name}`"
+    return schema_name
+
+def _name_schema_expr(column: "Column") -> "Column":
+    import pyspark.sql.functions as F
+    return F.regexp_replace(column, re.escape(FORBIDDEN_SYMBOL), ALLOWED_SYMBOL)
+
+def _fqn_schema_expr(column: "Column") -> "Column":
+    import pyspark.sql.functions as F
+    return F.when(column.contains(FORBIDDEN_SYMBOL), F.concat(F.lit("`"), column, F.lit("`"))).otherwise(column)
+
+class CompiledHierarchy:
+    """Names of the entries of a run, with the argument values filled into the templates of each level.
+    Renders names of schemas and tables in Python, or as Spark column expressions"""
+
+    def __init__(self, names: Dict[EntryType, List[Tuple[str, str]]], fqns: Dict[EntryType, List[Tuple[str, str]]],
+                 parents: Dict[EntryType, EntryType], aspect_names: Dict[EntryType, str]):
+        self._name_parts = names
+        self._fqn_parts = fqns
+        self._parents = parents
+        self._aspect_names = aspect_names
+        # Format strings holding only the {schema} and {table} placeholders
+        self._names = {entry_type: self._format_string(parts) for entry_type, parts in names.items()}
+        self._fqns = {entry_type: self._format_string(parts) for entry_type, parts in fqns.items()}
+
+    @staticmethod
+    def _format_string(parts: List[Tuple[str, str]]) -> str:
+        return "".join(_escape_braces(text) + (f"{{{placeholder}}}" if placeholder else "") for text, placeholder in parts)
+
+    def name(self, entry_type: EntryType, schema_name: str = "", table_name: str = "") -> str:
+        """Dataplex v2 hierarchy name of an entry."""
+        template = self._names.get(entry_type)
+        if template is None:
+            return ""
+        return template.format(schema=_name_schema(schema_name), table=table_name)
+
+    def fqn(self, entry_type: EntryType, schema_name: str = "", table_name: str = "") -> str:
+        """Fully qualified name or Dataplex v1 hierarchy name of an entry."""
+        template = self._fqns.get(entry_type)
+        if template is None:
+            return ""
+        return template.format(schema=_fqn_schema(schema_name), table=table_name)
+
+    def parent_name(self, entry_type: EntryType, schema_name: str = "") -> str:
+        """Dataplex v2 name of the parent of an entry. Empty for the top level"""
+        parent = self._parents.get(entry_type)
+        if parent is None:
+            return ""
+        return self.name(parent, schema_name)
+
+    def aspect_name(self, entry_type: EntryType) -> str:
+        """Name of the entry aspect of an entry type."""
+        return self._aspect_names[entry_type]
+
+    @staticmethod
+    def _expr(parts: List[Tuple[str, str]], values: Dict[str, Union[str, "Column"]], schema_str: Callable,
+              schema_column: Callable) -> "Column":
+        """Expression concatenating the parts of a template, with each placeholder replaced by
+        a name, or by the column expression giving the name of each row."""
+        import pyspark.sql.functions as F
+        columns = []
+        literal = ""
+        for text, placeholder in parts:
+            literal += text
+            if placeholder is None:
+                continue
+            value = values[placeholder]
+            if isinstance(value, str):
+                literal += schema_str(value) if placeholder == SCHEMA else value
+                continue
+            if literal:
+                columns.append(F.lit(literal))
+                literal = ""
+            columns.append(schema_column(value) if placeholder == SCHEMA else value)
+        if literal or not columns:
+            columns.append(F.lit(literal))
+        return F.concat(*columns) if len(columns) > 1 else columns[0]
+
+    def name_expr(self, entry_type: EntryType, schema: Union[str, "Column"] = "",
+                  table: Union[str, "Column"] = "") -> "Column":
+        """Expression of the Dataplex v2 hierarchy name, from schema and table names or columns."""
+        return self._expr(self._name_parts.get(entry_type, []), {SCHEMA: schema, TABLE: table},
+                          _name_schema, _name_schema_expr)
+
+    def fqn_expr(self, entry_type: EntryType, schema: Union[str, "Column"] = "",
+                 table: Union[str, "Column"] = "") -> "Column":
+        """Expression of the fully qualified name, from schema and table names or columns."""
+        return self._expr(self._fqn_parts.get(entry_type, []), {SCHEMA: schema, TABLE: table},
+                          _fqn_schema, _fqn_schema_expr)
+
+    def parent_expr(self, entry_type: EntryType, schema: Union[str, "Column"] = "") -> "Column":
+        """Expression of the Dataplex v2 name of the parent, from a schema name or column."""
+        parent = self._parents.get(entry_type)
+        return self.name_expr(parent, schema) if parent is not None else self.name_expr(None)
+
+class Hierarchy:
+    """Levels of the entries of a source and the escaping of argument values in their names.
+        name_escapes - characters replaced in argument values of names, eg. {'host': {':': '@'}}
+        values - function returning values derived from the arguments, eg. a database name
+                 which is one of two arguments
+    Compiled once for each distinct set of argument values, eg. once per database extracted"""
+
+    def __init__(self, levels: List[Level], name_escapes: Dict[str, Dict[str, str]] = None,
+                 values: Callable[[Dict], Dict] = None):
+        self._levels = {level.entry_type: level for level in levels}
+        self._name_escapes = name_escapes or {}
+        self._values = values
+        templates = [ENTRIES_PREFIX] + [template for level in levels for template in (level.name, level.fqn)]
+        self._keys = sorted({placeholder for template in templates for _, placeholder in _parse(template)
+                             if placeholder is not None and placeholder not in (SCHEMA, TABLE)})
+        self._compile_values = functools.lru_cache(maxsize=COMPILED_CACHE_SIZE)(self._compile_values)
+
+    def _template(self, entry_type: EntryType, fqn: bool) -> str:
+        """Template of an entry type, with the templates of the levels above it."""
+        level = self._levels[entry_type]
+        parent = level.fqn_parent if fqn else level.parent
+        own = level.fqn if fqn else level.name
+        if parent is None:
+            return own if fqn else ENTRIES_PREFIX + own
+        return self._template(parent, fqn) + own
+
+    def names_schema(self, entry_type: EntryType) -> bool:
+        """Whether names of entry_type hold the schema name. Where names of the collection entry do not,
+        eg. MySQL databases, each database is extracted as a single schema"""
+        return any(placeholder == SCHEMA for _, placeholder in _parse(self._template(entry_type, False)))
+
+    def _fill(self, template: str, values: Dict[str, str], escapes: Dict[str, Dict[str, str]]) -> List[Tuple[str, str]]:
+        """Fills argument values into a template, leaving the schema and table placeholders."""
+        parts = []
+        literal = ""
+        for text, placeholder in _parse(template):
+            literal += text
+            if placeholder is None:
+                continue
+            if placeholder in (SCHEMA, TABLE):
+                parts.append((literal, placeholder))
+                literal = ""
+                continue
+            value = str(values[placeholder])
+            for forbidden, allowed in escapes.get(placeholder, {}).items():
+                value = value.replace(forbidden, allowed)
+            literal += value
+        parts.append((literal, None))
+        return parts
+
+    def compile(self, config: Dict) -> CompiledHierarchy:
+        """Hierarchy with the argument values of config filled in."""
+        values = {key: config.get(key) for key in self._keys}
+        if self._values is not None:
+            values.update(self._values(config))
+        return self._compile_values(tuple(values[key] for key in self._keys))
+
+    def _compile_values(self, key_values: Tuple) -> CompiledHierarchy:
+        """Hierarchy with values of the placeholders in self._keys filled in. Cached by compile"""
+        values = dict(zip(self._keys, key_values))
+        return CompiledHierarchy(
+            {entry_type: self._fill(self._template(entry_type, False), values, self._name_escapes)
+             for entry_type in self._levels},
+            {entry_type: self._fill(self._template(entry_type, True), values, {}) for entry_type in self._levels},
+            {entry_type: level.parent for entry_type, level in self._levels.items()},
+            {entry_type: f"{values['target_project_id']}.{values['target_location_id']}.{entry_type.value.split('/')[-1]}"
+             for entry_type in EntryType})
+
+    def create_name(self, config: Dict, entry_type: EntryType, schema_name: str = "", table_name: str = "") -> str:
+        """Creates a Dataplex v2 hierarchy name."""
+        return self.compile(config).name(entry_type, schema_name, table_name)
+
+    def create_fqn(self, config: Dict, entry_type: EntryType, schema_name: str = "", table_name: str = "") -> str:
+        """Creates a fully qualified name or Dataplex v1 hierarchy name."""
+        return self.compile(config).fqn(entry_type, schema_name, table_name)
+
+    def create_parent_name(self, config: Dict, entry_type: EntryType, parent_name: str = "") -> str:
+        """Generates a Dataplex v2 name of the parent."""
+        return self.compile(config).parent_name(entry_type, parent_name)
+
+    def create_entry_aspect_name(self, config: Dict, entry_type: EntryType) -> str:
+        """Generates an entry aspect name."""
+        return self.compile(config).aspect_name(entry_type)
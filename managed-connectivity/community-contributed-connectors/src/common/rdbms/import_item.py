@@ -0,0 +1,110 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Typed import items of the metadata import file, serialized straight to camelCase json without protos.
+Used by every entry built in Python: the top level entries and the entries of the Python engine."""
+import dataclasses
+import json
+import re
+from typing import Dict
+from typing import List
+from src.constants import SOURCE_TYPE
+from src.common.entry_constants import KEY_NAME
+from src.common.entry_constants import KEY_ENTRY
+from src.common.entry_constants import KEY_ENTRY_TYPE
+from src.common.entry_constants import KEY_ENTRY_SOURCE
+from src.common.entry_constants import KEY_ASPECT_KEYS
+from src.common.entry_constants import KEY_ASPECT_TYPE
+from src.common.entry_constants import KEY_DISPLAY_NAME
+from src.common.entry_constants import KEY_UPDATE_MASK
+from src.common.entry_constants import KEY_FQN
+from src.common.entry_constants import KEY_PARENT_ENTRY
+from src.common.entry_constants import KEY_ASPECTS
+from src.common.entry_constants import KEY_DATA
+from src.common.entry_constants import KEY_SYSTEM
+
+# orjson serializes several times faster than json where it is installed, with the same output
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+@dataclasses.dataclass(slots=True)
+class Aspect:
+    """An aspect of an entry."""
+    aspect_type: str
+    data: Dict = dataclasses.field(default_factory=dict)
+
+    def to_dict(self) -> Dict:
+        return {KEY_ASPECT_TYPE: self.aspect_type, KEY_DATA: self.data}
+
+@dataclasses.dataclass(slots=True)
+class Entry:
+    """An entry, with properties in the order written by the Spark entry builder.
+    Top level entries have no display_name, and so no entry source"""
+    name: str
+    fully_qualified_name: str
+    parent_entry: str
+    entry_type: str
+    aspects: Dict[str, Aspect]
+    display_name: str = None
+
+    def to_dict(self) -> Dict:
+        entry = {
+            KEY_NAME: self.name,
+            KEY_FQN: self.fully_qualified_name,
+            KEY_PARENT_ENTRY: self.parent_entry,
+        }
+        if self.display_name is not None:
+            entry[KEY_ENTRY_SOURCE] = {KEY_DISPLAY_NAME: self.display_name, KEY_SYSTEM: SOURCE_TYPE}
+        entry[KEY_ASPECTS] = {key: aspect.to_dict() for key, aspect in self.aspects.items()}
+        entry[KEY_ENTRY_TYPE] = self.entry_type
+        return entry
+
+@dataclasses.dataclass(slots=True)
+class ImportItem:
+    """An item of the metadata import file: an entry and the aspects it updates."""
+    entry: Entry
+    update_mask: List[str] = dataclasses.field(default_factory=lambda: [KEY_ASPECTS])
+
+    def to_dict(self) -> Dict:
+        return {
+            KEY_ENTRY: self.entry.to_dict(),
+            KEY_ASPECT_KEYS: list(self.entry.aspects.keys()),
+            KEY_UPDATE_MASK: list(self.update_mask),
+        }
+
+# Escapes of control characters, which Spark writes with upper case hex digits, eg. \u001F. Only escapes
+# following an odd number of backslashes, as others are an escaped backslash followed by text
+CONTROL_ESCAPE = re.compile(r"(\\+)u(00[0-9a-f]{2})")
+
+def _spark_escape(match: "re.Match") -> str:
+    backslashes, code = match.groups()
+    return f"{backslashes}u{code.upper()}" if len(backslashes) % 2 else match.group(0)
+
+def to_json(value) -> str:
+    """Compact json, as written by Spark."""
+    text = None
+    if orjson is not None:
+        try:
+            text = orjson.dumps(value).decode("utf-8")
+        except orjson.JSONEncodeError:
+            # eg. unpaired surrogates in names, which json writes as they are
+            pass
+    if text is None:
+        text = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    if "\\u00" in text:
+        text = CONTROL_ESCAPE.sub(_spark_escape, text)
+    return text
@@ -0,0 +1,43 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Spark JDBC read options of the connectors, from source defaults and the command line."""
+from typing import Dict
+
+# Spark JDBC option set by each command line argument
+OPTION_ARGUMENTS = {
+    'fetch_size': 'fetchsize',
+    'query_timeout': 'queryTimeout',
+    'session_init_statement': 'sessionInitStatement',
+    'push_down_predicate': 'pushDownPredicate',
+}
+
+def _option_value(value) -> str:
+    if isinstance(value, bool):
+        return str(value).lower()
+    return str(value)
+
+def get_read_options(config: Dict[str, str], source_defaults: Dict[str, str]) -> Dict[str, str]:
+    """Returns JDBC read options: the defaults of the source overridden by command line arguments.
+    An empty --session_init_statement removes the default statement of the source"""
+    options = dict(source_defaults)
+    for argument, option in OPTION_ARGUMENTS.items():
+        value = config.get(argument)
+        if value is None:
+            continue
+        if value == "":
+            options.pop(option, None)
+        else:
+            options[option] = _option_value(value)
+    return options
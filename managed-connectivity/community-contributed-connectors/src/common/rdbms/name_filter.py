@@ -0,0 +1,115 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Include and exclude filters on schema and table names, translated to predicates of the metadata queries."""
+import re
+from typing import Dict
+from typing import List
+
+# --filter_syntax values
+FILTER_GLOB = "glob"
+FILTER_REGEX = "regex"
+
+# Escape character of LIKE patterns translated from globs. Not a backslash, as some sources also
+# treat it as an escape in string literals
+LIKE_ESCAPE = "!"
+
+class SqlDialect:
+    """How the SQL of a source matches names against patterns.
+        regex_match - predicate matching {column} against the regular expression literal {pattern},
+                      or None if the source has no regular expressions
+        like_wildcards - characters with a special meaning in LIKE patterns, which are escaped
+        backslash_escapes - whether backslashes are escapes in string literals of the source
+    """
+
+    def __init__(self, regex_match: str = None, like_wildcards: str = "%_", backslash_escapes: bool = False):
+        self.regex_match = regex_match
+        self.like_wildcards = like_wildcards
+        self.backslash_escapes = backslash_escapes
+
+    def literal(self, value: str) -> str:
+        """Quotes a value as a string literal."""
+        if self.backslash_escapes:
+            value = value.replace("\\", "\\\\")
+        return "'" + value.replace("'", "''") + "'"
+
+    def like(self, pattern: str) -> str:
+        """Translates a glob, where * matches any characters and ? a single character, to a LIKE pattern."""
+        like = []
+        for char in pattern:
+            if char == "*":
+                like.append("%")
+            elif char == "?":
+                like.append("_")
+            elif char in self.like_wildcards or char == LIKE_ESCAPE:
+                like.append(LIKE_ESCAPE + char)
+            else:
+                like.append(char)
+        return "".join(like)
+
+    def matches(self, column: str, patterns: List[str], syntax: str) -> str:
+        """Predicate which is true where column matches any of patterns."""
+        if syntax == FILTER_REGEX:
+            if self.regex_match is None:
+                raise Exception("Regular expression filters are not supported by this source. Use glob patterns")
+            # Anchored, so a regular expression matches the whole name as a glob does
+            return " OR ".join(self.regex_match.format(column=column, pattern=self.literal(f"^({pattern})$"))
+                               for pattern in patterns)
+        # Names without wildcards are compared for equality, which the source can look up in its dictionary indexes
+        names = [pattern for pattern in patterns if "*" not in pattern and "?" not in pattern]
+        predicates = [f"{column} LIKE {self.literal(self.like(pattern))} ESCAPE '{LIKE_ESCAPE}'"
+                      for pattern in patterns if pattern not in names]
+        if names:
+            predicates.insert(0, f"{column} IN ({', '.join(self.literal(name) for name in names)})")
+        return " OR ".join(predicates)
+
+def parse_patterns(values: List[str], syntax: str) -> List[str]:
+    """Parses the values of a repeatable filter argument. Globs can be given as comma separated lists,
+    while each regular expression is given separately, as it can hold commas, eg. [0-9]{1,3}"""
+    if values is None:
+        return None
+    patterns = []
+    for value in values:
+        if syntax == FILTER_REGEX:
+            try:
+                re.compile(value)
+            except re.error as ex:
+                raise Exception(f"{value} is not a valid regular expression: {ex}")
+            patterns.append(value)
+        else:
+            patterns += [pattern.strip() for pattern in value.split(",") if pattern.strip()]
+    if len(patterns) == 0:
+        raise Exception("name filters must list at least one pattern")
+    return patterns
+
+def _predicate(config: Dict, include_key: str, exclude_key: str, column: str, dialect: SqlDialect) -> str:
+    include = config.get(include_key)
+    exclude = config.get(exclude_key)
+    syntax = config.get('filter_syntax') or FILTER_GLOB
+    predicate = ""
+    if include:
+        predicate += f" AND ({dialect.matches(column, include, syntax)})"
+    if exclude:
+        predicate += f" AND NOT ({dialect.matches(column, exclude, syntax)})"
+    return predicate
+
+def schema_predicate(config: Dict, column: str, dialect: SqlDialect) -> str:
+    """Condition on the schema name column, starting with AND, of the --include_schemas and --exclude_schemas
+    filters. Empty if neither is given"""
+    return _predicate(config, 'include_schemas', 'exclude_schemas', column, dialect)
+
+def table_predicate(config: Dict, column: str, dialect: SqlDialect) -> str:
+    """Condition on the table or view name column, starting with AND, of the --include_tables and
+    --exclude_tables filters. Empty if neither is given"""
+    return _predicate(config, 'include_tables', 'exclude_tables', column, dialect)
@@ -0,0 +1,134 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Journal of completed extraction tasks, so a failed run can be resumed."""
+import json
+import os
+import time
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Tuple
+
+# Object type of the task which writes the top level and schema entries of a database
+HEADER_TASK = "HEADER"
+
+# Journal property names
+KEY_CONTEXT = 'context'
+KEY_TASK = 'task'
+KEY_OFFSET = 'offset'
+KEY_ENTRIES = 'entries'
+KEY_HASHES = 'hashes'
+
+# Completed tasks are synced to disk at most this often, so a resumed run redoes those completed since
+SYNC_INTERVAL_SECONDS = 10
+
+class ProgressJournal:
+    """Records each completed (database, schema, object type) task with the size of the output file
+    and the number of entries written when it completed. The first line holds the context
+    of the run, each following line one completed task.
+    Committed tasks are written to the journal when it is synced, after the output file has been synced"""
+
+    def __init__(self, path: str, context: str, records: List = None):
+        self._path = path
+        self._context = context
+        self._records = records or []
+        self._completed = {tuple(record[KEY_TASK]) for record in self._records}
+        self._pending = []
+        self._unsynced = []
+        self._synced = time.time()
+        self._file = None
+
+    @classmethod
+    def load(cls, path: str, context: str):
+        """Loads tasks completed by a previous run.
+        Empty if there is no journal, or it was written for a different context"""
+        if not os.path.exists(path):
+            return cls(path, context)
+        with open(path, "r", encoding="utf-8") as file:
+            lines = file.read().splitlines()
+        if not lines or json.loads(lines[0]).get(KEY_CONTEXT) != context:
+            return cls(path, context)
+        records = []
+        for line in lines[1:]:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                # Last line is incomplete if the run stopped while it was being written
+                break
+        return cls(path, context, records)
+
+    def has_progress(self) -> bool:
+        return len(self._records) > 0
+
+    def is_completed(self, task: Tuple[str, str, str]) -> bool:
+        return task in self._completed
+
+    @property
+    def completed_count(self) -> int:
+        return len(self._records)
+
+    @property
+    def offset(self) -> int:
+        """Size in bytes of the output file when the last task completed."""
+        return self._records[-1][KEY_OFFSET] if self._records else 0
+
+    @property
+    def entries_count(self) -> int:
+        """Number of db object entries written when the last task completed."""
+        return self._records[-1][KEY_ENTRIES] if self._records else 0
+
+    def completed_hashes(self) -> Iterator[Tuple[str, str]]:
+        """Yields (entry name, content hash) of entries of all completed tasks."""
+        for record in self._records:
+            yield from (tuple(pair) for pair in record[KEY_HASHES])
+
+    def open(self):
+        """Opens the journal for writing, keeping the tasks completed by a previous run."""
+        # Rewritten rather than appended to, as the last line may be incomplete
+        self._file = open(self._path, "w", encoding="utf-8")
+        self._unsynced = [{KEY_CONTEXT: self._context}] + self._records
+        self.sync()
+
+    def track(self, entries: Iterable[Tuple[str, str, str]]) -> Iterator[Tuple[str, str, str]]:
+        """Passes through (name, content hash, json) entries, remembering them for the next commit."""
+        for entry in entries:
+            self._pending.append((entry[0], entry[1]))
+            yield entry
+
+    def commit(self, task: Tuple[str, str, str], offset: int, entries_count: int):
+        """Records task as completed with the size of the output file once it is written, up to the next sync."""
+        self._unsynced.append({KEY_TASK: list(task), KEY_OFFSET: offset, KEY_ENTRIES: entries_count, KEY_HASHES: self._pending})
+        self._pending = []
+
+    def sync_due(self) -> bool:
+        """True if tasks were committed since the journal was last synced over SYNC_INTERVAL_SECONDS ago."""
+        return len(self._unsynced) > 0 and time.time() - self._synced >= SYNC_INTERVAL_SECONDS
+
+    def sync(self):
+        """Writes committed tasks to disk. The output file must already be synced up to their offsets"""
+        if self._unsynced:
+            self._file.write("".join(json.dumps(record) + "\n" for record in self._unsynced))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._unsynced = []
+        self._synced = time.time()
+
+    def remove(self):
+        """Closes and deletes the journal once the output file is complete."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if os.path.exists(self._path):
+            os.remove(self._path)
@@ -0,0 +1,133 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Creates entries in Python from rows returned by a connector using a Python driver.
+Entries, content hashes and json match those of the Spark entry builder for the same rows,
+as checked by tests/test_python_entry_builder.py."""
+import hashlib
+import itertools
+from operator import itemgetter
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Tuple
+from src.constants import EntryType
+from src.constants import COLLECTION_ENTRY
+from src.constants import IS_NULLABLE_TRUE
+from src.common.datatype_rules import DatatypeRules
+from src.common.datatype_rules import get_rules
+from src import name_builder as nb
+from src.common.entry_constants import KEY_NAME
+from src.common.entry_constants import KEY_MODE
+from src.common.entry_constants import KEY_DATA_TYPE
+from src.common.entry_constants import KEY_METADATA_TYPE
+from src.common.entry_constants import KEY_FIELDS
+from src.common.entry_constants import VALUE_NULLABLE
+from src.common.entry_constants import VALUE_REQUIRED
+from src.common.entry_constants import SCHEMA_KEY
+from src.common.import_item import Aspect
+from src.common.import_item import Entry
+from src.common.import_item import ImportItem
+from src.common.import_item import to_json
+
+def _is_nullable(value) -> bool:
+    # Drivers return bit columns (SQL Server) as booleans
+    if isinstance(value, bool):
+        return value
+    return value == IS_NULLABLE_TRUE
+
+def _full_entry_type(config: Dict[str, str], entry_type: EntryType) -> str:
+    return entry_type.value.format(
+        project=config["target_project_id"],
+        location=config["target_location_id"])
+
+# Properties of a schema aspect field, in the order written by Spark
+FIELD_KEYS = [KEY_NAME, KEY_MODE, KEY_DATA_TYPE, KEY_METADATA_TYPE]
+
+def _field_sort_key(field: Dict) -> List:
+    # Struct ordering of Spark array_sort: property by property, with nulls first
+    return [(field.get(key) is not None, field.get(key) or "") for key in FIELD_KEYS]
+
+def _content_hash(entry: Entry) -> str:
+    """Content hash computed as by entry_builder.content_hash."""
+    schema_aspect = entry.aspects.get(SCHEMA_KEY)
+    parts = [entry.entry_type, entry.parent_entry]
+    if schema_aspect is not None:
+        fields = schema_aspect.data[KEY_FIELDS]
+        parts.append(to_json(sorted(fields, key=_field_sort_key)))
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+def _hashed(entry: Entry) -> Tuple[str, str, str]:
+    return entry.name, _content_hash(entry), to_json(ImportItem(entry).to_dict())
+
+def build_schemas(config: Dict[str, str], schema_names: Iterable[str]) -> Iterator[Tuple[str, str, str]]:
+    """Yields (entry name, content hash, json) of schema entries."""
+    entry_type = COLLECTION_ENTRY
+    hierarchy = nb.HIERARCHY.compile(config)
+    entry_aspect_name = hierarchy.aspect_name(entry_type)
+    parent_name = hierarchy.parent_name(entry_type)
+    full_entry_type = _full_entry_type(config, entry_type)
+
+    for schema_name in schema_names:
+        yield _hashed(Entry(hierarchy.name(entry_type, schema_name),
+                            hierarchy.fqn(entry_type, schema_name),
+                            parent_name,
+                            full_entry_type,
+                            {entry_aspect_name: Aspect(entry_aspect_name)},
+                            schema_name))
+
+def _field(column_name: str, data_type: str, is_nullable, rules: DatatypeRules) -> Dict:
+    """Schema aspect field of a column. Null properties are left out, as by Spark to_json"""
+    field = {
+        KEY_NAME: column_name,
+        KEY_MODE: VALUE_NULLABLE if _is_nullable(is_nullable) else VALUE_REQUIRED,
+        KEY_DATA_TYPE: data_type,
+        KEY_METADATA_TYPE: rules.lookup(data_type),
+    }
+    return {key: value for key, value in field.items() if value is not None}
+
+def build_dataset(config: Dict[str, str], rows: Iterable[Tuple], db_schema: str,
+                  entry_type: EntryType) -> Iterator[Tuple[str, str, str]]:
+    """Yields (entry name, content hash, json) of table or view entries.
+    Rows are grouped as they are read, so only the columns of one table are held in memory.
+    Args:
+        rows - (table name, column name, data type, is nullable) tuples, with the
+               rows of each table next to each other (eg. ordered by table name).
+               Columns are listed in the order of the rows
+        db_schema - parent database schema, or None if rows hold objects of several
+                    schemas as (schema name, table name, ...) tuples ordered by schema and table
+        entry_type - entry type: table or view
+    """
+    hierarchy = nb.HIERARCHY.compile(config)
+    entry_aspect_name = hierarchy.aspect_name(entry_type)
+    full_entry_type = _full_entry_type(config, entry_type)
+    rules = get_rules(config)
+
+    if db_schema is not None:
+        rows = ((db_schema,) + tuple(row) for row in rows)
+
+    for (schema_name, table_name), columns in itertools.groupby(rows, key=itemgetter(0, 1)):
+        fields = [_field(column_name, data_type, is_nullable, rules)
+                  for _, _, column_name, data_type, is_nullable in columns]
+        aspects = {
+            SCHEMA_KEY: Aspect(SCHEMA_KEY, {KEY_FIELDS: fields}),
+            entry_aspect_name: Aspect(entry_aspect_name),
+        }
+        yield _hashed(Entry(hierarchy.name(entry_type, schema_name, table_name),
+                            hierarchy.fqn(entry_type, schema_name, table_name),
+                            hierarchy.parent_name(entry_type, schema_name),
+                            full_entry_type,
+                            aspects,
+                            table_name))
@@ -0,0 +1,149 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Ledger of the statements run against the source database."""
+import json
+import threading
+import time
+from datetime import datetime
+from datetime import timezone
+from typing import TYPE_CHECKING
+from typing import Iterable
+from typing import Iterator
+from src.common.query_throttle import THROTTLE
+
+# Spark is only needed for type hints, so the ledger is also used by connectors running without it
+if TYPE_CHECKING:
+    from pyspark.sql import DataFrame
+
+# Ledger property names
+KEY_STATEMENTS = 'statements'
+KEY_STATEMENT = 'statement'
+KEY_STARTED = 'started'
+KEY_SECONDS = 'seconds'
+KEY_ROWS = 'rows'
+KEY_TOTAL_SECONDS = 'totalSeconds'
+KEY_TOTAL_ROWS = 'totalRows'
+
+# Longest wait for Spark statements to be recorded when the ledger is written
+OBSERVER_WAIT_SECONDS = 5
+
+class QueryLedger:
+    """Records each statement issued to the source with its start time, duration and number of rows returned."""
+
+    def __init__(self):
+        self._records = []
+        self._observers = []
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """Clears the recorded statements, for a process which extracts several sources in turn."""
+        with self._lock:
+            self._records = []
+            self._observers = []
+
+    def record(self, statement: str, started: float, rows: int):
+        """Records a statement which started at time.time() started and returned rows rows."""
+        record = {
+            KEY_STATEMENT: " ".join(statement.split()),
+            KEY_STARTED: datetime.fromtimestamp(started, timezone.utc).isoformat(),
+            KEY_SECONDS: round(time.time() - started, 3),
+            KEY_ROWS: rows,
+        }
+        with self._lock:
+            self._records.append(record)
+
+    def materialize(self, statement: str, df: "DataFrame") -> "DataFrame":
+        """Persists a Spark dataframe read from the source, so later actions do not run the statement again.
+        Without throttling no action is run here: the statement runs with the first action on the dataframe,
+        which counts its rows as they are read, and is recorded once that action finishes. With throttling
+        the statement is run here while it holds a throttle slot, as callers create several dataframes
+        before reading any of them.
+        Returns the persisted dataframe, which the caller unpersists once done"""
+        from pyspark.sql import Observation
+        import pyspark.sql.functions as F
+        if THROTTLE.enabled:
+            THROTTLE.acquire()
+            started = time.time()
+            rows = 0
+            try:
+                df = df.persist()
+                rows = df.count()
+            finally:
+                THROTTLE.release(started, rows)
+                self.record(statement, started, rows)
+            return df
+        started = time.time()
+        observation = Observation()
+        df = df.observe(observation, F.count(F.lit(1)).alias(KEY_ROWS)).persist()
+        observer = threading.Thread(target=self._observe, args=(statement, started, observation), daemon=True)
+        with self._lock:
+            self._observers.append(observer)
+        observer.start()
+        return df
+
+    def _observe(self, statement: str, started: float, observation):
+        """Waits for the first action on an observed dataframe, then records its statement."""
+        self.record(statement, started, observation.get[KEY_ROWS])
+
+    def track(self, statement: str, rows: Iterable) -> Iterator:
+        """Passes through rows of a statement as they are fetched, recording it once they are all read.
+        With throttling, all rows are fetched while the statement holds a throttle slot, which is released
+        and the statement recorded before the rows are passed on, so the time taken by the caller to
+        process them is neither held against the source nor measured as latency"""
+        if THROTTLE.enabled:
+            THROTTLE.acquire()
+            started = time.time()
+            fetched = []
+            try:
+                fetched = list(rows)
+            finally:
+                THROTTLE.release(started, len(fetched))
+                self.record(statement, started, len(fetched))
+            yield from fetched
+            return
+        started = time.time()
+        count = 0
+        try:
+            for row in rows:
+                count += 1
+                yield row
+        finally:
+            self.record(statement, started, count)
+
+    @property
+    def statement_count(self) -> int:
+        return len(self._records)
+
+    def write(self, path: str):
+        """Writes the recorded statements to a local json file. Spark statements are recorded by the
+        listener of their first action, so statements read just before are waited for"""
+        deadline = time.time() + OBSERVER_WAIT_SECONDS
+        with self._lock:
+            observers = self._observers
+            self._observers = []
+        # Statements whose result was never read did not run, and are not waited for past the deadline
+        for observer in observers:
+            observer.join(max(0.0, deadline - time.time()))
+        with self._lock:
+            records = list(self._records)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({
+                KEY_TOTAL_SECONDS: round(sum(record[KEY_SECONDS] for record in records), 3),
+                KEY_TOTAL_ROWS: sum(record[KEY_ROWS] for record in records),
+                KEY_STATEMENTS: records,
+            }, file, indent=2)
+
+# Ledger of the current run, shared by all connectors
+LEDGER = QueryLedger()
@@ -0,0 +1,145 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Load-aware throttling of the statements run against the source database."""
+import statistics
+import threading
+import time
+from typing import Dict
+
+# Statements timed to set the baseline latency of the source
+BASELINE_STATEMENTS = 5
+# Latency is measured per this many rows returned, so larger schemas are not taken as load on the source
+ROWS_PER_LATENCY_UNIT = 1000
+# Fewest statements whose average latency is compared with the baseline before each adjustment
+WINDOW_STATEMENTS = 3
+# Pause between statements once concurrency is down to one statement, doubled while latency stays high
+MIN_PAUSE_SECONDS = 0.1
+MAX_PAUSE_SECONDS = 30.0
+
+# Throttle property names in the run report
+KEY_BASELINE_SECONDS = 'baselineSeconds'
+KEY_WAIT_SECONDS = 'waitSeconds'
+KEY_SLOWDOWNS = 'slowdowns'
+KEY_MIN_CONCURRENCY = 'minConcurrency'
+KEY_MAX_QUERIES_PER_SECOND = 'maxQueriesPerSecond'
+
+class QueryThrottle:
+    """Limits the statements running against the source and the rate they start at. With a latency factor,
+    the latency of statements is compared with a baseline taken from the first statements of the run:
+    while their average is above baseline x factor, the number of concurrent statements is halved,
+    then once down to one statement a pause is added between statements. Both recover one step at a time
+    once latency is back under the threshold. Statements can be throttled from several threads"""
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self.configure()
+
+    def configure(self, max_concurrency: int = 1, max_queries_per_second: float = None, latency_factor: float = None):
+        """Sets the limits of a run, clearing the latencies measured for an earlier source."""
+        with self._condition:
+            self._enabled = max_queries_per_second is not None or latency_factor is not None
+            self._max_concurrency = max_concurrency
+            self._max_queries_per_second = max_queries_per_second
+            self._interval = 1 / max_queries_per_second if max_queries_per_second else 0
+            self._latency_factor = latency_factor
+            self._concurrency = max_concurrency
+            self._running = 0
+            self._next_start = 0.0
+            self._pause = 0.0
+            self._samples = []
+            self._baseline = None
+            self._window = []
+            self._adjusted = 0.0
+            self._wait_seconds = 0.0
+            self._slowdowns = 0
+            self._min_concurrency = max_concurrency
+            self._condition.notify_all()
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def acquire(self):
+        """Waits for a free slot and the start time allowed for the next statement, before it is run."""
+        if not self._enabled:
+            return
+        waiting = time.time()
+        with self._condition:
+            while self._running >= self._concurrency:
+                self._condition.wait()
+            self._running += 1
+            start = max(time.time(), self._next_start)
+            self._next_start = start + max(self._interval, self._pause)
+        time.sleep(max(0.0, start - time.time()))
+        with self._condition:
+            self._wait_seconds += time.time() - waiting
+
+    def release(self, started: float, rows: int):
+        """Frees the slot of a statement which started at time.time() started and returned rows rows."""
+        if not self._enabled:
+            return
+        latency = (time.time() - started) / max(1.0, rows / ROWS_PER_LATENCY_UNIT)
+        with self._condition:
+            self._running -= 1
+            if self._latency_factor is not None:
+                self._adjust(started, latency)
+            self._condition.notify_all()
+
+    def _adjust(self, started: float, latency: float):
+        """Adjusts concurrency and pause to the latest latency. Called with the lock held"""
+        if self._baseline is None:
+            self._samples.append(latency)
+            if len(self._samples) == BASELINE_STATEMENTS:
+                # Median, so a slow first statement, eg. on a cold cache, does not raise the baseline
+                self._baseline = statistics.median(self._samples)
+            return
+
+        # Each adjustment is judged on statements started after the previous one, so its effect is seen first
+        if started < self._adjusted:
+            return
+        self._window.append(latency)
+        if len(self._window) < max(WINDOW_STATEMENTS, self._concurrency):
+            return
+        average = statistics.mean(self._window)
+        self._window = []
+
+        if average > self._baseline * self._latency_factor:
+            self._slowdowns += 1
+            if self._concurrency > 1:
+                self._concurrency = max(1, self._concurrency // 2)
+                self._min_concurrency = min(self._min_concurrency, self._concurrency)
+            else:
+                self._pause = min(MAX_PAUSE_SECONDS, max(MIN_PAUSE_SECONDS, self._pause * 2))
+        elif self._pause > 0:
+            self._pause = self._pause / 2 if self._pause / 2 >= MIN_PAUSE_SECONDS else 0.0
+        elif self._concurrency < self._max_concurrency:
+            self._concurrency += 1
+        else:
+            return
+        self._adjusted = time.time()
+
+    def to_dict(self) -> Dict:
+        """Throttling of the run, for the run report."""
+        with self._condition:
+            return {
+                KEY_MAX_QUERIES_PER_SECOND: self._max_queries_per_second,
+                KEY_BASELINE_SECONDS: round(self._baseline, 3) if self._baseline is not None else None,
+                KEY_WAIT_SECONDS: round(self._wait_seconds, 3),
+                KEY_SLOWDOWNS: self._slowdowns,
+                KEY_MIN_CONCURRENCY: self._min_concurrency,
+            }
+
+# Throttle of the current run, shared by all connectors through the query ledger
+THROTTLE = QueryThrottle()
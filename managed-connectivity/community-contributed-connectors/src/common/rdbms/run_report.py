@@ -0,0 +1,133 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Timing of each phase of a run, written as a json run report."""
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from datetime import timezone
+from typing import Dict
+import google.cloud.logging as gcp_logging
+
+# --report_sink value which sends the report to Cloud Logging. Any other value is a local file path
+SINK_CLOUD_LOGGING = "cloud_logging"
+# Cloud Logging log the report is written to
+REPORT_LOG_NAME = "dataplex-connector-run-report"
+
+# Phase names
+PHASE_SECRET_FETCH = "secret_fetch"
+PHASE_BUCKET_CHECK = "bucket_check"
+PHASE_CONNECTOR_STARTUP = "connector_startup"
+PHASE_SCHEMA_LISTING = "schema_listing"
+PHASE_EXTRACT = "extract"
+PHASE_BUILD = "build"
+PHASE_WRITE = "write"
+PHASE_OUTPUT = "output"
+PHASE_UPLOAD = "upload"
+
+# Report property names
+KEY_STARTED = 'started'
+KEY_SECONDS = 'seconds'
+KEY_PHASE = 'phase'
+KEY_PHASES = 'phases'
+KEY_PHASE_SECONDS = 'phaseSeconds'
+KEY_ENTRIES = 'entries'
+KEY_BYTES = 'bytes'
+KEY_ENTRIES_PER_SECOND = 'entriesPerSecond'
+KEY_BYTES_PER_SECOND = 'bytesPerSecond'
+
+class RunReport:
+    """Records the duration of each phase of a run with its labels, eg. schema and object type,
+    and the entries and bytes output. Phases can be recorded from several threads"""
+
+    def __init__(self):
+        self._started = time.time()
+        self._phases = []
+        self._properties = {}
+        self._entries = 0
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """Starts a new report, for a process which extracts several sources in turn."""
+        with self._lock:
+            self._started = time.time()
+            self._phases = []
+            self._properties = {}
+            self._entries = 0
+            self._bytes = 0
+
+    @contextmanager
+    def phase(self, name: str, **labels):
+        """Times the enclosed block as a phase of the run."""
+        started = time.time()
+        try:
+            yield
+        finally:
+            self.record(name, started, **labels)
+
+    def record(self, name: str, started: float, **labels):
+        """Records a phase which started at time.time() started and has just completed."""
+        self.record_seconds(name, time.time() - started, **labels)
+
+    def record_seconds(self, name: str, seconds: float, **labels):
+        """Records a phase which took seconds in total, eg. added up while interleaved with another phase."""
+        record = {KEY_PHASE: name, KEY_SECONDS: round(seconds, 3), **labels}
+        with self._lock:
+            self._phases.append(record)
+
+    def set(self, **properties):
+        """Sets properties describing the run, eg. source type and engine."""
+        self._properties.update(properties)
+
+    def set_output(self, entries: int, bytes_written: int):
+        """Sets the number of entries and bytes output by the run."""
+        self._entries = entries
+        self._bytes = bytes_written
+
+    def to_dict(self) -> Dict:
+        seconds = time.time() - self._started
+        with self._lock:
+            phases = list(self._phases)
+        phase_seconds = {}
+        for record in phases:
+            phase_seconds[record[KEY_PHASE]] = round(phase_seconds.get(record[KEY_PHASE], 0) + record[KEY_SECONDS], 3)
+        return {
+            **self._properties,
+            KEY_STARTED: datetime.fromtimestamp(self._started, timezone.utc).isoformat(),
+            KEY_SECONDS: round(seconds, 3),
+            KEY_ENTRIES: self._entries,
+            KEY_BYTES: self._bytes,
+            KEY_ENTRIES_PER_SECOND: round(self._entries / seconds, 1) if seconds > 0 else 0,
+            KEY_BYTES_PER_SECOND: round(self._bytes / seconds, 1) if seconds > 0 else 0,
+            KEY_PHASE_SECONDS: phase_seconds,
+            KEY_PHASES: phases,
+        }
+
+    def write(self, path: str, sink: str = None):
+        """Writes the report to a local json file, and to the sink if given: Cloud Logging,
+        or a local file which each report is appended to as a json line"""
+        report = self.to_dict()
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        if sink == SINK_CLOUD_LOGGING:
+            gcp_logging.Client().logger(REPORT_LOG_NAME).log_struct(report)
+        elif sink is not None:
+            with open(sink, "a", encoding="utf-8") as file:
+                file.write(json.dumps(report) + "\n")
+
+# Report of the current run, shared by the argument checks and the pipeline
+REPORT = RunReport()
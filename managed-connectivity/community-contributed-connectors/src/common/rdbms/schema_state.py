@@ -0,0 +1,90 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Keeps entries of each schema between runs so unchanged schemas can be skipped."""
+import hashlib
+import json
+import os
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import Tuple
+
+INDEX_FILE = "index.json"
+
+# Index property names
+KEY_CONTEXT = 'context'
+KEY_SIGNATURES = 'signatures'
+
+def _schema_key(schema_name: str) -> str:
+    # Schema names can hold characters which are not valid in file names
+    return hashlib.sha1(schema_name.encode("utf-8")).hexdigest()
+
+class SchemaState:
+    """Change signatures and entries of each schema, stored in a local directory.
+    An index file holds the signature of each schema, with the entries of each
+    schema and object type in a separate JSONL file."""
+
+    def __init__(self, directory: str, context: str, previous_signatures: Dict[str, str] = None):
+        self._directory = directory
+        self._context = context
+        self._previous = previous_signatures or {}
+
+    @classmethod
+    def load(cls, directory: str, context: str):
+        """Loads signatures of the previous run.
+        Empty if there is no previous state, or it was built for a different context
+        (eg. target project or entry group) so stored entries cannot be reused"""
+        index_path = os.path.join(directory, INDEX_FILE)
+        if not os.path.exists(index_path):
+            return cls(directory, context)
+        with open(index_path, "r", encoding="utf-8") as file:
+            index = json.load(file)
+        if index.get(KEY_CONTEXT) != context:
+            return cls(directory, context)
+        return cls(directory, context, index[KEY_SIGNATURES])
+
+    def _entries_path(self, schema_name: str, object_type: str) -> str:
+        return os.path.join(self._directory, f"{_schema_key(schema_name)}-{object_type}.jsonl")
+
+    def is_unchanged(self, schema_name: str, signature: str) -> bool:
+        """True if schema has the same signature as in the previous run."""
+        return signature is not None and self._previous.get(schema_name) == signature
+
+    def previous_entries(self, schema_name: str, object_type: str) -> Iterator[Tuple[str, str, str]]:
+        """Yields (entry name, content hash, json) entries of the previous run."""
+        path = self._entries_path(schema_name, object_type)
+        if not os.path.exists(path):
+            return
+        with open(path, "r", encoding="utf-8") as file:
+            for line in file:
+                yield tuple(json.loads(line))
+
+    def record(self, schema_name: str, object_type: str, entries: Iterable[Tuple[str, str, str]]) -> Iterator[Tuple[str, str, str]]:
+        """Writes entries to the state directory as they are passed through."""
+        os.makedirs(self._directory, exist_ok=True)
+        with open(self._entries_path(schema_name, object_type), "w", encoding="utf-8") as file:
+            for entry in entries:
+                file.write(json.dumps(list(entry)) + "\n")
+                yield entry
+
+    def save(self, signatures: Dict[str, str]):
+        """Saves signatures of the current run and removes entries of schemas which no longer exist."""
+        os.makedirs(self._directory, exist_ok=True)
+        current_keys = {_schema_key(schema_name) for schema_name in signatures}
+        for filename in os.listdir(self._directory):
+            if filename != INDEX_FILE and filename.split("-")[0] not in current_keys:
+                os.remove(os.path.join(self._directory, filename))
+        with open(os.path.join(self._directory, INDEX_FILE), "w", encoding="utf-8") as file:
+            json.dump({KEY_CONTEXT: self._context, KEY_SIGNATURES: signatures}, file)
@@ -0,0 +1,131 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Writes entries as sharded JSONL files directly from the Spark executors."""
+import json
+import math
+import time
+import uuid
+from typing import TYPE_CHECKING
+from typing import Dict
+from typing import List
+
+# Spark is only imported by sharded runs, so the manifest helpers are also used by runs without it
+if TYPE_CHECKING:
+    from pyspark.sql import DataFrame
+    from pyspark.sql import SparkSession
+
+COLUMN_VALUE = 'value'
+COLUMN_PARTITION = 'partition'
+COLUMN_ENTRIES = 'entries'
+
+# Manifest property names
+KEY_ENTRIES = 'entries'
+KEY_BYTES = 'bytes'
+KEY_FILES = 'files'
+KEY_URI = 'uri'
+KEY_NAME = 'name'
+KEY_COMPRESSION = 'compression'
+KEY_STAGING_URI = 'stagingUri'
+
+NO_COMPRESSION = 'none'
+
+def _shard_name(file_prefix: str, index: int, compression: str) -> str:
+    """Name of a shard in the published output folder"""
+    extension = ".jsonl" if compression == NO_COMPRESSION else f".jsonl.{compression}"
+    return f"{file_prefix}-{index:05d}{extension}"
+
+def _parse_part_file(filename: str):
+    """Returns (partition, file index) of a Spark part file, eg. part-00003-<uuid>-c001.txt.gz"""
+    segments = filename.split(".")[0].split("-")
+    return int(segments[1]), int(segments[-1][1:])
+
+def _list_part_files(spark: "SparkSession", uri: str) -> List:
+    """Lists part files written by Spark at uri. Works for local and Cloud Storage paths"""
+    hadoop_path = spark._jvm.org.apache.hadoop.fs.Path(uri)
+    fs = hadoop_path.getFileSystem(spark._jsc.hadoopConfiguration())
+    return [(status.getPath().getName(), status.getPath().toString(), status.getLen())
+            for status in fs.listStatus(hadoop_path)
+            if status.getPath().getName().startswith("part-")]
+
+def run_staging_uri(staging_uri: str) -> str:
+    """New directory under staging_uri for the part files of a run, so nothing already there is overwritten."""
+    return f"{staging_uri.rstrip('/')}/run-{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+def write_shards(df: "DataFrame", staging_uri: str, file_prefix: str, config: Dict[str, str]) -> Dict:
+    """Writes json entries as sharded JSONL files from the executors.
+    Args:
+        df - dataframe with a single 'value' column of json entries
+        staging_uri - local directory or gs:// location the executors write the part files to,
+                      in a new directory for the run
+        file_prefix - name prefix for shards when published
+    Returns:
+        A manifest listing the shards with their entry counts and sizes.
+    """
+    import pyspark.sql.functions as F
+    compression = config['shard_compression']
+    max_entries = config['shard_max_entries']
+
+    df = df.persist()
+
+    # Cap shard size in bytes by spreading entries evenly over enough partitions
+    if config['shard_max_mb'] is not None:
+        total_bytes = df.agg(F.sum(F.octet_length(COLUMN_VALUE) + 1)).first()[0] or 0
+        num_partitions = max(1, math.ceil(total_bytes / (config['shard_max_mb'] * 1024 * 1024)))
+        sharded_df = df.repartition(num_partitions).persist()
+        df.unpersist()
+        df = sharded_df
+
+    # Entry count per partition. Only these aggregates are returned to the driver, not the entries
+    partition_entries = {row[COLUMN_PARTITION]: row[COLUMN_ENTRIES]
+                         for row in df.groupBy(F.spark_partition_id().alias(COLUMN_PARTITION))
+                                      .agg(F.count(F.lit(1)).alias(COLUMN_ENTRIES))
+                                      .collect()}
+
+    # Fails rather than overwrites if the directory of the run already exists
+    run_uri = run_staging_uri(staging_uri)
+    writer = df.write.mode("errorifexists").option("maxRecordsPerFile", max_entries)
+    if compression != NO_COMPRESSION:
+        writer = writer.option("compression", compression)
+    writer.text(run_uri)
+    df.unpersist()
+
+    # Spark splits a partition into files of maxRecordsPerFile entries, in file index order
+    part_files = sorted((_parse_part_file(name), uri, size)
+                        for name, uri, size in _list_part_files(df.sparkSession, run_uri))
+    files = []
+    for (partition, file_index), uri, size in part_files:
+        remaining = partition_entries.get(partition, 0) - file_index * max_entries
+        entries = max(0, min(max_entries, remaining))
+        if entries == 0:
+            continue
+        files.append({
+            KEY_NAME: _shard_name(file_prefix, len(files), compression),
+            KEY_URI: uri,
+            KEY_ENTRIES: entries,
+            KEY_BYTES: size,
+        })
+
+    return {
+        KEY_ENTRIES: sum(shard[KEY_ENTRIES] for shard in files),
+        KEY_BYTES: sum(shard[KEY_BYTES] for shard in files),
+        KEY_COMPRESSION: compression,
+        KEY_STAGING_URI: run_uri,
+        KEY_FILES: files,
+    }
+
+def write_manifest(manifest: Dict, path: str):
+    """Writes manifest to a local json file."""
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=2)
@@ -0,0 +1,90 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Creates the SparkSession shared by the Spark connectors."""
+import atexit
+import os
+import tempfile
+from typing import Dict
+from pyspark import SparkContext
+from pyspark.sql import SparkSession
+
+# Master used when the connector runs as a local script rather than through spark-submit
+LOCAL_MASTER = "local[*]"
+
+# Settings for metadata extraction, where a query returns at most a few thousand rows.
+# With the Spark defaults most of the time goes on scheduling 200 near empty shuffle tasks per schema
+METADATA_PROFILE = {
+    "spark.log.level": "ERROR",
+    "spark.scheduler.mode": "FAIR",
+    "spark.sql.shuffle.partitions": "8",
+    "spark.sql.adaptive.enabled": "true",
+    "spark.sql.adaptive.coalescePartitions.enabled": "true",
+    "spark.serializer": "org.apache.spark.serializer.KryoSerializer",
+    "spark.ui.enabled": "false",
+}
+
+# FAIR scheduler pools of the worker threads extracting schemas concurrently, named POOL_PREFIX and the worker index.
+# Each worker gets its own pool, so concurrent jobs share executors evenly instead of queuing FIFO in the default pool
+POOL_PREFIX = "worker"
+
+# Allocation file written for each number of workers, as connectors of every database of a run get a session
+_pool_allocations: Dict[int, str] = {}
+
+def _remove_pool_allocations():
+    for path in _pool_allocations.values():
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    _pool_allocations.clear()
+
+atexit.register(_remove_pool_allocations)
+
+def _write_pool_allocation(workers: int) -> str:
+    """Writes a FAIR scheduler allocation file with a pool for each worker thread, once per process.
+    Returns its path. The file is removed when the process exits"""
+    if workers in _pool_allocations:
+        return _pool_allocations[workers]
+    pools = "".join(f'  <pool name="{POOL_PREFIX}{index}">'
+                    f"<schedulingMode>FIFO</schedulingMode><weight>1</weight><minShare>1</minShare></pool>\n"
+                    for index in range(workers))
+    with tempfile.NamedTemporaryFile("w", prefix="fairscheduler-", suffix=".xml", delete=False) as file:
+        file.write(f'<?xml version="1.0"?>\n<allocations>\n{pools}</allocations>\n')
+    _pool_allocations[workers] = file.name
+    return file.name
+
+def set_scheduler_pool(worker: int):
+    """Runs the Spark jobs submitted from the current thread in the FAIR scheduler pool of a worker."""
+    spark_context = SparkContext._active_spark_context
+    if spark_context is not None:
+        spark_context.setLocalProperty("spark.scheduler.pool", f"{POOL_PREFIX}{worker}")
+
+def _launched_by_spark_submit() -> bool:
+    # spark-submit starts the JVM before Python and passes its port to the driver
+    return "PYSPARK_GATEWAY_PORT" in os.environ
+
+def get_spark_session(app_name: str, jar_path: str, config: Dict[str, str]) -> SparkSession:
+    """Returns the SparkSession with the metadata profile, overridden by --spark_conf settings.
+    Connectors created later in the same run get the existing session"""
+    settings = {**METADATA_PROFILE, **config.get('spark_conf', {})}
+    if settings.get("spark.scheduler.mode") == "FAIR" and "spark.scheduler.allocation.file" not in settings:
+        settings["spark.scheduler.allocation.file"] = _write_pool_allocation(config.get('parallelism', 1))
+
+    builder = SparkSession.builder.appName(app_name).config("spark.jars", jar_path)
+    if "spark.master" not in settings and not _launched_by_spark_submit():
+        builder = builder.master(LOCAL_MASTER)
+    for key, value in settings.items():
+        builder = builder.config(key, value)
+    return builder.getOrCreate()
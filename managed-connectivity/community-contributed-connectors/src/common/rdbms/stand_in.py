@@ -0,0 +1,255 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""SQLite stand-ins for the dictionary views read by the connectors, to test their metadata queries offline.
+Run from a connector directory with python -m src.common.stand_in"""
+import argparse
+import importlib
+import os
+import re
+import sqlite3
+import sys
+import time
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Tuple
+from src.constants import SOURCE_TYPE
+from src.constants import EntryType
+from src.constants import IS_NULLABLE_TRUE
+from src.constants import STAND_IN_MODULE
+from src.constants import STAND_IN_CLASS
+from src.common.dbapi_connector import DbApiConnector
+from src.common.dbapi_connector import FETCH_SIZE
+from src.common.query_ledger import LEDGER
+from src.common.argument_validator import addFilterArguments
+from src.common.argument_validator import validateFilterArguments
+from src.common.synthetic_catalog import SyntheticCatalog
+from src.common.synthetic_catalog import parse_shape
+from src.common.synthetic_catalog import parse_type_mix
+from src.common.entry_constants import COLUMN_SCHEMA_NAME
+from src.common.entry_constants import COLUMN_OBJECT_TYPE
+from src.common.entry_constants import COLUMN_TABLE_NAME
+from src.common.entry_constants import COLUMN_COLUMN_NAME
+from src.common.entry_constants import COLUMN_DATA_TYPE
+from src.common.entry_constants import COLUMN_IS_NULLABLE
+from src.common.entry_constants import COLUMN_LAST_MODIFIED
+from src.common.entry_constants import COLUMN_OBJECT_COUNT
+from src.common.entry_constants import COLUMN_DATABASE_NAME
+
+# Staging tables of the catalog, from which each stand-in fills the dictionary views of its source.
+# Ids number schemas, objects and data types from 1 in the order they are first read
+STAGING_DDL = [
+    "CREATE TEMP TABLE catalog_schemas (schema_id INTEGER PRIMARY KEY, schema_name TEXT)",
+    "CREATE TEMP TABLE catalog_objects (object_id INTEGER PRIMARY KEY, schema_id INTEGER, schema_name TEXT, "
+    "object_type TEXT, table_name TEXT)",
+    "CREATE TEMP TABLE catalog_columns (object_id INTEGER, column_name TEXT, ordinal_position INTEGER, "
+    "type_id INTEGER, data_type TEXT, nullable INTEGER)",
+    "CREATE TEMP TABLE catalog_types (type_id INTEGER PRIMARY KEY, data_type TEXT)",
+]
+STAGING_TABLES = ["catalog_schemas", "catalog_objects", "catalog_columns", "catalog_types"]
+
+# Size of the catalog held by a stand-in, so a stand-in file is populated only once
+INFO_DDL = "CREATE TABLE IF NOT EXISTS stand_in_info (schemas INTEGER, column_rows INTEGER)"
+
+# Last DDL time of every table and view in a stand-in
+STAND_IN_DDL_TIME = "2025-01-01 00:00:00"
+
+# Columns expected from each metadata query, as read by name by the Spark connectors
+SCHEMA_COLUMNS = [COLUMN_SCHEMA_NAME]
+DATASET_COLUMNS = [COLUMN_TABLE_NAME, COLUMN_COLUMN_NAME, COLUMN_DATA_TYPE, COLUMN_IS_NULLABLE]
+SCHEMA_DATASET_COLUMNS = [COLUMN_OBJECT_TYPE] + DATASET_COLUMNS
+ALL_DATASET_COLUMNS = [COLUMN_SCHEMA_NAME, COLUMN_OBJECT_TYPE] + DATASET_COLUMNS
+LAST_MODIFIED_COLUMNS = [COLUMN_SCHEMA_NAME, COLUMN_LAST_MODIFIED, COLUMN_OBJECT_COUNT]
+DATABASE_COLUMNS = [COLUMN_DATABASE_NAME]
+
+def regexp_like(value: str, pattern: str) -> bool:
+    """Regular expression match of the name filters, for the FUNCTIONS of sources matching with a function."""
+    return value is not None and re.search(pattern, value) is not None
+
+class StandInConnector(DbApiConnector):
+    """Runs the metadata queries of a connector against a SQLite database emulating the dictionary views of its source.
+    Subclasses mix in the query class of the source and describe its views:
+        ATTACHED_SCHEMAS - schemas qualifying view names, eg. information_schema, which are attached as databases
+        DDL - statements creating each view as a table
+        POPULATE - statements filling the views from the catalog_* staging tables. :database is the --database
+                   argument and :ddl_time the time of the last DDL change of every object
+        FUNCTIONS - SQL functions of the source used by its queries, implemented in Python
+    """
+
+    ATTACHED_SCHEMAS: List[str] = []
+    DDL: List[str] = []
+    POPULATE: List[str] = []
+    FUNCTIONS: Dict[str, Callable] = {}
+
+    def __init__(self, config: Dict[str, str]):
+        path = config.get('stand_in_file') or ":memory:"
+        connection = sqlite3.connect(path)
+        for schema in self.ATTACHED_SCHEMAS:
+            # Each attached schema is a separate file next to a stand-in file
+            connection.execute(f"ATTACH DATABASE ? AS {schema}", (path if path == ":memory:" else f"{path}.{schema}",))
+        for name, function in self.FUNCTIONS.items():
+            connection.create_function(name, -1, function, deterministic=True)
+        for statement in self.DDL + [INFO_DDL]:
+            connection.execute(statement)
+        self.columns = []
+        super().__init__(config, connection)
+
+    def _fetch(self, query: str) -> Iterator[Tuple]:
+        """Fetches rows as DbApiConnector, keeping the column names of the result in columns."""
+        fetch_size = self._config.get('fetch_size') or FETCH_SIZE
+        cursor = self._connection.execute(query)
+        self.columns = [column[0].upper() for column in cursor.description]
+        try:
+            while True:
+                rows = cursor.fetchmany(fetch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
+
+    def get_schema_datasets(self, schema_name: str) -> Iterator[Tuple]:
+        return self._execute(self._get_schema_dataset_query(schema_name))
+
+    def get_all_datasets(self) -> Iterator[Tuple]:
+        return self._execute(self._get_all_columns())
+
+    def column_rows(self) -> int:
+        """Number of columns in the catalog held by the stand-in, or None if it is not populated."""
+        row = self._connection.execute("SELECT column_rows FROM stand_in_info").fetchone()
+        return row[0] if row else None
+
+    def populate(self, rows: Iterable[Tuple]) -> int:
+        """Fills the dictionary views with (schema name, object type, table name, column name, data type, is nullable)
+        rows, as returned by get_all_datasets. Returns the number of columns"""
+        schema_ids = {}
+        object_ids = {}
+        type_ids = {}
+        positions = {}
+
+        def staged_columns():
+            for schema_name, object_type, table_name, column_name, data_type, is_nullable in rows:
+                schema_id = schema_ids.setdefault(schema_name, len(schema_ids) + 1)
+                object_id = object_ids.setdefault((schema_id, schema_name, object_type, table_name), len(object_ids) + 1)
+                type_id = type_ids.setdefault(data_type, len(type_ids) + 1)
+                positions[object_id] = positions.get(object_id, 0) + 1
+                yield object_id, column_name, positions[object_id], type_id, data_type, int(is_nullable == IS_NULLABLE_TRUE)
+
+        connection = self._connection
+        for statement in STAGING_DDL:
+            connection.execute(statement)
+        with connection:
+            connection.executemany("INSERT INTO catalog_columns VALUES (?, ?, ?, ?, ?, ?)", staged_columns())
+            connection.executemany("INSERT INTO catalog_schemas VALUES (?, ?)",
+                                   ((schema_id, schema_name) for schema_name, schema_id in schema_ids.items()))
+            connection.executemany("INSERT INTO catalog_objects VALUES (?, ?, ?, ?, ?)",
+                                   ((object_id,) + key for key, object_id in object_ids.items()))
+            connection.executemany("INSERT INTO catalog_types VALUES (?, ?)",
+                                   ((type_id, data_type) for data_type, type_id in type_ids.items()))
+            for statement in self.POPULATE:
+                connection.execute(statement, {'database': self._config.get('database'), 'ddl_time': STAND_IN_DDL_TIME})
+            column_rows = connection.execute("SELECT count(*) FROM catalog_columns").fetchone()[0]
+            connection.execute("INSERT INTO stand_in_info VALUES (?, ?)", (len(schema_ids), column_rows))
+        for table in STAGING_TABLES:
+            connection.execute(f"DROP TABLE {table}")
+        return column_rows
+
+def _check(connector: StandInConnector, description: str, rows, expected_columns: List[str], mismatches: List[str]) -> List[Tuple]:
+    """Reads all rows of a query and prints their count and columns, adding the description to mismatches
+    if the columns are not as expected. Returns the rows"""
+    if rows is None:
+        print(f"{description}: not supported")
+        return []
+    started = time.time()
+    rows = list(rows)
+    matches = connector.columns == expected_columns
+    if not matches:
+        mismatches.append(description)
+    print(f"{description}: {len(rows)} rows in {time.time() - started:.3f}s, columns {', '.join(connector.columns)}"
+          + ("" if matches else f" - expected {', '.join(expected_columns)}"))
+    return rows
+
+def read_args() -> Dict:
+    """Reads stand-in arguments from the command line."""
+    parser = argparse.ArgumentParser(description=f"Runs the {SOURCE_TYPE} metadata queries against a SQLite stand-in")
+    parser.add_argument("--synthetic_shape", type=str, required=False, default="10x100x10x20",
+                        help="Shape of the catalog the stand-in is populated with, as schemas x tables x views x columns per table")
+    parser.add_argument("--synthetic_type_mix", type=str, required=False,
+                        help="Data types of the catalog as type=weight pairs, eg. integer=40,varchar=40,timestamp=20")
+    parser.add_argument("--database", type=str, required=False, default="stand_in",
+                        help="Database name the queries are run for")
+    parser.add_argument("--stand_in_file", type=str, required=False,
+                        help="SQLite file holding the stand-in, which is populated only if new. Defaults to an in-memory database")
+    parser.add_argument("--fetch_size", type=int, required=False,
+                        help="Number of rows fetched in each round trip")
+    addFilterArguments(parser)
+    parsed_args = parser.parse_args()
+
+    parsed_args.synthetic_shape = parse_shape(parsed_args.synthetic_shape)
+    if parsed_args.synthetic_type_mix is not None:
+        parsed_args.synthetic_type_mix = parse_type_mix(parsed_args.synthetic_type_mix)
+
+    parsed_args = validateFilterArguments(parsed_args)
+
+    return vars(parsed_args)
+
+def run():
+    """Populates the stand-in of the connector with a synthetic catalog if it is empty, then runs each metadata
+    query of the connector, reporting rows, time and result columns. Exits with an error if any columns differ"""
+    try:
+        config = read_args()
+    except Exception as ex:
+        print(f"Error in arguments: {ex}")
+        sys.exit(1)
+
+    StandInClass = getattr(importlib.import_module(STAND_IN_MODULE), STAND_IN_CLASS)
+    connector = StandInClass(config)
+
+    if connector.column_rows() is None:
+        # Every schema of the shape, so sources with a database per schema, eg. MySQL, also hold databases which are not extracted
+        catalog = SyntheticCatalog(*config['synthetic_shape'], config.get('synthetic_type_mix'))
+        print(f"Populating {SOURCE_TYPE} stand-in with {catalog.schemas} schemas of "
+              f"{catalog.objects_per_schema} tables and views, {catalog.column_rows} columns")
+        started = time.time()
+        connector.populate(catalog.rows())
+        print(f"Populated in {time.time() - started:.3f}s")
+    print(f"Stand-in holds {connector.column_rows()} columns")
+
+    mismatches = []
+    schemas = _check(connector, "Schemas", connector.get_db_schemas(), SCHEMA_COLUMNS, mismatches)
+    if schemas:
+        schema_name = schemas[0][0]
+        _check(connector, f"Tables of {schema_name}", connector.get_dataset(schema_name, EntryType.TABLE), DATASET_COLUMNS, mismatches)
+        _check(connector, f"Views of {schema_name}", connector.get_dataset(schema_name, EntryType.VIEW), DATASET_COLUMNS, mismatches)
+        _check(connector, f"Tables and views of {schema_name}", connector.get_schema_datasets(schema_name), SCHEMA_DATASET_COLUMNS, mismatches)
+    _check(connector, "All tables and views", connector.get_all_datasets(), ALL_DATASET_COLUMNS, mismatches)
+    _check(connector, "Schema last modified", connector.get_schema_last_modified(), LAST_MODIFIED_COLUMNS, mismatches)
+    _check(connector, "Databases", connector.get_databases(), DATABASE_COLUMNS, mismatches)
+
+    output_path = './output'
+    if not os.path.exists(output_path):
+        os.mkdir(output_path)
+    queries_file = f"{output_path}/stand-in-{SOURCE_TYPE}.queries.json"
+    LEDGER.write(queries_file)
+    print(f"{LEDGER.statement_count} statements listed in {queries_file}")
+
+    if mismatches:
+        print(f"{len(mismatches)} queries returned unexpected columns: {', '.join(mismatches)}")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,164 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Synthetic catalogs of schemas, tables and columns in the shape returned by the connectors."""
+from typing import TYPE_CHECKING
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Tuple
+from src.constants import EntryType
+from src.constants import COLLECTION_ENTRY
+from src.constants import IS_NULLABLE_TRUE
+from src import name_builder as nb
+from src.datatype_mapper import EXACT_RULES
+from src.datatype_mapper import PREFIX_RULES
+from src.common.entry_constants import COLUMN_SCHEMA_NAME
+from src.common.entry_constants import COLUMN_OBJECT_TYPE
+from src.common.entry_constants import COLUMN_TABLE_NAME
+from src.common.entry_constants import COLUMN_COLUMN_NAME
+from src.common.entry_constants import COLUMN_DATA_TYPE
+from src.common.entry_constants import COLUMN_IS_NULLABLE
+
+# Spark is only needed to generate dataframes, so catalogs can also be generated as rows without it
+if TYPE_CHECKING:
+    from pyspark.sql import DataFrame
+    from pyspark.sql import SparkSession
+
+# IS_NULLABLE value of required columns. Any value other than IS_NULLABLE_TRUE
+IS_NULLABLE_FALSE = "NO"
+# Every third column is required
+REQUIRED_COLUMN_INTERVAL = 3
+# Multiplier spreading data types over the columns of a table (Knuth's multiplicative hash)
+TYPE_HASH_MULTIPLIER = 2654435761
+
+def default_type_mix() -> Dict[str, int]:
+    """One data type of each mapping rule of the connector, with equal weights."""
+    return {data_types[0]: 1 for rules in (EXACT_RULES, PREFIX_RULES) for data_types in rules.values()}
+
+def parse_type_mix(value: str) -> Dict[str, int]:
+    """Parses a data type mix given as type=weight pairs, eg. integer=40,varchar=40,timestamp=20"""
+    type_mix = {}
+    for pair in value.split(","):
+        data_type, separator, weight = pair.rpartition("=")
+        if not separator or not data_type.strip() or not weight.strip().isdigit() or int(weight) < 1:
+            raise Exception(f"type mix must be a list of type=weight pairs with weights of 1 or more : {pair}")
+        type_mix[data_type.strip()] = int(weight)
+    return type_mix
+
+def parse_shape(value: str) -> Tuple[int, int, int, int]:
+    """Parses a catalog shape given as schemas x tables x views x columns per table, eg. 10x100x10x20"""
+    parts = value.lower().split("x")
+    if len(parts) != 4 or not all(part.strip().isdigit() for part in parts):
+        raise Exception(f"shape must be given as schemas x tables x views x columns, eg. 10x100x10x20 : {value}")
+    schemas, tables, views, columns = (int(part) for part in parts)
+    if schemas < 1 or tables + views < 1 or columns < 1:
+        raise Exception(f"shape must have at least one schema, table or view and column : {value}")
+    return schemas, tables, views, columns
+
+class SyntheticCatalog:
+    """A catalog of schemas each holding the same number of tables and views, of the same number of columns.
+    Names and data types are derived from the position of each column, so a catalog is the same
+    every time it is generated, as rows or as a dataframe built on the executors"""
+
+    def __init__(self, schemas: int, tables_per_schema: int, views_per_schema: int, columns_per_table: int,
+                 type_mix: Dict[str, int] = None, schema_name: str = None):
+        """schema_name - name of the only schema, in place of schemas numbered from schema_00000"""
+        self.schemas = schemas if schema_name is None else 1
+        self._schema_name = schema_name
+        self.tables_per_schema = tables_per_schema
+        self.views_per_schema = views_per_schema
+        self.columns_per_table = columns_per_table
+        # Each data type is repeated by its weight, so picking uniformly applies the weights
+        self._data_types = [data_type for data_type, weight in (type_mix or default_type_mix()).items()
+                            for _ in range(weight)]
+
+    @classmethod
+    def from_config(cls, config: Dict):
+        """Catalog of the --synthetic_shape and --synthetic_type_mix arguments, parsed by validateArguments.
+        Where each database is extracted as a single schema, eg. MySQL, the catalog has one schema named
+        after --database, as more schemas would be given the same entry name"""
+        schema_name = None if nb.HIERARCHY.names_schema(COLLECTION_ENTRY) else config['database']
+        return cls(*config['synthetic_shape'], config.get('synthetic_type_mix'), schema_name)
+
+    @property
+    def objects_per_schema(self) -> int:
+        return self.tables_per_schema + self.views_per_schema
+
+    @property
+    def column_rows(self) -> int:
+        """Number of column rows in the catalog."""
+        return self.schemas * self.objects_per_schema * self.columns_per_table
+
+    @property
+    def entries(self) -> int:
+        """Number of schema, table and view entries built from the catalog."""
+        return self.schemas * (1 + self.objects_per_schema)
+
+    def schema_names(self) -> List[str]:
+        if self._schema_name is not None:
+            return [self._schema_name]
+        return [f"schema_{index:05d}" for index in range(self.schemas)]
+
+    def _object_names(self, entry_type: EntryType) -> Iterator[Tuple[int, str]]:
+        """Yields (object index in schema, name) of the tables or views of a schema."""
+        if entry_type == EntryType.TABLE:
+            return ((index, f"table_{index:06d}") for index in range(self.tables_per_schema))
+        return ((self.tables_per_schema + index, f"view_{index:06d}") for index in range(self.views_per_schema))
+
+    def dataset_rows(self, schema_name: str, entry_type: EntryType) -> Iterator[Tuple]:
+        """Yields (table name, column name, data type, is nullable) rows of tables or views in a schema, ordered by table."""
+        schema_index = self.schema_names().index(schema_name)
+        for object_index, object_name in self._object_names(entry_type):
+            first_row = (schema_index * self.objects_per_schema + object_index) * self.columns_per_table
+            for column_index in range(self.columns_per_table):
+                row_id = first_row + column_index
+                data_type = self._data_types[(row_id * TYPE_HASH_MULTIPLIER) % len(self._data_types)]
+                is_nullable = IS_NULLABLE_FALSE if column_index % REQUIRED_COLUMN_INTERVAL == 0 else IS_NULLABLE_TRUE
+                yield object_name, f"column_{column_index:04d}", data_type, is_nullable
+
+    def rows(self) -> Iterator[Tuple]:
+        """Yields (schema name, object type, table name, column name, data type, is nullable) rows of all tables
+        and views, as returned by get_all_datasets, ordered by schema, object type and table."""
+        for schema_name in self.schema_names():
+            for entry_type in (EntryType.TABLE, EntryType.VIEW):
+                for row in self.dataset_rows(schema_name, entry_type):
+                    yield (schema_name, entry_type.name) + row
+
+    def schemas_df(self, spark: "SparkSession") -> "DataFrame":
+        """Dataframe with the SCHEMA_NAME of each schema."""
+        return spark.createDataFrame([(name,) for name in self.schema_names()], f"{COLUMN_SCHEMA_NAME} string")
+
+    def catalog_df(self, spark: "SparkSession") -> "DataFrame":
+        """Dataframe with the columns of all tables and views, in the form returned by get_all_datasets.
+        Rows are generated on the executors, so catalogs of millions of columns are not held by the driver"""
+        import pyspark.sql.functions as F
+
+        row_id = F.col("id")
+        column_index = row_id % self.columns_per_table
+        object_index = (row_id / self.columns_per_table).cast("long") % self.objects_per_schema
+        schema_index = (row_id / (self.columns_per_table * self.objects_per_schema)).cast("long")
+        is_table = object_index < self.tables_per_schema
+        data_types = F.array(*[F.lit(data_type) for data_type in self._data_types])
+        schema_name = F.format_string("schema_%05d", schema_index) if self._schema_name is None else F.lit(self._schema_name)
+
+        return spark.range(self.column_rows).select(
+            schema_name.alias(COLUMN_SCHEMA_NAME),
+            F.when(is_table, EntryType.TABLE.name).otherwise(EntryType.VIEW.name).alias(COLUMN_OBJECT_TYPE),
+            F.when(is_table, F.format_string("table_%06d", object_index))
+             .otherwise(F.format_string("view_%06d", object_index - self.tables_per_schema)).alias(COLUMN_TABLE_NAME),
+            F.format_string("column_%04d", column_index).alias(COLUMN_COLUMN_NAME),
+            F.element_at(data_types, ((row_id * TYPE_HASH_MULTIPLIER) % len(self._data_types) + 1).cast("int")).alias(COLUMN_DATA_TYPE),
+            F.when(column_index % REQUIRED_COLUMN_INTERVAL == 0, IS_NULLABLE_FALSE)
+             .otherwise(IS_NULLABLE_TRUE).alias(COLUMN_IS_NULLABLE))
@@ -12,9 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import lru_cache
 from google.cloud import secretmanager
 
-# Retrieve password from Secret Manager
+# Retrieve password from Secret Manager. Cached, as sources extracted together often share a secret
+@lru_cache(maxsize=None)
 def get_password(secret_path: str) -> str:
     client = secretmanager.SecretManagerServiceClient()
     if "versions" not in secret_path:
@@ -0,0 +1,103 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Fixtures laying out each connector as it is run, with the common code copied into src/common."""
+import importlib
+import shutil
+import sys
+from pathlib import Path
+import pytest
+
+CONNECTORS_DIR = Path(__file__).resolve().parent.parent
+COMMON_DIRS = [CONNECTORS_DIR / "src" / "common", CONNECTORS_DIR / "src" / "common" / "rdbms"]
+CONNECTORS = ["postgresql-connector", "mysql-connector", "oracle-connector", "sql-server-connector", "snowflake-connector"]
+
+def _purge_src_modules():
+    for name in [name for name in sys.modules if name == "src" or name.startswith("src.")]:
+        del sys.modules[name]
+
+def _layout(connector: str, directory: Path):
+    """Copies the src of a connector to directory, with the common code in src/common."""
+    common_dir = directory / "src" / "common"
+    common_dir.mkdir(parents=True)
+    for path in (CONNECTORS_DIR / connector / "src").glob("*.py"):
+        shutil.copy(path, directory / "src")
+    for source_dir in COMMON_DIRS:
+        for path in source_dir.glob("*.py"):
+            shutil.copy(path, common_dir)
+    (directory / "src" / "__init__.py").touch()
+    (common_dir / "__init__.py").touch()
+
+@pytest.fixture
+def load_connector(tmp_path, monkeypatch):
+    """Lays out a connector and puts it first on the path. Returns importlib.import_module for its modules,
+    eg. load_connector("mysql-connector")("src.mysql_queries"). The src package is cleared before and after,
+    so each test imports the modules of its own connector"""
+    def load(connector: str):
+        directory = tmp_path / connector
+        _layout(connector, directory)
+        monkeypatch.syspath_prepend(str(directory))
+        _purge_src_modules()
+        return importlib.import_module
+    yield load
+    _purge_src_modules()
+
+@pytest.fixture(params=CONNECTORS)
+def connector(request, load_connector):
+    """Each connector in turn, as load_connector."""
+    return load_connector(request.param)
+
+@pytest.fixture
+def config():
+    """Arguments read by the entry builders of every connector."""
+    return {
+        'target_project_id': "test-project",
+        'target_location_id': "us-central1",
+        'target_entry_group_id': "test-group",
+        'host': "test-host",
+        'account': "test-account",
+        'database': "test_db",
+        'sid': None,
+        'service': "test_service",
+    }
+
+@pytest.fixture(scope="session")
+def spark():
+    """Local Spark session for tests of the Spark engine, which are skipped without pyspark."""
+    pytest.importorskip("pyspark")
+    from pyspark.sql import SparkSession
+    session = SparkSession.builder.master("local[1]").appName("connector-tests") \
+        .config("spark.sql.shuffle.partitions", "1") \
+        .config("spark.ui.enabled", "false") \
+        .getOrCreate()
+    yield session
+    session.stop()
+
+# Shape of the synthetic catalog the stand-ins are populated with
+STAND_IN_SHAPE = "3x3x2x4"
+
+@pytest.fixture
+def open_stand_in(connector, config, monkeypatch):
+    """Returns a function opening the stand-in of the connector with the given command line arguments,
+    eg. "--include_tables", "table_*", populated with a synthetic catalog. Its arguments are added to config"""
+    def open_stand_in(*args: str):
+        stand_in_module = connector("src.common.stand_in")
+        constants = connector("src.constants")
+        monkeypatch.setattr(sys, "argv", ["stand_in", "--synthetic_shape", STAND_IN_SHAPE, "--database", config['database'], *args])
+        config.update(stand_in_module.read_args())
+        stand_in = getattr(connector(constants.STAND_IN_MODULE), constants.STAND_IN_CLASS)(config)
+        stand_in.populate(stand_in_module.SyntheticCatalog(*config['synthetic_shape']).rows())
+        return stand_in
+    return open_stand_in
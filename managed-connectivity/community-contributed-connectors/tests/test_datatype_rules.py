@@ -0,0 +1,127 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests of the datatype rules of each connector and of override files."""
+import json
+import pytest
+
+# Metadata types of native data types, as mapped by the connectors before the rules were declarative
+EXPECTED_METADATA_TYPES = {
+    "mysql-connector": {
+        "int": "NUMBER", "tinyint(1)": "NUMBER", "decimal(10,2)": "NUMBER", "varchar(255)": "STRING",
+        "longtext": "STRING", "varbinary(16)": "BYTES", "datetime(6)": "TIMESTAMP", "timestamp": "TIMESTAMP",
+        "date": "DATETIME", "json": "OTHER", "enum('a','b')": "OTHER",
+    },
+    "postgresql-connector": {
+        "integer": "NUMBER", "double precision": "NUMBER", "text": "STRING", "character varying": "STRING",
+        "bpchar": "STRING", "bytea": "BYTES", "boolean": "BOOLEAN", "timestamp with time zone": "TIMESTAMP",
+        "date": "DATETIME", "integer[]": "OTHER", "jsonb": "OTHER",
+    },
+    "oracle-connector": {
+        "NUMBER(10,2)": "NUMBER", "LONG": "NUMBER", "BINARY_DOUBLE": "NUMBER", "VARCHAR2": "STRING",
+        "NCLOB": "STRING", "LONG RAW": "BYTES", "BOOLEAN": "BOOLEAN", "TIMESTAMP(6) WITH TIME ZONE": "TIMESTAMP",
+        "DATE": "DATETIME", "XMLTYPE": "OTHER",
+    },
+    "sql-server-connector": {
+        "int": "NUMBER", "money": "NUMBER", "nvarchar": "STRING", "xml": "STRING", "geography": "BYTES",
+        "datetime2": "DATETIME", "datetimeoffset": "DATETIME", "time": "TIME", "uniqueidentifier": "OTHER",
+        "int identity": "OTHER",
+    },
+    "snowflake-connector": {
+        "NUMBER(38,0)": "NUMBER", "DOUBLE PRECISION": "NUMBER", "VARCHAR(16777216)": "STRING",
+        "VARBINARY": "STRING", "TIMESTAMP_NTZ": "TIMESTAMP", "DATE": "TIMESTAMP", "BOOLEAN": "BOOLEAN",
+        "VARIANT": "OTHER",
+    },
+}
+
+@pytest.mark.parametrize("connector_name", sorted(EXPECTED_METADATA_TYPES))
+def test_source_rules(load_connector, connector_name):
+    rules = load_connector(connector_name)("src.common.datatype_rules").SOURCE_RULES
+
+    assert {data_type: rules.lookup(data_type) for data_type in EXPECTED_METADATA_TYPES[connector_name]} \
+        == EXPECTED_METADATA_TYPES[connector_name]
+    assert rules.lookup(None) == rules.default
+
+def test_exact_match_then_longest_prefix_then_default(load_connector):
+    DatatypeRules = load_connector("postgresql-connector")("src.common.datatype_rules").DatatypeRules
+    rules = DatatypeRules.from_tables({"STRING": ["date_text"]},
+                                      {"DATETIME": ["date"], "TIMESTAMP": ["datetime"], "NUMBER": ["int", "int"]},
+                                      "OTHER")
+
+    assert rules.lookup("date_text") == "STRING"
+    assert rules.lookup("date_text2") == "DATETIME"
+    assert rules.lookup("datetime2") == "TIMESTAMP"
+    assert rules.lookup("dat") == "OTHER"
+    assert rules.lookup("") == "OTHER"
+    # Cached results are returned on the next lookup
+    assert rules.lookup("datetime2") == "TIMESTAMP"
+
+def test_first_metadata_type_of_a_data_type_is_used(load_connector):
+    DatatypeRules = load_connector("postgresql-connector")("src.common.datatype_rules").DatatypeRules
+    rules = DatatypeRules.from_tables({"NUMBER": ["LONG"], "BYTES": ["LONG"]}, {}, "OTHER")
+
+    assert rules.lookup("LONG") == "NUMBER"
+
+def test_overrides_take_precedence(load_connector, config, tmp_path):
+    datatype_rules = load_connector("postgresql-connector")("src.common.datatype_rules")
+    mapping_file = tmp_path / "mapping.json"
+    mapping_file.write_text(json.dumps({"exact": {"STRING": ["citext", "integer"]},
+                                        "prefix": {"NUMBER": ["uint"]},
+                                        "default": "UNKNOWN"}))
+    config['datatype_mapping_file'] = str(mapping_file)
+
+    rules = datatype_rules.get_rules(config)
+
+    assert rules.lookup("citext") == "STRING"
+    assert rules.lookup("integer") == "STRING"
+    assert rules.lookup("uint8") == "NUMBER"
+    assert rules.lookup("bytea") == "BYTES"
+    assert rules.lookup("jsonb") == "UNKNOWN"
+    assert datatype_rules.get_rules(config) is rules
+    assert datatype_rules.SOURCE_RULES.lookup("citext") == "OTHER"
+
+def test_rules_without_mapping_file(load_connector, config):
+    datatype_rules = load_connector("postgresql-connector")("src.common.datatype_rules")
+
+    assert datatype_rules.get_rules(config) is datatype_rules.SOURCE_RULES
+
+def test_missing_mapping_file(load_connector, tmp_path):
+    datatype_rules = load_connector("postgresql-connector")("src.common.datatype_rules")
+
+    with pytest.raises(Exception, match="not found"):
+        datatype_rules.load_overrides(str(tmp_path / "missing.json"))
+
+def test_unknown_keys_in_mapping_file(load_connector, tmp_path):
+    datatype_rules = load_connector("postgresql-connector")("src.common.datatype_rules")
+    mapping_file = tmp_path / "mapping.json"
+    mapping_file.write_text(json.dumps({"exact": {}, "prefixes": {}}))
+
+    with pytest.raises(Exception, match="prefixes"):
+        datatype_rules.load_overrides(str(mapping_file))
+
+@pytest.mark.parametrize("connector_name", sorted(EXPECTED_METADATA_TYPES))
+def test_spark_expression_matches_lookup(load_connector, connector_name, spark):
+    load = load_connector(connector_name)
+    datatype_rules = load("src.common.datatype_rules")
+    entry_builder = load("src.common.entry_builder")
+    import pyspark.sql.functions as F
+    rules = datatype_rules.SOURCE_RULES
+    data_types = [*EXPECTED_METADATA_TYPES[connector_name], *rules.exact, *rules.prefixes, "", None]
+    df = spark.createDataFrame([(data_type,) for data_type in data_types], "DATA_TYPE string")
+
+    rows = df.select("DATA_TYPE", entry_builder.metadata_type_expr(F.col("DATA_TYPE"), rules)).collect()
+
+    assert {data_type: metadata_type for data_type, metadata_type in rows} \
+        == {data_type: rules.lookup(data_type) for data_type in data_types}
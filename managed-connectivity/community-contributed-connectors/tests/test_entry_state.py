@@ -0,0 +1,45 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests of the entry state kept between runs for incremental extraction."""
+import json
+
+def _run(load, config, rows, state_uri):
+    """Extracts the tables of rows in schema sales as an incremental run does. Returns the state and the json output"""
+    EntryType = load("src.constants").EntryType
+    state = load("src.common.entry_state").EntryState.load(state_uri)
+    entries = load("src.common.python_entry_builder").build_dataset(config, rows, "sales", EntryType.TABLE)
+    output = list(state.filter_changed(entries, True))
+    state.save(state_uri)
+    return state, output
+
+def test_table_dropped_between_runs_is_listed(load_connector, config, tmp_path):
+    load = load_connector("postgresql-connector")
+    EntryType = load("src.constants").EntryType
+    nb = load("src.name_builder")
+    state_uri = str(tmp_path / "entries.state.json")
+    rows = [("orders", "id", "integer", "NO"), ("returns", "id", "integer", "NO"), ("stock", "id", "integer", "NO")]
+
+    state, output = _run(load, config, rows, state_uri)
+    assert len(output) == 3
+    assert state.deleted_entries() == []
+    # returns is dropped and stock changed
+    state, output = _run(load, config, [rows[0], ("stock", "id", "bigint", "NO")], state_uri)
+
+    assert [json.loads(entry)["entry"]["entrySource"]["displayName"] for entry in output] == ["stock"]
+    dropped = nb.create_name(config, EntryType.TABLE, "sales", "returns")
+    assert state.deleted_entries() == [dropped]
+    assert load("src.common.entry_state").deleted_entries_uri(state_uri) == str(tmp_path / "entries.state.deleted.json")
+    assert json.loads((tmp_path / "entries.state.deleted.json").read_text()) == {"deletedEntries": [dropped]}
@@ -0,0 +1,153 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests of the entry hierarchy of each connector, compiled for the arguments of a run."""
+import pytest
+
+PREFIX = "projects/test-project/locations/us-central1/entryGroups/test-group/entries/"
+HOST = PREFIX + "db.example.com@5432"
+
+# Arguments holding characters which are escaped in names
+ARGUMENTS = {'host': "db.example.com:5432", 'account': "org.acct"}
+
+# Schema and table the names are rendered for. # is not accepted in names
+SCHEMA_NAME = "C##sales"
+TABLE_NAME = "orders"
+
+def _schema_levels(top_name: str, top_fqn: str, database: str, fqn_database: str):
+    """Names, fully qualified names and parent names of sources with instance, database, schema and table levels."""
+    return {
+        "top": (top_name, top_fqn, ""),
+        "DATABASE": (f"{top_name}/databases/{database}", f"{top_fqn}.{fqn_database}", top_name),
+        "DB_SCHEMA": (f"{top_name}/databases/{database}/database_schemas/C!!sales",
+                      f"{top_fqn}.{fqn_database}.`C##sales`", f"{top_name}/databases/{database}"),
+        "TABLE": (f"{top_name}/databases/{database}/database_schemas/C!!sales/tables/orders",
+                  f"{top_fqn}.{fqn_database}.`C##sales`.orders",
+                  f"{top_name}/databases/{database}/database_schemas/C!!sales"),
+        "VIEW": (f"{top_name}/databases/{database}/database_schemas/C!!sales/views/orders",
+                 f"{top_fqn}.{fqn_database}.`C##sales`.orders",
+                 f"{top_name}/databases/{database}/database_schemas/C!!sales"),
+    }
+
+# Names of each entry type, as built by the connectors before their hierarchies were declared
+EXPECTED_NAMES = {
+    "postgresql-connector": _schema_levels(HOST, "postgresql:`db.example.com:5432`", "test_db", "test_db"),
+    "sql-server-connector": _schema_levels(HOST, "sqlserver:`db.example.com:5432`", "test_db", "test_db"),
+    # Without a SID, the database is named by the service
+    "oracle-connector": _schema_levels(HOST, "oracle:`db.example.com:5432`", "test_service", "test_service"),
+    "snowflake-connector": _schema_levels(PREFIX + "org@acct", "snowflake:`org.acct`", "test_db", "test_db"),
+    # Tables are children of the database, and the database is named as their schema in fully qualified names
+    "mysql-connector": {
+        "top": (HOST, "mysql:`db.example.com:5432`", ""),
+        "DATABASE": (f"{HOST}/databases/test_db", "mysql:`db.example.com:5432`.test_db", HOST),
+        "TABLE": (f"{HOST}/databases/test_db/tables/orders", "mysql:`db.example.com:5432`.`C##sales`.orders",
+                  f"{HOST}/databases/test_db"),
+        "VIEW": (f"{HOST}/databases/test_db/views/orders", "mysql:`db.example.com:5432`.`C##sales`.orders",
+                 f"{HOST}/databases/test_db"),
+    },
+}
+
+def _names(nb, EntryType, config, top):
+    names = {}
+    for entry_type in EntryType:
+        key = "top" if entry_type == top else entry_type.name
+        names[key] = (nb.create_name(config, entry_type, SCHEMA_NAME, TABLE_NAME),
+                      nb.create_fqn(config, entry_type, SCHEMA_NAME, TABLE_NAME),
+                      nb.create_parent_name(config, entry_type, SCHEMA_NAME))
+    return names
+
+@pytest.mark.parametrize("connector_name", sorted(EXPECTED_NAMES))
+def test_names_of_each_entry_type(load_connector, config, connector_name):
+    load = load_connector(connector_name)
+    constants = load("src.constants")
+    nb = load("src.name_builder")
+    config.update(ARGUMENTS)
+
+    assert _names(nb, constants.EntryType, config, constants.TOP_ENTRY_HIERARCHY[0]) == EXPECTED_NAMES[connector_name]
+    assert nb.create_entry_aspect_name(config, constants.COLLECTION_ENTRY) \
+        == "test-project.us-central1." + constants.COLLECTION_ENTRY.value.split("/")[-1]
+
+def test_oracle_database_named_by_sid(load_connector, config):
+    load = load_connector("oracle-connector")
+    EntryType = load("src.constants").EntryType
+    nb = load("src.name_builder")
+    config.update(ARGUMENTS, sid="ORCL")
+
+    # The fully qualified name keeps the service
+    assert nb.create_name(config, EntryType.DATABASE) == f"{HOST}/databases/ORCL"
+    assert nb.create_fqn(config, EntryType.DATABASE) == "oracle:`db.example.com:5432`.test_service"
+
+def test_compiled_once_per_argument_values(load_connector, config):
+    load = load_connector("postgresql-connector")
+    EntryType = load("src.constants").EntryType
+    HIERARCHY = load("src.name_builder").HIERARCHY
+
+    compiled = HIERARCHY.compile(config)
+    assert HIERARCHY.compile(dict(config)) is compiled
+    other = HIERARCHY.compile(dict(config, database="other_db"))
+    assert other is not compiled
+    assert other.name(EntryType.DATABASE).endswith("/databases/other_db")
+    assert compiled.name(EntryType.DATABASE).endswith("/databases/test_db")
+
+def test_compiled_hierarchies_are_bounded(load_connector, config):
+    load = load_connector("postgresql-connector")
+    hierarchy = load("src.common.hierarchy")
+    HIERARCHY = load("src.name_builder").HIERARCHY
+
+    first = HIERARCHY.compile(dict(config, host="host-0"))
+    # eg. a fleet worker extracting many sources in turn
+    for index in range(1, hierarchy.COMPILED_CACHE_SIZE + 10):
+        HIERARCHY.compile(dict(config, host=f"host-{index}"))
+    assert HIERARCHY._compile_values.cache_info().currsize == hierarchy.COMPILED_CACHE_SIZE
+    assert HIERARCHY.compile(dict(config, host="host-0")) is not first
+
+def test_braces_in_values_are_not_placeholders(load_connector, config):
+    load = load_connector("postgresql-connector")
+    EntryType = load("src.constants").EntryType
+    compiled = load("src.name_builder").HIERARCHY.compile(dict(config, database="db{schema}"))
+
+    assert compiled.name(EntryType.TABLE, "s{0}", "t{table}") \
+        == f"{PREFIX}test-host/databases/db{{schema}}/database_schemas/s{{0}}/tables/t{{table}}"
+    assert compiled.fqn(EntryType.TABLE, "s{0}", "t{table}") == "postgresql:`test-host`.db{schema}.s{0}.t{table}"
+
+def test_names_schema(connector):
+    constants = connector("src.constants")
+    HIERARCHY = connector("src.name_builder").HIERARCHY
+    names_schema = constants.SOURCE_TYPE != "mysql"
+
+    # MySQL databases are extracted as the only schema, which is not part of table names
+    assert HIERARCHY.names_schema(constants.COLLECTION_ENTRY) == names_schema
+    assert HIERARCHY.names_schema(constants.EntryType.TABLE) == names_schema
+    assert not HIERARCHY.names_schema(constants.TOP_ENTRY_HIERARCHY[0])
+
+def test_spark_expressions_match_names(connector, config, spark):
+    import pyspark.sql.functions as F
+    EntryType = connector("src.constants").EntryType
+    compiled = connector("src.name_builder").HIERARCHY.compile(dict(config, **ARGUMENTS))
+    rows = [(SCHEMA_NAME, TABLE_NAME), ("sales", "t{0}")]
+    df = spark.createDataFrame(rows, "SCHEMA_NAME string, TABLE_NAME string")
+    schema = F.col("SCHEMA_NAME")
+    table = F.col("TABLE_NAME")
+
+    for entry_type in EntryType:
+        columns = [compiled.name_expr(entry_type, schema, table), compiled.fqn_expr(entry_type, schema, table),
+                   compiled.parent_expr(entry_type, schema)]
+        expected = [(compiled.name(entry_type, schema_name, table_name), compiled.fqn(entry_type, schema_name, table_name),
+                     compiled.parent_name(entry_type, schema_name)) for schema_name, table_name in rows]
+        assert [tuple(row) for row in df.select(*columns).collect()] == expected
+        # A schema name given as a string is rendered into the literal part of the expression
+        literal_columns = [compiled.name_expr(entry_type, SCHEMA_NAME, table), compiled.fqn_expr(entry_type, SCHEMA_NAME, table),
+                           compiled.parent_expr(entry_type, SCHEMA_NAME)]
+        assert tuple(df.select(*literal_columns).first()) == expected[0]
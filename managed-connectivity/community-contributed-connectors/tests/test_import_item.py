@@ -0,0 +1,85 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests of the import items built in Python and their json."""
+import json
+import pytest
+
+# Names with characters escaped differently by json writers
+TRICKY_VALUES = ["Zürich", "日本語", "emoji 😀", 'quote " and \\ backslash', "tab\tnew\nline", "control \x00\x01\x0b\x1f\x7f",
+                 "short \b\f\r", "escaped text \\u001f", "\u2028",
+                 "separators   ", "slash /", "<script>&amp;"]
+
+def test_top_level_entry_json(load_connector, config):
+    load = load_connector("postgresql-connector")
+    EntryType = load("src.constants").EntryType
+    top_entry_builder = load("src.common.top_entry_builder")
+
+    assert top_entry_builder.create(config, EntryType.DATABASE) == (
+        '{"entry":{"name":"projects/test-project/locations/us-central1/entryGroups/test-group/entries/test-host/databases/test_db",'
+        '"fullyQualifiedName":"postgresql:`test-host`.test_db",'
+        '"parentEntry":"projects/test-project/locations/us-central1/entryGroups/test-group/entries/test-host",'
+        '"aspects":{"test-project.us-central1.postgresql-database":'
+        '{"aspectType":"test-project.us-central1.postgresql-database","data":{}}},'
+        '"entryType":"projects/test-project/locations/us-central1/entryTypes/postgresql-database"},'
+        '"aspectKeys":["test-project.us-central1.postgresql-database"],"updateMask":["aspects"]}')
+
+def test_entry_properties_in_spark_order(load_connector):
+    import_item = load_connector("postgresql-connector")("src.common.import_item")
+    aspects = {"schema": import_item.Aspect("schema", {"fields": [{"name": "id"}]}), "p.l.table": import_item.Aspect("p.l.table")}
+    entry = import_item.Entry("n", "fqn", "parent", "type", aspects, "orders")
+
+    item = json.loads(import_item.to_json(import_item.ImportItem(entry).to_dict()))
+    assert list(item) == ["entry", "aspectKeys", "updateMask"]
+    assert list(item["entry"]) == ["name", "fullyQualifiedName", "parentEntry", "entrySource", "aspects", "entryType"]
+    assert item["entry"]["entrySource"] == {"displayName": "orders", "system": "postgresql"}
+    assert item["entry"]["aspects"]["schema"] == {"aspectType": "schema", "data": {"fields": [{"name": "id"}]}}
+    assert item["aspectKeys"] == ["schema", "p.l.table"]
+    # Entries without a display name, ie. top level entries, have no entry source
+    entry.display_name = None
+    assert "entrySource" not in import_item.ImportItem(entry).to_dict()["entry"]
+
+def test_update_mask_not_shared(load_connector):
+    import_item = load_connector("postgresql-connector")("src.common.import_item")
+    entry = import_item.Entry("n", "fqn", "", "type", {})
+    first = import_item.ImportItem(entry)
+
+    first.to_dict()["updateMask"].append("labels")
+    first.update_mask.append("labels")
+    assert import_item.ImportItem(entry).to_dict()["updateMask"] == ["aspects"]
+
+def test_json_same_with_and_without_orjson(load_connector, monkeypatch):
+    pytest.importorskip("orjson")
+    import_item = load_connector("postgresql-connector")("src.common.import_item")
+    value = {"values": TRICKY_VALUES, "nested": {"empty": {}, "list": [], "none": None}}
+
+    with_orjson = import_item.to_json(value)
+    monkeypatch.setattr(import_item, "orjson", None)
+    assert import_item.to_json(value) == with_orjson
+    assert json.loads(with_orjson) == value
+
+def test_unpaired_surrogates_are_written(load_connector):
+    import_item = load_connector("postgresql-connector")("src.common.import_item")
+
+    # orjson rejects them, so they are written as by json
+    assert import_item.to_json({"name": "bad \ud800"}) == '{"name":"bad \ud800"}'
+
+def test_json_matches_spark(load_connector, spark):
+    import pyspark.sql.functions as F
+    import_item = load_connector("postgresql-connector")("src.common.import_item")
+    df = spark.createDataFrame([(value,) for value in TRICKY_VALUES], "name string")
+
+    assert [row[0] for row in df.select(F.to_json(F.struct("name"))).collect()] \
+        == [import_item.to_json({"name": value}) for value in TRICKY_VALUES]
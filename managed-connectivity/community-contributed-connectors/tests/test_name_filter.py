@@ -0,0 +1,116 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests of the schema and table name filters, as SQL and as run by the metadata queries of each connector."""
+import fnmatch
+import re
+import pytest
+
+def test_glob_translated_to_like(load_connector):
+    name_filter = load_connector("postgresql-connector")("src.common.name_filter")
+    dialect = name_filter.SqlDialect()
+
+    assert dialect.like("sales*") == "sales%"
+    assert dialect.like("t?_2024") == "t_!_2024"
+    assert dialect.like("100%!") == "100!%!!"
+    # Brackets are only escaped for sources treating them as wildcards
+    assert dialect.like("[a]*") == "[a]%"
+    assert name_filter.SqlDialect(like_wildcards="%_[").like("[a]*") == "![a]%"
+
+def test_literal_escapes_quotes_and_backslashes(load_connector):
+    name_filter = load_connector("postgresql-connector")("src.common.name_filter")
+
+    assert name_filter.SqlDialect().literal("o'brien\\") == "'o''brien\\'"
+    assert name_filter.SqlDialect(backslash_escapes=True).literal("o'brien\\") == "'o''brien\\\\'"
+
+def test_names_compared_for_equality_and_globs_with_like(load_connector):
+    name_filter = load_connector("postgresql-connector")("src.common.name_filter")
+    dialect = name_filter.SqlDialect()
+
+    assert dialect.matches("t", ["orders", "sales_*", "items"], name_filter.FILTER_GLOB) \
+        == "t IN ('orders', 'items') OR t LIKE 'sales!_%' ESCAPE '!'"
+    assert dialect.matches("t", ["a?"], name_filter.FILTER_GLOB) == "t LIKE 'a_' ESCAPE '!'"
+
+def test_regular_expressions_match_whole_names(load_connector):
+    name_filter = load_connector("postgresql-connector")("src.common.name_filter")
+    dialect = name_filter.SqlDialect(regex_match="{column} ~ {pattern}")
+
+    assert dialect.matches("t", ["a|b", "c[0-9]{1,3}"], name_filter.FILTER_REGEX) \
+        == "t ~ '^(a|b)$' OR t ~ '^(c[0-9]{1,3})$'"
+    with pytest.raises(Exception, match="not supported"):
+        name_filter.SqlDialect().matches("t", ["a.*"], name_filter.FILTER_REGEX)
+
+def test_parse_patterns(load_connector):
+    name_filter = load_connector("postgresql-connector")("src.common.name_filter")
+
+    assert name_filter.parse_patterns(None, name_filter.FILTER_GLOB) is None
+    assert name_filter.parse_patterns(["a, b*", "c"], name_filter.FILTER_GLOB) == ["a", "b*", "c"]
+    # Regular expressions can hold commas, so each is given separately
+    assert name_filter.parse_patterns(["c[0-9]{1,3}"], name_filter.FILTER_REGEX) == ["c[0-9]{1,3}"]
+    with pytest.raises(Exception, match="not a valid regular expression"):
+        name_filter.parse_patterns(["c[0-9"], name_filter.FILTER_REGEX)
+    with pytest.raises(Exception, match="at least one pattern"):
+        name_filter.parse_patterns([" , "], name_filter.FILTER_GLOB)
+
+def test_predicates_of_include_and_exclude_filters(load_connector):
+    name_filter = load_connector("postgresql-connector")("src.common.name_filter")
+    dialect = name_filter.SqlDialect()
+    config = {'include_schemas': ["sales"], 'exclude_tables': ["tmp_*"]}
+
+    assert name_filter.schema_predicate({}, "s", dialect) == ""
+    assert name_filter.schema_predicate(config, "s", dialect) == " AND (s IN ('sales'))"
+    assert name_filter.table_predicate(config, "t", dialect) == " AND NOT (t LIKE 'tmp!_%' ESCAPE '!')"
+
+def _glob(name, patterns):
+    return any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)
+
+def _regex(name, patterns):
+    return any(re.fullmatch(pattern, name) for pattern in patterns)
+
+# Filter arguments, and the schemas and tables each selects from the synthetic catalog
+FILTERS = [
+    (["--include_tables", "table_00000?,view_*", "--exclude_tables", "*1"],
+     lambda schema: True,
+     lambda table: _glob(table, ["table_00000?", "view_*"]) and not _glob(table, ["*1"])),
+    (["--include_schemas", "schema_00001,test_db", "--exclude_schemas", "*2", "--include_tables", "table_*"],
+     lambda schema: _glob(schema, ["schema_00001", "test_db"]) and not _glob(schema, ["*2"]),
+     lambda table: _glob(table, ["table_*"])),
+    (["--filter_syntax", "regex", "--exclude_schemas", "schema_0+2", "--include_tables", "table_0+[02]", "--include_tables", "view_.*1"],
+     lambda schema: not _regex(schema, ["schema_0+2"]),
+     lambda table: _regex(table, ["table_0+[02]", "view_.*1"])),
+]
+
+@pytest.mark.parametrize("args, includes_schema, includes_table", FILTERS)
+def test_queries_return_filtered_names(connector, open_stand_in, args, includes_schema, includes_table):
+    EntryType = connector("src.constants").EntryType
+    all_schemas = [row[0] for row in open_stand_in().get_db_schemas()]
+    try:
+        stand_in = open_stand_in(*args)
+        schemas = [row[0] for row in stand_in.get_db_schemas()]
+    except Exception as ex:
+        # Sources without regular expressions reject them before any query is run
+        assert "--filter_syntax" in args and "not supported" in str(ex)
+        return
+
+    assert schemas == [schema for schema in all_schemas if includes_schema(schema)]
+    assert schemas
+    tables = {(schema, table) for schema in schemas for entry_type in EntryType
+              if entry_type.name in ("TABLE", "VIEW")
+              for table, *_ in stand_in.get_dataset(schema, entry_type)}
+    all_tables = {(schema, table) for schema, _, table, *_ in stand_in.get_all_datasets() if schema in schemas}
+    synthetic_tables = ["table_000000", "table_000001", "table_000002", "view_000000", "view_000001"]
+    expected = {(schema, table) for schema in schemas for table in synthetic_tables if includes_table(table)}
+    assert tables == expected
+    assert all_tables == expected
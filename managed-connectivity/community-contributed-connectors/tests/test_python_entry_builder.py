@@ -0,0 +1,47 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Compares entries of the python entry builder with those of the Spark entry builder."""
+from typing import List
+from typing import Tuple
+
+DATASET_SCHEMA = "TABLE_NAME string, COLUMN_NAME string, DATA_TYPE string, IS_NULLABLE string"
+
+def _collect(df) -> List[Tuple[str, str, str]]:
+    return sorted(tuple(row) for row in df.collect())
+
+def test_schema_entries_match_spark(connector, config, spark):
+    python_entry_builder = connector("src.common.python_entry_builder")
+    entry_builder = connector("src.common.entry_builder")
+    catalog = connector("src.common.synthetic_catalog").SyntheticCatalog(3, 1, 1, 1)
+
+    expected = _collect(entry_builder.to_hashed_json(entry_builder.build_schemas(config, catalog.schemas_df(spark))))
+
+    assert sorted(python_entry_builder.build_schemas(config, catalog.schema_names())) == expected
+
+def test_table_and_view_entries_match_spark(connector, config, spark):
+    python_entry_builder = connector("src.common.python_entry_builder")
+    entry_builder = connector("src.common.entry_builder")
+    EntryType = connector("src.constants").EntryType
+    # A column of each data type rule of the connector, nullable and required
+    catalog = connector("src.common.synthetic_catalog").SyntheticCatalog(1, 4, 2, 25)
+    schema_name = catalog.schema_names()[0]
+
+    for entry_type in (EntryType.TABLE, EntryType.VIEW):
+        rows = list(catalog.dataset_rows(schema_name, entry_type))
+        df_raw = spark.createDataFrame(rows, DATASET_SCHEMA)
+        expected = _collect(entry_builder.to_hashed_json(entry_builder.build_dataset(config, df_raw, schema_name, entry_type)))
+
+        assert sorted(python_entry_builder.build_dataset(config, rows, schema_name, entry_type)) == expected
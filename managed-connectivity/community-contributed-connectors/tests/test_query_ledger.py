@@ -0,0 +1,92 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests of the ledger of statements run against the source."""
+import json
+import threading
+
+def test_spark_statement_recorded_by_its_first_read(load_connector, spark, tmp_path):
+    query_ledger = load_connector("postgresql-connector")("src.common.query_ledger")
+    ledger = query_ledger.QueryLedger()
+    tracker = spark.sparkContext.statusTracker()
+    jobs = len(tracker.getJobIdsForGroup(None))
+
+    df = ledger.materialize("select id from numbers", spark.range(10))
+    ledger.materialize("select id from unread", spark.range(5))
+
+    # No Spark job is run until the result is read
+    assert len(tracker.getJobIdsForGroup(None)) == jobs
+    assert df.filter("id < 3").count() == 3
+    assert df.count() == 10
+    ledger.write(str(tmp_path / "queries.json"))
+    df.unpersist()
+
+    ledger_json = json.loads((tmp_path / "queries.json").read_text())
+    assert [(statement['statement'], statement['rows']) for statement in ledger_json['statements']] \
+        == [("select id from numbers", 10)]
+    assert ledger_json['totalRows'] == 10
+
+def test_python_statement_recorded_once_read(load_connector, tmp_path):
+    query_ledger = load_connector("postgresql-connector")("src.common.query_ledger")
+    ledger = query_ledger.QueryLedger()
+
+    rows = ledger.track("select   name\n from schemas", iter([("a",), ("b",)]))
+    assert ledger.statement_count == 0
+    assert list(rows) == [("a",), ("b",)]
+    ledger.write(str(tmp_path / "queries.json"))
+
+    ledger_json = json.loads((tmp_path / "queries.json").read_text())
+    assert [(statement['statement'], statement['rows']) for statement in ledger_json['statements']] \
+        == [("select name from schemas", 2)]
+
+def test_python_statement_releases_throttle_before_rows_are_processed(load_connector):
+    load = load_connector("postgresql-connector")
+    query_ledger = load("src.common.query_ledger")
+    THROTTLE = load("src.common.query_throttle").THROTTLE
+    ledger = query_ledger.QueryLedger()
+    THROTTLE.configure(max_concurrency=1, max_queries_per_second=1000)
+
+    schemas = ledger.track("select name from schemas", iter([("a",), ("b",)]))
+    assert next(schemas) == ("a",)
+    # All rows are fetched and the statement recorded before the first one is passed on
+    assert ledger.statement_count == 1
+
+    # so the only slot is free for the next statement while rows of the first are processed
+    tables = []
+    reader = threading.Thread(target=lambda: tables.extend(ledger.track("select name from tables", iter([("t",)]))))
+    reader.start()
+    reader.join(5)
+    assert tables == [("t",)]
+    assert list(schemas) == [("b",)]
+    assert ledger.statement_count == 2
+    THROTTLE.configure()
+
+def test_python_rows_streamed_without_throttling(load_connector):
+    query_ledger = load_connector("postgresql-connector")("src.common.query_ledger")
+    ledger = query_ledger.QueryLedger()
+    fetched = []
+
+    def fetch():
+        for row in [("a",), ("b",)]:
+            fetched.append(row)
+            yield row
+
+    rows = ledger.track("select name from schemas", fetch())
+    # Only the rows passed on so far are fetched
+    assert next(rows) == ("a",)
+    assert fetched == [("a",)]
+    assert ledger.statement_count == 0
+    assert list(rows) == [("b",)]
+    assert ledger.statement_count == 1
@@ -0,0 +1,70 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests of sharded output written by the Spark executors."""
+import threading
+import pytest
+
+# Longest time a sharded run of the test catalog is waited for
+RUN_SECONDS = 120
+
+class MaterializedSource:
+    """Source serving a synthetic catalog, whose query results are persisted through the ledger
+    as by the Spark connectors. With bulk False, datasets are only read per schema"""
+
+    def __init__(self, spark, catalog, ledger, bulk: bool):
+        self._spark = spark
+        self._catalog = catalog
+        self._ledger = ledger
+        self._bulk = bulk
+
+    def get_db_schemas(self):
+        return self._ledger.materialize("select schemas", self._catalog.schemas_df(self._spark))
+
+    def get_all_datasets(self):
+        if not self._bulk:
+            return None
+        return self._ledger.materialize("select all datasets", self._catalog.catalog_df(self._spark))
+
+    def get_schema_datasets(self, schema_name: str):
+        df = self._catalog.catalog_df(self._spark).filter(f"SCHEMA_NAME = '{schema_name}'").drop("SCHEMA_NAME")
+        return self._ledger.materialize(f"select datasets of {schema_name}", df)
+
+@pytest.mark.parametrize("bulk", [True, False])
+def test_sharded_output_with_throttling(load_connector, config, spark, tmp_path, bulk):
+    load = load_connector("postgresql-connector")
+    bootstrap = load("src.common.bootstrap")
+    SyntheticCatalog = load("src.common.synthetic_catalog").SyntheticCatalog
+    THROTTLE = load("src.common.query_throttle").THROTTLE
+    LEDGER = load("src.common.query_ledger").LEDGER
+    config.update(incremental=False, shard_compression="none", shard_max_entries=1000, shard_max_mb=None)
+    catalog = SyntheticCatalog(3, 2, 1, 2)
+    source = MaterializedSource(spark, catalog, LEDGER, bulk)
+
+    # A single query at a time, while several dataframes are read from the source before any is written
+    THROTTLE.configure(max_concurrency=1, max_queries_per_second=1000)
+    result = []
+    run = threading.Thread(target=lambda: result.append(bootstrap.write_entries_sharded(
+        source, config, str(tmp_path / "staging"), "entries", bootstrap.EntryState())), daemon=True)
+    run.start()
+    run.join(RUN_SECONDS)
+    THROTTLE.configure()
+
+    assert result, "sharded run did not finish"
+    manifest, db_objects_count = result[0]
+    assert db_objects_count == catalog.schemas * catalog.objects_per_schema
+    # Top level entries, schemas, tables and views
+    assert manifest['entries'] == 2 + catalog.schemas + db_objects_count
+    assert LEDGER.statement_count == (2 if bulk else 1 + catalog.schemas)
@@ -0,0 +1,33 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests of the settings of the Spark session."""
+import os
+import pytest
+
+def test_pool_allocation_written_once_and_removed(load_connector):
+    pytest.importorskip("pyspark")
+    spark_session = load_connector("postgresql-connector")("src.common.spark_session")
+
+    path = spark_session._write_pool_allocation(4)
+    # Connectors of later databases reuse the file
+    assert spark_session._write_pool_allocation(4) == path
+    with open(path, encoding="utf-8") as file:
+        assert file.read().count("<pool ") == 4
+    other = spark_session._write_pool_allocation(2)
+    assert other != path
+
+    spark_session._remove_pool_allocations()
+    assert not os.path.exists(path) and not os.path.exists(other)
@@ -0,0 +1,92 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Runs the metadata queries of each connector against its SQLite stand-in, and compares the entries
+built from them by the python engine, reading each schema and object type, with those built by Spark
+from the single query for all schemas and from the query for each schema."""
+import pytest
+from typing import List
+from typing import Tuple
+
+@pytest.fixture
+def stand_in(open_stand_in):
+    """Stand-in of the connector populated with a synthetic catalog."""
+    return open_stand_in()
+
+def _as_read(rows) -> List[Tuple]:
+    # Bit columns (SQL Server is_nullable) are read as booleans by pyodbc and JDBC, and as integers from SQLite
+    return [row[:-1] + (bool(row[-1]),) if isinstance(row[-1], int) else tuple(row) for row in rows]
+
+def _df(spark, rows: List[Tuple], columns: List[str]):
+    nullable_type = "boolean" if rows and isinstance(rows[0][-1], bool) else "string"
+    return spark.createDataFrame(rows, ", ".join(f"{column} string" for column in columns[:-1])
+                                 + f", {columns[-1]} {nullable_type}")
+
+def _collect(df) -> List[Tuple[str, str, str]]:
+    return [tuple(row) for row in df.collect()]
+
+def test_engines_build_equal_entries(connector, config, stand_in, spark):
+    constants = connector("src.constants")
+    stand_in_module = connector("src.common.stand_in")
+    python_entry_builder = connector("src.common.python_entry_builder")
+    entry_builder = connector("src.common.entry_builder")
+    import pyspark.sql.functions as F
+
+    schemas = [row[0] for row in stand_in.get_db_schemas()]
+    assert schemas
+
+    # The python engine reads each schema and object type with a query of its own
+    python_entries = list(python_entry_builder.build_schemas(config, schemas))
+    for schema in schemas:
+        for entry_type in constants.DB_OBJECT_TYPES_TO_PROCESS:
+            rows = _as_read(stand_in.get_dataset(schema, entry_type))
+            python_entries.extend(python_entry_builder.build_dataset(config, rows, schema, entry_type))
+
+    # Spark reads tables and views of all schemas with a single query
+    df_schemas = spark.createDataFrame([(schema,) for schema in schemas], "SCHEMA_NAME string")
+    catalog_entries = _collect(entry_builder.to_hashed_json(entry_builder.build_schemas(config, df_schemas)))
+    schema_entries = list(catalog_entries)
+    df_catalog = _df(spark, _as_read(stand_in.get_all_datasets()), stand_in_module.ALL_DATASET_COLUMNS)
+    for entry_type in constants.DB_OBJECT_TYPES_TO_PROCESS:
+        df_raw = df_catalog.filter(F.col("OBJECT_TYPE") == entry_type.name).drop("OBJECT_TYPE")
+        df = entry_builder.to_hashed_json(entry_builder.build_dataset(config, df_raw, None, entry_type), "SCHEMA_NAME")
+        # Objects of schemas which are not extracted, eg. other MySQL databases, are left out
+        catalog_entries.extend(tuple(row[1:]) for row in df.collect() if row[0] in schemas)
+
+    # or with a query for each schema, where the catalog is not read at once
+    for schema in schemas:
+        df_schema = _df(spark, _as_read(stand_in.get_schema_datasets(schema)), stand_in_module.SCHEMA_DATASET_COLUMNS)
+        for entry_type in constants.DB_OBJECT_TYPES_TO_PROCESS:
+            df_raw = df_schema.filter(F.col("OBJECT_TYPE") == entry_type.name).drop("OBJECT_TYPE")
+            schema_entries.extend(_collect(entry_builder.to_hashed_json(
+                entry_builder.build_dataset(config, df_raw, schema, entry_type))))
+
+    assert sorted(catalog_entries) == sorted(python_entries)
+    assert sorted(schema_entries) == sorted(python_entries)
+    # Every third column of the synthetic catalog is required
+    entries_json = "".join(json_string for _, _, json_string in python_entries)
+    assert '"mode":"NULLABLE"' in entries_json and '"mode":"REQUIRED"' in entries_json
+
+def test_stand_in_queries_return_connector_columns(connector, stand_in):
+    stand_in_module = connector("src.common.stand_in")
+    EntryType = connector("src.constants").EntryType
+    schema = next(iter(stand_in.get_db_schemas()))[0]
+
+    for query, columns in [(lambda: stand_in.get_db_schemas(), stand_in_module.SCHEMA_COLUMNS),
+                           (lambda: stand_in.get_dataset(schema, EntryType.TABLE), stand_in_module.DATASET_COLUMNS),
+                           (lambda: stand_in.get_schema_datasets(schema), stand_in_module.SCHEMA_DATASET_COLUMNS),
+                           (lambda: stand_in.get_all_datasets(), stand_in_module.ALL_DATASET_COLUMNS)]:
+        assert list(query())
+        assert stand_in.columns == columns
@@ -0,0 +1,44 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests of the synthetic catalogs served by the fake connector."""
+
+def test_schema_entries_have_unique_names(connector, config):
+    SyntheticCatalog = connector("src.common.synthetic_catalog").SyntheticCatalog
+    python_entry_builder = connector("src.common.python_entry_builder")
+    config['synthetic_shape'] = (3, 2, 1, 2)
+
+    catalog = SyntheticCatalog.from_config(config)
+    names = [name for name, _, _ in python_entry_builder.build_schemas(config, catalog.schema_names())]
+
+    assert len(names) == catalog.schemas
+    assert len(set(names)) == len(names)
+
+def test_mysql_catalog_is_the_database(load_connector, config):
+    SyntheticCatalog = load_connector("mysql-connector")("src.common.synthetic_catalog").SyntheticCatalog
+    config['synthetic_shape'] = (3, 2, 1, 2)
+
+    catalog = SyntheticCatalog.from_config(config)
+
+    assert catalog.schema_names() == [config['database']]
+    assert {row[0] for row in catalog.rows()} == {config['database']}
+    assert catalog.entries == 1 + 3
+
+def test_catalog_dataframe_matches_rows(connector, config, spark):
+    SyntheticCatalog = connector("src.common.synthetic_catalog").SyntheticCatalog
+    config['synthetic_shape'] = (2, 2, 1, 3)
+    catalog = SyntheticCatalog.from_config(config)
+
+    assert sorted(tuple(row) for row in catalog.catalog_df(spark).collect()) == sorted(catalog.rows())